@@ -0,0 +1,7 @@
+import os
+import sys
+
+# 벤치마크는 src 모듈을 스크립트와 같은 방식(utils.x, agents.x)으로 가져옵니다.
+_SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+if _SRC_DIR not in sys.path:
+    sys.path.append(_SRC_DIR)
@@ -0,0 +1,196 @@
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from langchain.schema import AIMessage, BaseMessage
+
+from utils.cuisine_rules import classify_by_rules
+from utils.ingredient_dictionary import DEFAULT_ALIASES, NORMALIZATION_STAGE, STRICT_NORMALIZATION_STAGE
+from utils.transcript_chunker import estimate_tokens
+from utils.transcript_filter import FOOD_TERMS
+
+
+def prompt_key(prompt: str) -> str:
+    """
+    녹화된 응답을 찾을 때 사용하는 프롬프트 해시입니다.
+    """
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def _prompt_text(messages: List[BaseMessage]) -> str:
+    return "".join(str(message.content) for message in messages)
+
+
+def _section(prompt: str, start: str, end: str) -> str:
+    match = re.search(re.escape(start) + r"(.*?)" + re.escape(end), prompt, re.S)
+    return match.group(1) if match else ""
+
+
+def _listed_ingredients(prompt: str) -> List[str]:
+    section = _section(prompt, "재료 목록:", "정규화 지침:")
+    return [line.strip()[2:].strip() for line in section.splitlines() if line.strip().startswith("- ")]
+
+
+def _joined_ingredients(text: str) -> List[str]:
+    return [name.strip() for name in text.split(",") if name.strip()]
+
+
+def _mentioned_foods(text: str) -> List[str]:
+    # 긴 이름을 먼저 찾아 '돼지고기' 안의 '고기' 같은 부분 일치를 중복으로 세지 않습니다.
+    found: List[str] = []
+    for term in sorted(FOOD_TERMS, key=len, reverse=True):
+        if term in text and not any(term in longer for longer in found):
+            found.append(term)
+    return sorted(found, key=text.find)
+
+
+def _normalize(stage: str, ingredients: List[str]) -> Dict[str, Any]:
+    aliases = DEFAULT_ALIASES[stage]
+    mapping = {name: aliases.get(name.replace(" ", ""), name) for name in ingredients}
+    normalized = list(dict.fromkeys(mapping.values()))
+    return {"normalized_ingredients": normalized, "mapping": mapping}
+
+
+def synthetic_response(prompt: str) -> str:
+    """
+    프롬프트 종류를 보고 파서가 받아들이는 형식의 결정적인 응답을 만듭니다.
+    재료는 식재료 사전에 있는 이름을, 장르는 규칙 기반 분류를 사용합니다.
+    """
+    if "한 번에 수행해주세요" in prompt:
+        transcript = _section(prompt, "자막 내용:", "1. 재료 추출")
+        raw = _mentioned_foods(transcript)
+        normalized = _normalize(NORMALIZATION_STAGE, raw)["normalized_ingredients"]
+        final = _normalize(STRICT_NORMALIZATION_STAGE, normalized)["normalized_ingredients"]
+        cuisine = classify_by_rules(final, _section(prompt, "영상 제목:", "자막 내용:").strip())
+        return json.dumps({
+            "raw_ingredients": raw,
+            "normalized_ingredients": normalized,
+            "final_ingredients": final,
+            "cuisine_type": cuisine.cuisine_type.value,
+            "confidence": cuisine.confidence,
+            "reasoning": cuisine.reasoning,
+        }, ensure_ascii=False)
+
+    if "재료들을 추출해주세요" in prompt:
+        transcript = _section(prompt, "자막 내용:", "지침:")
+        return json.dumps({"ingredients": _mentioned_foods(transcript)}, ensure_ascii=False)
+
+    if "더 엄격하게 정규화" in prompt:
+        return json.dumps(_normalize(STRICT_NORMALIZATION_STAGE, _listed_ingredients(prompt)), ensure_ascii=False)
+
+    if "정규화해주세요" in prompt:
+        return json.dumps(_normalize(NORMALIZATION_STAGE, _listed_ingredients(prompt)), ensure_ascii=False)
+
+    if "다시 한번 검증" in prompt:
+        cuisine_type = _section(prompt, "- 분류:", "\n").strip() or "기타"
+        confidence = float(_section(prompt, "- 신뢰도:", "\n").strip() or 0.5)
+        return json.dumps({
+            "cuisine_type": cuisine_type,
+            "confidence": round(min(confidence, 0.85), 2),
+            "reasoning": "재료 구성이 1차 분류와 일치합니다.",
+        }, ensure_ascii=False)
+
+    if "장르를 분류해주세요" in prompt:
+        ingredients = _joined_ingredients(_section(prompt, "추출된 재료:", "영상 제목:"))
+        cuisine = classify_by_rules(ingredients, _section(prompt, "영상 제목:", "분류 지침:").strip())
+        return json.dumps({
+            "cuisine_type": cuisine.cuisine_type.value,
+            "confidence": max(cuisine.confidence, 0.6),
+            "reasoning": cuisine.reasoning,
+        }, ensure_ascii=False)
+
+    raise ValueError("알 수 없는 프롬프트입니다.")
+
+
+class FakeChatModel:
+    """
+    네트워크 없이 IngredientExtractorAgent를 실행하기 위한 채팅 모델입니다.
+
+    recorded에 프롬프트 해시별 응답이 있으면 그대로 재생하고, 없으면 synthetic_response로 만듭니다.
+    latency초만큼 응답을 지연시키며, 토큰 사용량(usage_metadata)은 estimate_tokens로 계산합니다.
+    """
+
+    def __init__(self, recorded: Optional[Dict[str, str]] = None, latency: float = 0.0,
+                 model_name: str = "gpt-4o-mini"):
+        self.recorded = recorded or {}
+        self.latency = latency
+        self.model_name = model_name
+        self._lock = threading.Lock()
+        self.replayed = 0
+        self.synthesized = 0
+
+    def _respond(self, messages: List[BaseMessage]) -> AIMessage:
+        prompt = _prompt_text(messages)
+        content = self.recorded.get(prompt_key(prompt))
+        with self._lock:
+            if content is None:
+                self.synthesized += 1
+            else:
+                self.replayed += 1
+        if content is None:
+            content = synthetic_response(prompt)
+
+        input_tokens = estimate_tokens(prompt, self.model_name)
+        output_tokens = estimate_tokens(content, self.model_name)
+        return AIMessage(
+            content=content,
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+            }
+        )
+
+    def invoke(self, messages: List[BaseMessage]) -> AIMessage:
+        if self.latency:
+            time.sleep(self.latency)
+        return self._respond(messages)
+
+    async def ainvoke(self, messages: List[BaseMessage]) -> AIMessage:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._respond(messages)
+
+
+class RecordingChatModel:
+    """
+    실제 모델의 응답을 프롬프트 해시별로 모아 두었다가 save()로 JSON 파일에 저장합니다.
+    저장한 파일은 FakeChatModel(recorded=...)로 재생합니다.
+    """
+
+    def __init__(self, llm: Any):
+        self.llm = llm
+        self._lock = threading.Lock()
+        self.responses: Dict[str, str] = {}
+
+    def _remember(self, messages: List[BaseMessage], response: Any) -> Any:
+        with self._lock:
+            self.responses[prompt_key(_prompt_text(messages))] = response.content
+        return response
+
+    def invoke(self, messages: List[BaseMessage]) -> Any:
+        return self._remember(messages, self.llm.invoke(messages))
+
+    async def ainvoke(self, messages: List[BaseMessage]) -> Any:
+        return self._remember(messages, await self.llm.ainvoke(messages))
+
+    def save(self, path: str) -> None:
+        existing = load_recorded_responses(path)
+        existing.update(self.responses)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(existing, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def load_recorded_responses(path: Optional[str]) -> Dict[str, str]:
+    """
+    녹화된 응답 파일을 읽습니다. 파일이 없으면 빈 딕셔너리를 반환합니다.
+    """
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+부하 테스트용 가짜 OpenAI Chat Completions 서버
+
+OpenAI 대신 요청을 받아 IngredientList, IngredientNormalizer, CuisineClassifier(와 RecipeAnalysis)
+형식에 맞는 JSON을 돌려줍니다. 응답 지연 분포와 429/5xx 오류 비율을 설정할 수 있어
+토큰 비용 없이 main.py 서버의 처리량과 꼬리 지연을 잴 수 있습니다.
+
+사용법 (foody_recipe_agent 디렉토리에서):
+    python -m benchmarks.fake_openai_server --port 8100 --latency lognormal:0.8,0.5 --rate-limit-rate 0.02
+    OPENAI_BASE_URL=http://localhost:8100/v1 OPENAI_API_KEY=fake python start_api.py
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from .fake_llm import load_recorded_responses, prompt_key, synthetic_response
+from .harness import DEFAULT_RESPONSES
+from utils.transcript_chunker import estimate_tokens
+
+
+class LatencyModel:
+    """
+    응답 지연 분포입니다. spec 형식:
+    - "0.5": 항상 0.5초
+    - "uniform:0.2,1.5": 0.2~1.5초 균등 분포
+    - "lognormal:0.8,0.5": 중앙값 0.8초, 시그마 0.5인 로그정규 분포 (꼬리 지연 재현용)
+    """
+
+    def __init__(self, spec: str = "0", seed: Optional[int] = None):
+        self.spec = spec
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        kind, _, params = spec.partition(":")
+        if not params:
+            kind, params = "fixed", kind
+        try:
+            values = [float(value) for value in params.split(",")]
+        except ValueError:
+            raise ValueError(f"지연 분포 형식이 올바르지 않습니다: {spec}")
+
+        if kind == "fixed" and len(values) == 1:
+            self._sample = lambda: values[0]
+        elif kind == "uniform" and len(values) == 2:
+            self._sample = lambda: self._random.uniform(values[0], values[1])
+        elif kind == "lognormal" and len(values) == 2 and values[0] > 0:
+            self._sample = lambda: self._random.lognormvariate(math.log(values[0]), values[1])
+        else:
+            raise ValueError(f"지연 분포 형식이 올바르지 않습니다: {spec}")
+
+    def sample(self) -> float:
+        with self._lock:
+            return max(0.0, self._sample())
+
+
+def _error(status_code: int, message: str, error_type: str, headers: Optional[Dict[str, str]] = None) -> JSONResponse:
+    return JSONResponse(
+        status_code=status_code,
+        content={"error": {"message": message, "type": error_type, "param": None, "code": None}},
+        headers=headers
+    )
+
+
+def create_app(latency: str = "0", rate_limit_rate: float = 0.0, error_rate: float = 0.0,
+               retry_after: float = 1.0, seed: Optional[int] = None,
+               recorded: Optional[Dict[str, str]] = None) -> FastAPI:
+    """
+    가짜 OpenAI 서버 앱을 만듭니다.
+
+    rate_limit_rate 비율의 요청은 429(Retry-After 포함)로, error_rate 비율의 요청은 500으로 응답합니다.
+    seed를 지정하면 지연과 오류가 실행마다 같은 순서로 발생합니다.
+    """
+    app = FastAPI(title="Fake OpenAI API")
+    latency_model = LatencyModel(latency, seed)
+    outcomes = random.Random(seed)
+    outcome_lock = threading.Lock()
+    recorded = recorded or {}
+    stats = {"requests": 0, "rate_limited": 0, "errors": 0, "replayed": 0, "synthesized": 0,
+             "prompt_tokens": 0, "completion_tokens": 0}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        model = body.get("model", "gpt-4o-mini")
+        prompt = "".join(str(message.get("content") or "") for message in body.get("messages", []))
+
+        with outcome_lock:
+            stats["requests"] += 1
+            roll = outcomes.random()
+        await asyncio.sleep(latency_model.sample())
+
+        if roll < rate_limit_rate:
+            stats["rate_limited"] += 1
+            return _error(429, "Rate limit reached (fake server).", "requests",
+                          headers={"retry-after": str(retry_after)})
+        if roll < rate_limit_rate + error_rate:
+            stats["errors"] += 1
+            return _error(500, "The server had an error processing your request (fake server).", "server_error")
+
+        content = recorded.get(prompt_key(prompt))
+        if content is None:
+            try:
+                content = synthetic_response(prompt)
+            except ValueError as e:
+                return _error(400, str(e), "invalid_request_error")
+            stats["synthesized"] += 1
+        else:
+            stats["replayed"] += 1
+
+        prompt_tokens = estimate_tokens(prompt, model)
+        completion_tokens = estimate_tokens(content, model)
+        stats["prompt_tokens"] += prompt_tokens
+        stats["completion_tokens"] += completion_tokens
+        return {
+            "id": f"chatcmpl-fake-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "logprobs": None,
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    @app.get("/stats")
+    async def get_stats() -> Dict[str, Any]:
+        return {"latency": latency_model.spec, "rate_limit_rate": rate_limit_rate, "error_rate": error_rate, **stats}
+
+    return app
+
+
+def main(argv=None) -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="부하 테스트용 가짜 OpenAI 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency", default="lognormal:0.8,0.5", help="응답 지연 분포 (예: 0.5, uniform:0.2,1.5)")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429로 응답할 요청 비율")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500으로 응답할 요청 비율")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="429 응답의 Retry-After (초)")
+    parser.add_argument("--seed", type=int, help="지연/오류 난수 시드")
+    parser.add_argument("--responses", default=DEFAULT_RESPONSES, help="녹화된 LLM 응답 파일")
+    args = parser.parse_args(argv)
+
+    app = create_app(
+        latency=args.latency,
+        rate_limit_rate=args.rate_limit_rate,
+        error_rate=args.error_rate,
+        retry_after=args.retry_after,
+        seed=args.seed,
+        recorded=load_recorded_responses(args.responses)
+    )
+    print(f"🧪 가짜 OpenAI 서버: http://{args.host}:{args.port}/v1 (지연 {args.latency})")
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+처리량 테스트용 가짜 YouTube 서버
+
+픽스처 디렉토리의 영상으로 oEmbed JSON, 자막 목록(watch 페이지 + innertube player), 자막(timedtext)을 제공합니다.
+응답 지연 분포와 IP 차단(429) 응답을 흉내 낼 수 있어 재시도/백오프, 서킷 브레이커, 캐시 동작을
+실제 YouTube 없이 같은 조건으로 반복해서 잴 수 있습니다.
+
+사용법 (foody_recipe_agent 디렉토리에서):
+    python -m benchmarks.fake_youtube_server --port 8200 --latency uniform:0.05,0.3 --block-after 50
+    YOUTUBE_BASE_URL=http://localhost:8200 python start_api.py
+
+픽스처 파일은 {"videos": [...]} 또는 영상 하나의 JSON이며, 영상은 video_id, title, author_name과
+segments(한국어 자막) 또는 transcripts({언어 코드: segments})를 가집니다.
+"""
+
+import argparse
+import asyncio
+import glob
+import json
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape, quoteattr
+
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, Response
+
+from .fake_openai_server import LatencyModel
+from .harness import FIXTURES_DIR
+
+
+FAKE_API_KEY = "fake-innertube-key"
+LANGUAGE_NAMES = {"ko": "한국어", "en": "English", "ja": "日本語"}
+
+
+def load_videos(fixture_dir: str = FIXTURES_DIR) -> Dict[str, Dict[str, Any]]:
+    """
+    픽스처 디렉토리의 JSON 파일에서 영상을 읽습니다. 영상 형식이 아닌 파일은 건너뜁니다.
+    """
+    videos: Dict[str, Dict[str, Any]] = {}
+    for path in sorted(glob.glob(os.path.join(fixture_dir, "*.json"))):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        entries = data.get("videos", [data]) if isinstance(data, dict) else []
+        for video in entries:
+            if isinstance(video, dict) and "video_id" in video:
+                transcripts = video.get("transcripts") or ({"ko": video["segments"]} if video.get("segments") else {})
+                videos[video["video_id"]] = {**video, "transcripts": transcripts}
+    return videos
+
+
+def _caption_tracks(video_id: str, video: Dict[str, Any]) -> Dict[str, Any]:
+    tracks = [
+        {
+            "baseUrl": f"https://www.youtube.com/api/timedtext?v={video_id}&lang={language}",
+            "name": {"runs": [{"text": LANGUAGE_NAMES.get(language, language)}]},
+            "languageCode": language,
+            "isTranslatable": False,
+        }
+        for language in video["transcripts"]
+    ]
+    return {"playerCaptionsTracklistRenderer": {"captionTracks": tracks, "translationLanguages": []}}
+
+
+def _timedtext_xml(segments: List[Dict[str, Any]]) -> str:
+    lines = [
+        f"<text start={quoteattr(str(segment['start']))} dur={quoteattr(str(segment.get('duration', 0)))}>"
+        f"{escape(segment['text'])}</text>"
+        for segment in segments
+    ]
+    return '<?xml version="1.0" encoding="utf-8" ?><transcript>' + "".join(lines) + "</transcript>"
+
+
+class BlockSimulator:
+    """
+    IP 차단을 흉내 냅니다.
+
+    block_rate 비율의 요청을 무작위로 막고, block_after개 요청마다 block_duration초 동안 모든 요청을 막습니다.
+    block(seconds)로 원하는 시점에 막을 수도 있습니다.
+    """
+
+    def __init__(self, block_rate: float = 0.0, block_after: int = 0, block_duration: float = 60.0,
+                 seed: Optional[int] = None):
+        self.block_rate = block_rate
+        self.block_after = block_after
+        self.block_duration = block_duration
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._since_block = 0
+        self._blocked_until = 0.0
+
+    def block(self, seconds: float) -> None:
+        with self._lock:
+            self._blocked_until = time.monotonic() + seconds
+            self._since_block = 0
+
+    def check(self) -> bool:
+        """
+        이번 요청을 막아야 하면 True를 반환합니다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                return True
+            self._since_block += 1
+            if self.block_after and self._since_block > self.block_after:
+                self._blocked_until = now + self.block_duration
+                self._since_block = 0
+                return True
+            return self._random.random() < self.block_rate
+
+    @property
+    def retry_after(self) -> float:
+        with self._lock:
+            return max(0.0, self._blocked_until - time.monotonic())
+
+
+def create_app(fixture_dir: str = FIXTURES_DIR, latency: str = "0", block_rate: float = 0.0,
+               block_after: int = 0, block_duration: float = 60.0, seed: Optional[int] = None) -> FastAPI:
+    """
+    가짜 YouTube 서버 앱을 만듭니다.
+    """
+    app = FastAPI(title="Fake YouTube")
+    videos = load_videos(fixture_dir)
+    latency_model = LatencyModel(latency, seed)
+    blocker = BlockSimulator(block_rate, block_after, block_duration, seed)
+    stats = {"watch": 0, "player": 0, "timedtext": 0, "oembed": 0, "blocked": 0, "not_found": 0}
+
+    async def prepare(endpoint: str) -> Optional[Response]:
+        """
+        요청을 세고 지연시킨 뒤, 차단할 요청이면 429 응답을 반환합니다.
+        """
+        stats[endpoint] += 1
+        await asyncio.sleep(latency_model.sample())
+        if blocker.check():
+            stats["blocked"] += 1
+            headers = {"Retry-After": str(round(blocker.retry_after))} if blocker.retry_after else None
+            return Response("Too Many Requests", status_code=429, headers=headers)
+        return None
+
+    @app.get("/watch", response_class=HTMLResponse)
+    async def watch(v: str):
+        blocked = await prepare("watch")
+        if blocked:
+            return blocked
+        video = videos.get(v)
+        captions = json.dumps(_caption_tracks(v, video) if video and video["transcripts"] else {}, ensure_ascii=False)
+        # 1.x는 INNERTUBE_API_KEY로 player API를 호출하고, 0.6.x는 페이지 안의 captions JSON을 읽습니다.
+        return (
+            f'<html><head><title>{escape(video["title"]) if video else ""}</title></head><body><script>'
+            f'ytcfg.set({{"INNERTUBE_API_KEY": "{FAKE_API_KEY}"}});'
+            f'var ytInitialPlayerResponse = {{"captions": {captions},"videoDetails": {{"videoId": "{v}"}}}};'
+            f'</script></body></html>'
+        )
+
+    @app.post("/youtubei/v1/player")
+    async def player(request: Request):
+        blocked = await prepare("player")
+        if blocked:
+            return blocked
+        video_id = (await request.json()).get("videoId")
+        video = videos.get(video_id)
+        if video is None:
+            stats["not_found"] += 1
+            return {"playabilityStatus": {"status": "ERROR", "reason": "This video is unavailable"}}
+        data: Dict[str, Any] = {"playabilityStatus": {"status": "OK"}, "videoDetails": {"videoId": video_id}}
+        if video["transcripts"]:
+            data["captions"] = _caption_tracks(video_id, video)
+        return data
+
+    @app.get("/api/timedtext")
+    async def timedtext(v: str, lang: str):
+        blocked = await prepare("timedtext")
+        if blocked:
+            return blocked
+        segments = videos.get(v, {}).get("transcripts", {}).get(lang)
+        if segments is None:
+            stats["not_found"] += 1
+            return Response("", status_code=404)
+        return Response(_timedtext_xml(segments), media_type="text/xml; charset=UTF-8")
+
+    @app.get("/oembed")
+    async def oembed(url: str, format: str = "json"):
+        blocked = await prepare("oembed")
+        if blocked:
+            return blocked
+        video_id = (parse_qs(urlparse(url).query).get("v") or [url.rstrip("/").rsplit("/", 1)[-1]])[0]
+        video = videos.get(video_id)
+        if video is None:
+            stats["not_found"] += 1
+            return Response("Not Found", status_code=404)
+        return {
+            "title": video["title"],
+            "author_name": video.get("author_name"),
+            "author_url": video.get("author_url", f"https://www.youtube.com/@{video.get('author_name', '')}"),
+            "type": "video",
+            "height": 113,
+            "width": 200,
+            "version": "1.0",
+            "provider_name": "YouTube",
+            "provider_url": "https://www.youtube.com/",
+            "thumbnail_height": 360,
+            "thumbnail_width": 480,
+            "thumbnail_url": f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg",
+        }
+
+    @app.post("/_fake/block")
+    async def block(seconds: float = 60.0):
+        """
+        지금부터 seconds초 동안 모든 요청을 막습니다. (0이면 차단 해제)
+        """
+        blocker.block(seconds)
+        return {"blocked_for": seconds}
+
+    @app.get("/_fake/stats")
+    async def get_stats() -> Dict[str, Any]:
+        return {"videos": len(videos), "latency": latency_model.spec,
+                "retry_after": round(blocker.retry_after, 1), **stats}
+
+    return app
+
+
+def main(argv=None) -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="처리량 테스트용 가짜 YouTube 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8200)
+    parser.add_argument("--fixtures", default=FIXTURES_DIR, help="영상 픽스처 디렉토리")
+    parser.add_argument("--latency", default="0.1", help="응답 지연 분포 (예: 0.1, uniform:0.05,0.3, lognormal:0.1,0.5)")
+    parser.add_argument("--block-rate", type=float, default=0.0, help="무작위로 429를 반환할 요청 비율")
+    parser.add_argument("--block-after", type=int, default=0, help="이 수만큼 요청을 받을 때마다 차단 (0이면 사용 안 함)")
+    parser.add_argument("--block-duration", type=float, default=60.0, help="차단 지속 시간 (초)")
+    parser.add_argument("--seed", type=int, help="지연/차단 난수 시드")
+    args = parser.parse_args(argv)
+
+    app = create_app(
+        fixture_dir=args.fixtures,
+        latency=args.latency,
+        block_rate=args.block_rate,
+        block_after=args.block_after,
+        block_duration=args.block_duration,
+        seed=args.seed
+    )
+    print(f"🧪 가짜 YouTube 서버: http://{args.host}:{args.port} (지연 {args.latency})")
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+from agents.ingredient_extractor import IngredientExtractorAgent
+from clients.llm_gateway import LLMGateway
+from models.recipe import VideoMetadata
+from utils.pipeline import PipelineReport
+from utils.transcript_chunker import _get_encoding
+from utils.youtube_transcript import YouTubeTranscriptExtractor
+
+from .fake_llm import FakeChatModel, RecordingChatModel
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+DEFAULT_FIXTURES = os.path.join(FIXTURES_DIR, "videos.json")
+DEFAULT_RESPONSES = os.path.join(FIXTURES_DIR, "llm_responses.json")
+
+# 리포트 형식이 바뀌면 올립니다. (compare_reports는 같은 버전끼리만 비교)
+REPORT_VERSION = 1
+
+
+def load_fixtures(path: str = DEFAULT_FIXTURES) -> List[Dict[str, Any]]:
+    """
+    녹화된 영상 메타데이터와 자막 세그먼트를 읽습니다.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["videos"]
+
+
+def fixture_url(video: Dict[str, Any]) -> str:
+    return f"https://www.youtube.com/watch?v={video['video_id']}"
+
+
+class FixtureAgent(IngredientExtractorAgent):
+    """
+    YouTube 대신 녹화된 픽스처에서 메타데이터와 자막을 읽는 에이전트입니다.
+    youtube_latency초만큼 응답을 지연시켜 네트워크 요청을 흉내 냅니다.
+    """
+
+    def __init__(self, fixtures: List[Dict[str, Any]], youtube_latency: float = 0.0, **kwargs):
+        super().__init__(**kwargs)
+        self.fixtures = {video["video_id"]: video for video in fixtures}
+        self.youtube_latency = youtube_latency
+
+    def _fixture(self, youtube_url: str) -> Dict[str, Any]:
+        video_id = YouTubeTranscriptExtractor.extract_video_id(youtube_url)
+        if video_id not in self.fixtures:
+            raise Exception(f"픽스처에 없는 영상입니다: {youtube_url}")
+        return self.fixtures[video_id]
+
+    def _metadata(self, youtube_url: str) -> VideoMetadata:
+        video = self._fixture(youtube_url)
+        return VideoMetadata(title=video["title"], author_name=video.get("author_name"), video_id=video["video_id"])
+
+    def _fetch_metadata(self, youtube_url: str) -> Optional[VideoMetadata]:
+        time.sleep(self.youtube_latency)
+        return self._metadata(youtube_url)
+
+    async def _afetch_metadata(self, youtube_url: str) -> Optional[VideoMetadata]:
+        await asyncio.sleep(self.youtube_latency)
+        return self._metadata(youtube_url)
+
+    def _fetch_segments(self, youtube_url: str) -> List[Dict[str, Any]]:
+        time.sleep(self.youtube_latency)
+        return self._fixture(youtube_url)["segments"]
+
+    async def _afetch_segments(self, youtube_url: str) -> List[Dict[str, Any]]:
+        await asyncio.sleep(self.youtube_latency)
+        return self._fixture(youtube_url)["segments"]
+
+
+def build_agent(fixtures: List[Dict[str, Any]], llm: Any, pipeline_mode: Optional[str] = None,
+                youtube_latency: float = 0.0, llm_concurrency: int = 8, **agent_options) -> FixtureAgent:
+    """
+    벤치마크용 에이전트를 만듭니다.
+    LLM 캐시와 레시피 저장소는 끄고, 분당 한도 없이 동시 호출 수만 제한하는 관문을 사용합니다.
+    """
+    gateway = LLMGateway(requests_per_minute=0, tokens_per_minute=0, max_concurrency=llm_concurrency, max_retries=0)
+    return FixtureAgent(
+        fixtures,
+        youtube_latency=youtube_latency,
+        pipeline_mode=pipeline_mode,
+        llm_cache=None,
+        recipe_store=None,
+        llm_gateway=gateway,
+        llm=llm,
+        **agent_options
+    )
+
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _distribution(values: Sequence[float]) -> Dict[str, float]:
+    if not values:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+    return {
+        "mean": round(sum(values) / len(values), 4),
+        "p50": round(_percentile(values, 0.5), 4),
+        "p95": round(_percentile(values, 0.95), 4),
+        "max": round(max(values), 4),
+    }
+
+
+def summarize_reports(reports: List[PipelineReport]) -> Dict[str, Any]:
+    """
+    여러 파이프라인 리포트의 전체/단계별 소요 시간 분포와 LLM 사용량을 요약합니다.
+    """
+    stage_names: List[str] = []
+    for report in reports:
+        for stage in report.stages:
+            if stage.name not in stage_names:
+                stage_names.append(stage.name)
+
+    stages = {}
+    for name in stage_names:
+        timings = [stage for report in reports for stage in report.stages if stage.name == name]
+        stages[name] = {
+            **_distribution([stage.duration for stage in timings]),
+            "llm_calls": sum(stage.llm_calls for stage in timings),
+            "prompt_tokens": sum(stage.prompt_tokens for stage in timings),
+            "completion_tokens": sum(stage.completion_tokens for stage in timings),
+        }
+
+    prompt_tokens = sum(stage["prompt_tokens"] for stage in stages.values())
+    completion_tokens = sum(stage["completion_tokens"] for stage in stages.values())
+    return {
+        "latency": _distribution([report.total_duration for report in reports]),
+        "stages": stages,
+        "llm_calls": sum(stage["llm_calls"] for stage in stages.values()),
+        "tokens": {
+            "prompt": prompt_tokens,
+            "completion": completion_tokens,
+            "total": prompt_tokens + completion_tokens,
+            "per_video": round((prompt_tokens + completion_tokens) / len(reports), 1) if reports else 0,
+        },
+    }
+
+
+def _run_all(agent: FixtureAgent, urls: List[str], concurrency: int, use_async: bool) -> List[Any]:
+    """
+    최대 concurrency개 영상을 동시에 처리하고, 영상별 (레시피, 리포트) 또는 예외를 반환합니다.
+    """
+    if use_async:
+        async def run() -> List[Any]:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def one(url: str) -> Any:
+                async with semaphore:
+                    return await agent.arun_pipeline(url)
+
+            return await asyncio.gather(*(one(url) for url in urls), return_exceptions=True)
+
+        return asyncio.run(run())
+
+    def one(url: str) -> Any:
+        try:
+            return agent.run_pipeline(url)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(one, urls))
+
+
+def run_level(fixtures: List[Dict[str, Any]], concurrency: int, rounds: int = 1, use_async: bool = True,
+              measure_memory: bool = True, **agent_options) -> Dict[str, Any]:
+    """
+    동시 처리 수 하나에 대한 측정 결과입니다.
+
+    픽스처 영상을 rounds번 반복해 처리하면서 처리량과 영상별/단계별 소요 시간, 토큰 사용량을 잽니다.
+    tracemalloc은 실행 속도를 떨어뜨리므로, 최대 메모리는 같은 조건으로 한 번 더 실행해 따로 잽니다.
+    """
+    urls = [fixture_url(video) for video in fixtures] * rounds
+    agent = build_agent(fixtures, **agent_options)
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        outcomes = _run_all(agent, urls, concurrency, use_async)
+    wall_seconds = time.perf_counter() - started
+
+    reports = [outcome[1] for outcome in outcomes if not isinstance(outcome, BaseException)]
+    errors = [str(outcome) for outcome in outcomes if isinstance(outcome, BaseException)]
+
+    peak_memory = None
+    if measure_memory:
+        memory_agent = build_agent(fixtures, **agent_options)
+        tracemalloc.start()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                _run_all(memory_agent, urls, concurrency, use_async)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "concurrency": concurrency,
+        "videos": len(urls),
+        "failures": len(errors),
+        "errors": sorted(set(errors))[:5],
+        "wall_seconds": round(wall_seconds, 4),
+        "throughput_videos_per_second": round(len(reports) / wall_seconds, 3) if wall_seconds else 0.0,
+        **summarize_reports(reports),
+        "peak_memory_bytes": peak_memory,
+        "llm_gateway": agent.llm_gateway.stats(),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def run_benchmark(concurrency_levels: Sequence[int] = (1, 4, 8), pipeline_mode: str = "multi_pass",
+                  use_async: bool = True, rounds: int = 1, llm_latency: float = 0.05, youtube_latency: float = 0.02,
+                  llm_concurrency: int = 8, fixtures_path: str = DEFAULT_FIXTURES,
+                  recorded: Optional[Dict[str, str]] = None, measure_memory: bool = True,
+                  model_name: str = "gpt-4o-mini") -> Dict[str, Any]:
+    """
+    녹화된 픽스처와 가짜 LLM으로 추출 파이프라인을 실행하고, 릴리스 간에 비교할 수 있는 리포트를 반환합니다.
+    네트워크에 접근하지 않습니다.
+    """
+    fixtures = load_fixtures(fixtures_path)
+    llm = FakeChatModel(recorded=recorded, latency=llm_latency, model_name=model_name)
+    agent_options = {
+        "llm": llm,
+        "pipeline_mode": pipeline_mode,
+        "youtube_latency": youtube_latency,
+        "llm_concurrency": llm_concurrency,
+        "model_name": model_name,
+    }
+
+    levels = [
+        run_level(fixtures, concurrency, rounds=rounds, use_async=use_async, measure_memory=measure_memory,
+                  **agent_options)
+        for concurrency in concurrency_levels
+    ]
+
+    return {
+        "version": REPORT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "token_counter": "tiktoken" if _get_encoding(model_name) is not None else "heuristic",
+        "config": {
+            "pipeline_mode": pipeline_mode,
+            "async": use_async,
+            "rounds": rounds,
+            "llm_latency": llm_latency,
+            "youtube_latency": youtube_latency,
+            "llm_concurrency": llm_concurrency,
+            "model_name": model_name,
+        },
+        "fixtures": [
+            {
+                "video_id": video["video_id"],
+                "segments": len(video["segments"]),
+                "transcript_chars": len(" ".join(segment["text"] for segment in video["segments"])),
+            }
+            for video in fixtures
+        ],
+        "llm": {"replayed": llm.replayed, "synthesized": llm.synthesized},
+        "levels": levels,
+    }
+
+
+def record_responses(llm: Any, output_path: str = DEFAULT_RESPONSES, fixtures_path: str = DEFAULT_FIXTURES,
+                     pipeline_mode: str = "multi_pass") -> int:
+    """
+    실제 모델로 픽스처 영상을 한 번씩 처리하면서 응답을 녹화하고, 녹화한 응답 수를 반환합니다.
+    """
+    fixtures = load_fixtures(fixtures_path)
+    recorder = RecordingChatModel(llm)
+    agent = build_agent(fixtures, recorder, pipeline_mode=pipeline_mode, llm_concurrency=1)
+    for video in fixtures:
+        agent.run_pipeline(fixture_url(video))
+    recorder.save(output_path)
+    return len(recorder.responses)
+
+
+# 비교할 지표: (이름, 리포트 안의 경로, 값이 클수록 좋은지)
+COMPARED_METRICS = [
+    ("throughput", ("throughput_videos_per_second",), True),
+    ("latency_p50", ("latency", "p50"), False),
+    ("latency_p95", ("latency", "p95"), False),
+    ("llm_calls", ("llm_calls",), False),
+    ("tokens_total", ("tokens", "total"), False),
+    ("peak_memory_bytes", ("peak_memory_bytes",), False),
+]
+
+
+def _lookup(level: Dict[str, Any], path: Sequence[str]) -> Optional[float]:
+    value: Any = level
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def compare_reports(old: Dict[str, Any], new: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    두 리포트에서 같은 동시 처리 수의 지표를 비교합니다.
+    change는 변화율(%)이고, regression은 지표가 나빠졌는지 여부입니다.
+    """
+    if old.get("version") != new.get("version"):
+        raise ValueError(f"리포트 형식이 다릅니다: {old.get('version')} != {new.get('version')}")
+
+    old_levels = {level["concurrency"]: level for level in old["levels"]}
+    rows = []
+    for level in new["levels"]:
+        previous = old_levels.get(level["concurrency"])
+        if previous is None:
+            continue
+
+        metrics = list(COMPARED_METRICS)
+        for stage in level["stages"]:
+            metrics.append((f"stage:{stage}_p50", ("stages", stage, "p50"), False))
+
+        for name, path, higher_is_better in metrics:
+            before, after = _lookup(previous, path), _lookup(level, path)
+            if before is None or after is None:
+                continue
+            if path[0] == "stages" and max(before, after) < 0.001:
+                continue  # 1ms 미만인 단계는 측정 오차가 변화율을 좌우하므로 비교하지 않습니다.
+            change = round((after - before) / before * 100, 1) if before else 0.0
+            rows.append({
+                "concurrency": level["concurrency"],
+                "metric": name,
+                "old": before,
+                "new": after,
+                "change": change,
+                "regression": change < 0 if higher_is_better else change > 0,
+            })
+    return rows
+
+
+def format_comparison(rows: List[Dict[str, Any]], threshold: float = 10.0) -> str:
+    """
+    비교 결과를 표로 출력합니다. threshold(%) 이상 나빠진 지표에 ⚠️를 붙입니다.
+    """
+    lines = [f"{'동시성':>6} {'지표':<36} {'이전':>14} {'현재':>14} {'변화':>8}"]
+    for row in rows:
+        flag = " ⚠️" if row["regression"] and abs(row["change"]) >= threshold else ""
+        lines.append(
+            f"{row['concurrency']:>6} {row['metric']:<36} {row['old']:>14} {row['new']:>14} {row['change']:>7}%{flag}"
+        )
+    return "\n".join(lines)
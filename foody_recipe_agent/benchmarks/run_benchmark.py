@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+추출 파이프라인 오프라인 벤치마크
+
+녹화된 자막 픽스처와 가짜 LLM 응답으로 IngredientExtractorAgent를 실행하여
+단계별 소요 시간, 동시 처리량, 최대 메모리, 토큰 사용량을 JSON 리포트로 남깁니다.
+
+사용법 (foody_recipe_agent 디렉토리에서):
+    python -m benchmarks.run_benchmark --concurrency 1,4,8 --output bench.json
+    python -m benchmarks.run_benchmark --compare bench_old.json --output bench_new.json
+    python -m benchmarks.run_benchmark --record   # 실제 OpenAI 응답 녹화 (OPENAI_API_KEY 필요)
+"""
+
+import argparse
+import json
+import sys
+
+from .fake_llm import load_recorded_responses
+from .harness import (
+    DEFAULT_FIXTURES, DEFAULT_RESPONSES, compare_reports, format_comparison, record_responses, run_benchmark
+)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="추출 파이프라인 오프라인 벤치마크")
+    parser.add_argument("--concurrency", default="1,4,8", help="동시에 처리할 영상 수 목록 (쉼표 구분)")
+    parser.add_argument("--mode", default="multi_pass", help="파이프라인 모드 (multi_pass, single_shot)")
+    parser.add_argument("--sync", action="store_true", help="run_pipeline(스레드)으로 실행 (기본: arun_pipeline)")
+    parser.add_argument("--rounds", type=int, default=1, help="픽스처 영상을 반복 처리할 횟수")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="가짜 LLM 응답 지연 (초)")
+    parser.add_argument("--youtube-latency", type=float, default=0.02, help="메타데이터/자막 응답 지연 (초)")
+    parser.add_argument("--llm-concurrency", type=int, default=8, help="LLMGateway 동시 호출 수")
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES, help="영상 픽스처 파일")
+    parser.add_argument("--responses", default=DEFAULT_RESPONSES, help="녹화된 LLM 응답 파일 (없으면 합성 응답 사용)")
+    parser.add_argument("--no-memory", action="store_true", help="최대 메모리 측정 생략")
+    parser.add_argument("--output", help="JSON 리포트를 저장할 경로 (없으면 표준 출력)")
+    parser.add_argument("--compare", help="비교할 이전 JSON 리포트")
+    parser.add_argument("--record", action="store_true", help="실제 모델 응답을 --responses 파일에 녹화하고 종료")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.record:
+        from langchain_openai import ChatOpenAI
+
+        llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.1, max_retries=3)
+        count = record_responses(llm, args.responses, args.fixtures, args.mode)
+        print(f"🎙️ 응답 {count}개 녹화: {args.responses}", file=sys.stderr)
+        return 0
+
+    levels = [int(level) for level in args.concurrency.split(",") if level.strip()]
+
+    report = run_benchmark(
+        concurrency_levels=levels,
+        pipeline_mode=args.mode,
+        use_async=not args.sync,
+        rounds=args.rounds,
+        llm_latency=args.llm_latency,
+        youtube_latency=args.youtube_latency,
+        llm_concurrency=args.llm_concurrency,
+        fixtures_path=args.fixtures,
+        recorded=load_recorded_responses(args.responses),
+        measure_memory=not args.no_memory
+    )
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(f"📄 리포트 저장: {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+    for level in report["levels"]:
+        print(
+            f"⏱️ 동시성 {level['concurrency']}: {level['throughput_videos_per_second']}개/초, "
+            f"p50 {level['latency']['p50']}s, p95 {level['latency']['p95']}s, "
+            f"토큰 {level['tokens']['total']}, 실패 {level['failures']}",
+            file=sys.stderr
+        )
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+        print(format_comparison(compare_reports(previous, report)), file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
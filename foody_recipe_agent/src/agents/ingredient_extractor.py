@@ -1,19 +1,35 @@
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 from langchain.schema import BaseMessage, HumanMessage
+from langchain_core.language_models import BaseChatModel
 from langchain_openai import ChatOpenAI
 from langchain.prompts import PromptTemplate
 from langchain.output_parsers import PydanticOutputParser
 from pydantic import BaseModel, Field
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import contextvars
 import os
+import threading
 from dotenv import load_dotenv
 
 from models.recipe import Ingredient, Recipe, VideoMetadata, CuisineInfo, CuisineType
 from utils.youtube_transcript import YouTubeTranscriptExtractor
 from utils.youtube_metadata import YouTubeMetadataExtractor
+from utils.pipeline import PipelineExecutor, PipelineReport, PipelineStage, StageCallback, current_stage_usage
+from utils.metrics import PIPELINE_RUNS, observe_pipeline
+from utils.llm_cache import LLMCacheBackend, make_stage_cache_key
+from utils.recipe_store import RecipeStore
+from utils.ingredient_dictionary import IngredientDictionary
+from utils.cuisine_rules import classify_by_rules
+from utils.transcript_filter import TranscriptFilterResult, filter_segments
+from utils.transcript_chunker import estimate_tokens, merge_ingredients, sample_transcript, select_chunks, split_transcript
 from clients.api_client import ApiClient
+from clients.llm_gateway import LLMGateway, current_request_key, token_usage
 
 load_dotenv()
 
+T = TypeVar("T")
+
 
 class IngredientList(BaseModel):
     ingredients: List[str] = Field(description="추출된 재료 목록")
@@ -21,6 +37,7 @@ class IngredientList(BaseModel):
 
 class IngredientNormalizer(BaseModel):
     normalized_ingredients: List[str] = Field(description="정규화된 재료 목록")
+    mapping: Dict[str, str] = Field(default_factory=dict, description="입력 재료명 → 정규화된 재료명 대응표")
 
 
 class CuisineClassifier(BaseModel):
@@ -29,16 +46,111 @@ class CuisineClassifier(BaseModel):
     reasoning: str = Field(description="판단 근거")
 
 
+class RecipeAnalysis(BaseModel):
+    raw_ingredients: List[str] = Field(description="자막에서 추출한 재료 목록 (양/단위 제외)")
+    normalized_ingredients: List[str] = Field(description="오타 수정과 일반화를 거친 1차 정규화 재료 목록")
+    final_ingredients: List[str] = Field(description="가장 기본적인 재료명으로 통합한 최종 재료 목록 (중복 없음)")
+    cuisine_type: str = Field(description="음식 장르 (한식, 중식, 일식, 양식, 이탈리안, 태국식, 베트남식, 인도식, 멕시코식, 퓨전, 베이킹, 디저트, 기타)")
+    confidence: float = Field(description="장르 분류 신뢰도 (0.0-1.0, 보수적으로 평가)")
+    reasoning: str = Field(description="장르 판단 근거")
+
+
+# 파이프라인 실행 방식
+PIPELINE_MODE_MULTI_PASS = "multi_pass"    # 단계별 LLM 호출 5회
+PIPELINE_MODE_SINGLE_SHOT = "single_shot"  # 통합 스키마로 LLM 호출 1회
+PIPELINE_MODES = (PIPELINE_MODE_MULTI_PASS, PIPELINE_MODE_SINGLE_SHOT)
+
+
+def validate_pipeline_mode(mode: str) -> str:
+    if mode not in PIPELINE_MODES:
+        raise ValueError(f"지원하지 않는 파이프라인 모드입니다: {mode} (가능한 값: {', '.join(PIPELINE_MODES)})")
+    return mode
+
+
+def parse_cuisine_types(value: str) -> List[CuisineType]:
+    """
+    쉼표로 구분한 장르 이름("기타,퓨전")을 CuisineType 목록으로 변환합니다.
+    """
+    return [CuisineType(name.strip()) for name in value.split(",") if name.strip()]
+
+
+# 긴 자막 구간 분할 시 앞 구간과 겹치는 토큰 수 (경계에서 재료 언급이 잘리지 않도록)
+CHUNK_OVERLAP_TOKENS = 50
+
+
 class IngredientExtractorAgent:
-    def __init__(self, model_name: str = "gpt-4o-mini"):
-        self.llm = ChatOpenAI(
+    def __init__(self, model_name: str = "gpt-4o-mini", pipeline_mode: Optional[str] = None,
+                 llm_cache: Optional[LLMCacheBackend] = None, recipe_store: Optional[RecipeStore] = None,
+                 chunk_tokens: Optional[int] = None, token_budget: Optional[int] = None,
+                 transcript_filter: Optional[bool] = None, ingredient_dictionary: Optional[IngredientDictionary] = None,
+                 cuisine_rule_threshold: Optional[float] = None, verify_threshold: Optional[float] = None,
+                 verify_types: Optional[List[CuisineType]] = None, llm_gateway: Optional[LLMGateway] = None,
+                 llm: Optional[BaseChatModel] = None, base_url: Optional[str] = None,
+                 api_client: Optional[ApiClient] = None):
+        self.pipeline_mode = validate_pipeline_mode(pipeline_mode or os.getenv("PIPELINE_MODE", PIPELINE_MODE_MULTI_PASS))
+        self.model_name = model_name
+        
+        # 긴 자막 분할 추출 설정 (chunk_tokens가 0이면 분할하지 않음, token_budget이 0이면 예산 제한 없음)
+        self.chunk_tokens = chunk_tokens if chunk_tokens is not None else int(os.getenv("TRANSCRIPT_CHUNK_TOKENS", "3000"))
+        self.token_budget = token_budget if token_budget is not None else int(os.getenv("TRANSCRIPT_TOKEN_BUDGET", "24000"))
+        self.chunk_concurrency = int(os.getenv("TRANSCRIPT_CHUNK_CONCURRENCY", "4"))
+        
+        # 재료 추출 전 재료와 무관한 자막 세그먼트 제거 여부
+        if transcript_filter is None:
+            transcript_filter = os.getenv("TRANSCRIPT_FILTER", "true").lower() == "true"
+        self.transcript_filter = transcript_filter
+        
+        # 규칙 기반 장르 분류 신뢰도가 이 값 이상이면 LLM 분류/검증을 건너뜀 (1보다 크면 항상 LLM 사용)
+        if cuisine_rule_threshold is None:
+            cuisine_rule_threshold = float(os.getenv("CUISINE_RULE_THRESHOLD", "0.7"))
+        self.cuisine_rule_threshold = cuisine_rule_threshold
+        
+        # 장르 2차 검증 조건: 1차 신뢰도가 verify_threshold 미만이거나 verify_types에 속할 때만 검증
+        # (verify_threshold가 1보다 크면 항상 검증, 0이면 verify_types만 검증)
+        if verify_threshold is None:
+            verify_threshold = float(os.getenv("CUISINE_VERIFY_THRESHOLD", "0.8"))
+        if verify_types is None:
+            verify_types = parse_cuisine_types(os.getenv("CUISINE_VERIFY_TYPES", "기타,퓨전"))
+        self.verify_threshold = verify_threshold
+        self.verify_types = set(verify_types)
+        
+        # 2차 검증 실행/생략 횟수와 검증으로 장르가 바뀐 횟수
+        self._verification_lock = threading.Lock()
+        self._verification_counts = {"skipped": 0, "unchanged": 0, "changed": 0}
+        
+        # LLM 단계 결과 캐시 (None이면 사용 안 함)
+        self.llm_cache = llm_cache
+        
+        # 처리 완료된 레시피 저장소 (None이면 사용 안 함)
+        self.recipe_store = recipe_store
+        
+        # 로컬 재료명 사전 (None이면 모든 재료명을 LLM으로 정규화)
+        self.ingredient_dictionary = ingredient_dictionary
+        
+        # 재시도는 LLMGateway가 한도와 함께 관리하므로 클라이언트 자체 재시도는 끕니다.
+        # llm을 전달하면 (벤치마크용 가짜 모델 등) ChatOpenAI 대신 사용합니다.
+        # base_url(OPENAI_BASE_URL)을 지정하면 OpenAI 호환 서버(부하 테스트용 가짜 서버 등)로 요청합니다.
+        self.llm = llm or ChatOpenAI(
             model=model_name,
             temperature=0.1,
-            openai_api_key=os.getenv("OPENAI_API_KEY")
+            openai_api_key=os.getenv("OPENAI_API_KEY"),
+            base_url=base_url or os.getenv("OPENAI_BASE_URL") or None,
+            max_retries=0
         )
         
+        # 모든 LLM 호출의 분당 요청/토큰 한도, 동시 호출 수, 재시도를 관리하는 관문
+        if llm_gateway is None:
+            llm_gateway = LLMGateway(
+                requests_per_minute=int(os.getenv("LLM_REQUESTS_PER_MINUTE", "500")),
+                tokens_per_minute=int(os.getenv("LLM_TOKENS_PER_MINUTE", "200000")),
+                max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "8")),
+                max_retries=int(os.getenv("LLM_MAX_RETRIES", "3")),
+                model_name=model_name
+            )
+        self.llm_gateway = llm_gateway
+        
         # API 클라이언트 초기화
-        self.api_client = ApiClient()
+        self.api_client = api_client or ApiClient()
         
         # 재료 추출 프롬프트
         self.extraction_prompt = PromptTemplate.from_template(
@@ -73,6 +185,7 @@ class IngredientExtractorAgent:
             3. 브랜드명 제거
             4. 표준 한국어 표기법 적용
             5. 중복 제거
+            6. mapping에는 각 입력 재료명이 어떤 재료명으로 정규화되었는지 모두 기록하세요
 
             {format_instructions}
             """
@@ -106,45 +219,481 @@ class IngredientExtractorAgent:
             """
         )
         
+        # 2차 정규화를 위한 더 엄격한 프롬프트
+        self.strict_normalization_prompt = PromptTemplate.from_template(
+            """
+            다음 재료 목록을 더 엄격하게 정규화해주세요. 최대한 일반적이고 표준적인 재료명으로 변경하세요.
+
+            재료 목록:
+            {ingredients}
+
+            엄격한 정규화 지침:
+            1. 매우 구체적인 재료명을 가장 일반적인 이름으로 변경
+            2. 지역 방언이나 특수 표기를 표준어로 변경
+            3. 유사한 재료는 하나로 통합 (예: '쪽파', '실파', '대파' → '파')
+            4. 불필요한 수식어 제거
+            5. 최종적으로 가장 기본적인 재료명만 남기기
+            6. mapping에는 각 입력 재료명이 어떤 재료명으로 정규화되었는지 모두 기록하세요
+
+            {format_instructions}
+            """
+        )
+        
+        # 음식 장르 2차 검증 프롬프트
+        self.verification_prompt = PromptTemplate.from_template(
+            """
+            다음은 1차 분류 결과입니다:
+            - 분류: {cuisine_type}
+            - 신뢰도: {confidence}
+            - 근거: {reasoning}
+
+            이 분류가 맞는지 다시 한번 검증해주세요:
+
+            재료 목록: {ingredients}
+            자막 일부: {transcript}
+
+            검증 지침:
+            1. 1차 분류 결과가 합리적인지 평가하세요
+            2. 재료와 조리법을 다시 분석하세요
+            3. 확실하지 않으면 신뢰도를 낮추거나 "기타"로 변경하세요
+            4. 최종 신뢰도는 보수적으로 평가하세요
+
+            {format_instructions}
+            """
+        )
+        
+        # 단일 호출(single-shot) 통합 분석 프롬프트
+        self.single_shot_prompt = PromptTemplate.from_template(
+            """
+            다음은 YouTube 요리 영상의 자막과 제목입니다. 아래 작업을 한 번에 수행해주세요.
+
+            영상 제목:
+            {title}
+
+            자막 내용:
+            {transcript}
+
+            1. 재료 추출 (raw_ingredients)
+               - 요리에 실제로 사용되는 재료만 추출하고, 조리도구나 조리법은 제외하세요
+               - 재료의 양이나 단위는 제거하고 재료명만 남기세요
+            2. 1차 정규화 (normalized_ingredients)
+               - 오타 수정 (예: '영파' → '양파'), 구체적인 재료명 일반화 (예: '적양파' → '양파')
+               - 브랜드명 제거, 표준 한국어 표기법 적용
+            3. 2차 정규화 (final_ingredients)
+               - 유사한 재료는 하나로 통합 (예: '쪽파', '실파', '대파' → '파')
+               - 불필요한 수식어를 제거하고 가장 기본적인 재료명만 남기세요
+               - 중복 없이 한 번씩만 포함하세요
+            4. 음식 장르 분류 (cuisine_type, confidence, reasoning)
+               - 한식: 김치, 고춧가루, 된장, 간장, 참기름, 깻잎 등
+               - 중식: 굴소스, 춘장, 팔각, 오향분, 청경채, 죽순 등
+               - 일식: 미소, 다시마, 가츠오부시, 미린, 사케, 와사비 등
+               - 양식: 버터, 치즈, 크림, 올리브오일, 허브 등
+               - 이탈리안: 파스타, 토마토소스, 바질, 파르메산 치즈 등
+               - 확실하지 않으면 "기타"로 분류하고, 신뢰도는 보수적으로 평가하세요
+
+            모든 답변은 한국어로 작성하세요.
+
+            {format_instructions}
+            """
+        )
+        
         self.extraction_parser = PydanticOutputParser(pydantic_object=IngredientList)
         self.normalization_parser = PydanticOutputParser(pydantic_object=IngredientNormalizer)
         self.cuisine_parser = PydanticOutputParser(pydantic_object=CuisineClassifier)
+        self.analysis_parser = PydanticOutputParser(pydantic_object=RecipeAnalysis)
+    
+    def _call_llm(self, prompt: str) -> str:
+        """
+        LLM을 동기 호출하고 응답 본문을 반환합니다. (LLMGateway를 거쳐 호출)
+        """
+        response = self.llm_gateway.invoke(self.llm, [HumanMessage(content=prompt)])
+        self._record_llm_call(response)
+        return response.content
+    
+    async def _acall_llm(self, prompt: str) -> str:
+        """
+        LLM을 비동기 호출하고 응답 본문을 반환합니다. (LLMGateway를 거쳐 호출)
+        """
+        response = await self.llm_gateway.ainvoke(self.llm, [HumanMessage(content=prompt)])
+        self._record_llm_call(response)
+        return response.content
+    
+    @staticmethod
+    def _record_llm_call(response: Any) -> None:
+        """
+        현재 파이프라인 단계에 LLM 호출과 토큰 사용량을 기록합니다.
+        """
+        usage = current_stage_usage.get()
+        if usage is not None:
+            tokens = token_usage(response)
+            usage.add_llm_call(tokens.get("input_tokens", 0), tokens.get("output_tokens", 0))
+    
+    @staticmethod
+    def _record_cache_hit() -> None:
+        usage = current_stage_usage.get()
+        if usage is not None:
+            usage.add_cache_hit()
+    
+    def _run_stage(self, stage: str, prompt: str, parse: Callable[[str], T]) -> T:
+        """
+        LLM 단계를 실행합니다. 같은 단계/모델/프롬프트의 결과가 캐시에 있으면 LLM을 호출하지 않습니다.
+        파싱에 성공한 응답만 캐시에 저장합니다.
+        """
+        cache_key = make_stage_cache_key(stage, self.model_name, prompt)
+        if self.llm_cache is not None:
+            cached_content = self.llm_cache.get(cache_key)
+            if cached_content is not None:
+                self._record_cache_hit()
+                return parse(cached_content)
+        
+        content = self._call_llm(prompt)
+        result = parse(content)
+        
+        if self.llm_cache is not None:
+            self.llm_cache.set(cache_key, content)
+        return result
+    
+    async def _arun_stage(self, stage: str, prompt: str, parse: Callable[[str], T]) -> T:
+        """
+        _run_stage의 비동기 버전입니다.
+        """
+        cache_key = make_stage_cache_key(stage, self.model_name, prompt)
+        if self.llm_cache is not None:
+            cached_content = self.llm_cache.get(cache_key)
+            if cached_content is not None:
+                self._record_cache_hit()
+                return parse(cached_content)
+        
+        content = await self._acall_llm(prompt)
+        result = parse(content)
+        
+        if self.llm_cache is not None:
+            self.llm_cache.set(cache_key, content)
+        return result
+    
+    def _count_tokens(self, text: str) -> int:
+        return estimate_tokens(text, self.model_name)
+    
+    def _transcript_chunks(self, transcript: str) -> List[str]:
+        """
+        자막을 토큰 수 기준 구간으로 나누고, 영상당 토큰 예산을 넘으면 고르게 일부 구간만 선택합니다.
+        """
+        if not self.chunk_tokens or self._count_tokens(transcript) <= self.chunk_tokens:
+            return [transcript]
+        
+        chunks = split_transcript(transcript, self.chunk_tokens, CHUNK_OVERLAP_TOKENS, self._count_tokens)
+        return select_chunks(chunks, self.token_budget, self._count_tokens)
+    
+    def _fit_to_budget(self, transcript: str) -> str:
+        """
+        한 번에 프롬프트에 넣는 자막을 영상당 토큰 예산 안으로 줄입니다.
+        """
+        if not self.token_budget or self._count_tokens(transcript) <= self.token_budget:
+            return transcript
+        
+        window = self.chunk_tokens or max(1, self.token_budget // 8)
+        chunks = split_transcript(transcript, min(window, self.token_budget), 0, self._count_tokens)
+        return " ".join(select_chunks(chunks, self.token_budget, self._count_tokens))
+    
+    @staticmethod
+    def _merge_chunk_results(outcomes: List[Any]) -> List[str]:
+        """
+        구간별 추출 결과를 합칩니다. 일부 구간만 실패했으면 나머지 결과를 사용합니다.
+        """
+        failures = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+        if len(failures) == len(outcomes):
+            raise failures[0]
+        if failures:
+            print(f"⚠️ {len(outcomes)}개 구간 중 {len(failures)}개 구간 재료 추출 실패: {failures[0]}")
+        
+        return merge_ingredients([outcome for outcome in outcomes if not isinstance(outcome, Exception)])
+    
+    @staticmethod
+    def _format_ingredient_lines(ingredients: List[str]) -> str:
+        return "\n".join([f"- {ingredient}" for ingredient in ingredients])
+    
+    def _build_extraction_prompt(self, transcript: str) -> str:
+        return self.extraction_prompt.format(
+            transcript=transcript,
+            format_instructions=self.extraction_parser.get_format_instructions()
+        )
+    
+    def _build_normalization_prompt(self, ingredients: List[str]) -> str:
+        return self.normalization_prompt.format(
+            ingredients=self._format_ingredient_lines(ingredients),
+            format_instructions=self.normalization_parser.get_format_instructions()
+        )
+    
+    def _build_strict_normalization_prompt(self, ingredients: List[str]) -> str:
+        return self.strict_normalization_prompt.format(
+            ingredients=self._format_ingredient_lines(ingredients),
+            format_instructions=self.normalization_parser.get_format_instructions()
+        )
+    
+    def _build_cuisine_prompt(self, transcript: str, ingredients: List[str], title: str) -> str:
+        return self.cuisine_prompt.format(
+            transcript=sample_transcript(transcript, 500),  # 자막이 너무 길면 처음/중간/끝에서 500자만
+            ingredients=", ".join(ingredients),
+            title=title or "제목 없음",
+            format_instructions=self.cuisine_parser.get_format_instructions()
+        )
+    
+    def _build_verification_prompt(self, cuisine_info: CuisineInfo, transcript: str, ingredients: List[str]) -> str:
+        return self.verification_prompt.format(
+            cuisine_type=cuisine_info.cuisine_type.value,
+            confidence=cuisine_info.confidence,
+            reasoning=cuisine_info.reasoning,
+            ingredients=", ".join(ingredients),
+            transcript=sample_transcript(transcript, 300),  # 더 짧게
+            format_instructions=self.cuisine_parser.get_format_instructions()
+        )
+    
+    def _build_single_shot_prompt(self, transcript: str, title: str) -> str:
+        return self.single_shot_prompt.format(
+            transcript=self._fit_to_budget(transcript),
+            title=title or "제목 없음",
+            format_instructions=self.analysis_parser.get_format_instructions()
+        )
+    
+    @staticmethod
+    def _to_cuisine_type(value: str) -> CuisineType:
+        # CuisineType enum으로 변환, 매칭되지 않는 경우 기타로 설정
+        try:
+            return CuisineType(value)
+        except ValueError:
+            return CuisineType.OTHER
+    
+    def _parse_cuisine_info(self, content: str) -> CuisineInfo:
+        result = self.cuisine_parser.parse(content)
+        return CuisineInfo(
+            cuisine_type=self._to_cuisine_type(result.cuisine_type),
+            confidence=result.confidence,
+            reasoning=result.reasoning
+        )
+    
+    def _parse_verified_cuisine_info(self, content: str, cuisine_info: CuisineInfo) -> CuisineInfo:
+        result = self.cuisine_parser.parse(content)
+        
+        # 2차 검증에서는 신뢰도를 더 보수적으로 설정
+        return CuisineInfo(
+            cuisine_type=self._to_cuisine_type(result.cuisine_type),
+            confidence=min(result.confidence, cuisine_info.confidence),
+            reasoning=f"2차 검증: {result.reasoning}"
+        )
+    
+    def _accepted_by_rules(self, cuisine_info: CuisineInfo) -> bool:
+        return cuisine_info.source == "rules" and cuisine_info.confidence >= self.cuisine_rule_threshold
+    
+    def _should_verify(self, cuisine_info: CuisineInfo) -> bool:
+        """
+        장르 분류 결과를 LLM으로 2차 검증할지 결정합니다.
+        """
+        if self._accepted_by_rules(cuisine_info):
+            return False
+        return cuisine_info.confidence < self.verify_threshold or cuisine_info.cuisine_type in self.verify_types
+    
+    def _record_verification(self, outcome: str) -> None:
+        with self._verification_lock:
+            self._verification_counts[outcome] += 1
+    
+    @staticmethod
+    def _verification_outcome(before: CuisineInfo, after: CuisineInfo) -> str:
+        return "changed" if after.cuisine_type != before.cuisine_type else "unchanged"
+    
+    def verification_stats(self) -> Dict[str, Any]:
+        """
+        장르 2차 검증 통계를 반환합니다. change_rate는 검증을 실행한 경우 중 장르가 바뀐 비율입니다.
+        """
+        with self._verification_lock:
+            counts = dict(self._verification_counts)
+        verified = counts["unchanged"] + counts["changed"]
+        total = verified + counts["skipped"]
+        return {
+            "threshold": self.verify_threshold,
+            "types": sorted(cuisine_type.value for cuisine_type in self.verify_types),
+            **counts,
+            "verified": verified,
+            "skip_rate": round(counts["skipped"] / total, 4) if total else 0.0,
+            "change_rate": round(counts["changed"] / verified, 4) if verified else 0.0,
+        }
+    
+    def verify_if_needed(self, cuisine_info: CuisineInfo, transcript: str, ingredients: List[str]) -> CuisineInfo:
+        """
+        검증 조건에 해당할 때만 장르 분류를 2차 검증하고 결과를 통계에 기록합니다.
+        """
+        if not self._should_verify(cuisine_info):
+            self._record_verification("skipped")
+            return cuisine_info
+        
+        print("🔍 음식 장르 검증 중...")
+        verified = self.verify_cuisine_classification(cuisine_info, transcript, ingredients)
+        self._record_verification(self._verification_outcome(cuisine_info, verified))
+        return verified
+    
+    async def averify_if_needed(self, cuisine_info: CuisineInfo, transcript: str, ingredients: List[str]) -> CuisineInfo:
+        """
+        verify_if_needed의 비동기 버전입니다.
+        """
+        if not self._should_verify(cuisine_info):
+            self._record_verification("skipped")
+            return cuisine_info
+        
+        print("🔍 음식 장르 검증 중...")
+        verified = await self.averify_cuisine_classification(cuisine_info, transcript, ingredients)
+        self._record_verification(self._verification_outcome(cuisine_info, verified))
+        return verified
+    
+    @staticmethod
+    def _classification_failed(error: Exception, rule_info: Optional[CuisineInfo] = None) -> CuisineInfo:
+        print(f"음식 장르 분류 실패: {error}")
+        if rule_info is not None and rule_info.confidence > 0:
+            # 신뢰도가 낮더라도 규칙 기반 분류 결과가 있으면 사용
+            return rule_info
+        return CuisineInfo(
+            cuisine_type=CuisineType.OTHER,
+            confidence=0.0,
+            reasoning="분류 실패"
+        )
+    
+    @staticmethod
+    def _verification_failed(cuisine_info: CuisineInfo, error: Exception) -> CuisineInfo:
+        print(f"음식 장르 2차 검증 실패: {error}")
+        # 검증 실패 시 원래 결과 반환하되 신뢰도 낮춤
+        return CuisineInfo(
+            cuisine_type=cuisine_info.cuisine_type,
+            confidence=max(0.3, cuisine_info.confidence - 0.2),
+            reasoning=f"검증 실패, 원본: {cuisine_info.reasoning}"
+        )
+    
+    def _extract_chunk(self, transcript: str) -> List[str]:
+        return self._run_stage(
+            "extraction",
+            self._build_extraction_prompt(transcript),
+            lambda content: self.extraction_parser.parse(content).ingredients
+        )
+    
+    async def _aextract_chunk(self, transcript: str) -> List[str]:
+        return await self._arun_stage(
+            "extraction",
+            self._build_extraction_prompt(transcript),
+            lambda content: self.extraction_parser.parse(content).ingredients
+        )
     
     def extract_ingredients_from_transcript(self, transcript: str) -> List[str]:
         """
         자막에서 재료를 추출합니다.
+        긴 자막은 토큰 수 기준 구간으로 나누어 동시에 추출한 뒤 합칩니다.
         """
         try:
-            # 1단계: 재료 추출
-            prompt = self.extraction_prompt.format(
-                transcript=transcript,
-                format_instructions=self.extraction_parser.get_format_instructions()
-            )
+            chunks = self._transcript_chunks(transcript)
+            if len(chunks) == 1:
+                return self._extract_chunk(chunks[0])
             
-            response = self.llm.invoke([HumanMessage(content=prompt)])
-            result = self.extraction_parser.parse(response.content)
+            print(f"📚 긴 자막을 {len(chunks)}개 구간으로 나누어 재료를 추출합니다.")
             
-            return result.ingredients
+            def extract(chunk: str) -> Any:
+                try:
+                    return self._extract_chunk(chunk)
+                except Exception as e:
+                    return e
+            
+            with ThreadPoolExecutor(max_workers=min(len(chunks), self.chunk_concurrency)) as executor:
+                # 호출자의 컨텍스트 변수를 워커 스레드로 전달합니다.
+                futures = [executor.submit(contextvars.copy_context().run, extract, chunk) for chunk in chunks]
+                outcomes = [future.result() for future in futures]
+            return self._merge_chunk_results(outcomes)
             
         except Exception as e:
             raise Exception(f"재료 추출 중 오류 발생: {str(e)}")
     
-    def normalize_ingredients(self, ingredients: List[str]) -> List[str]:
+    async def aextract_ingredients_from_transcript(self, transcript: str) -> List[str]:
         """
-        재료명을 정규화합니다.
+        자막에서 재료를 비동기로 추출합니다.
+        긴 자막은 토큰 수 기준 구간으로 나누어 동시에 추출한 뒤 합칩니다.
         """
         try:
-            ingredients_text = "\n".join([f"- {ingredient}" for ingredient in ingredients])
+            chunks = self._transcript_chunks(transcript)
+            if len(chunks) == 1:
+                return await self._aextract_chunk(chunks[0])
             
-            prompt = self.normalization_prompt.format(
-                ingredients=ingredients_text,
-                format_instructions=self.normalization_parser.get_format_instructions()
-            )
+            print(f"📚 긴 자막을 {len(chunks)}개 구간으로 나누어 재료를 추출합니다.")
+            semaphore = asyncio.Semaphore(self.chunk_concurrency)
+            
+            async def extract(chunk: str) -> List[str]:
+                async with semaphore:
+                    return await self._aextract_chunk(chunk)
             
-            response = self.llm.invoke([HumanMessage(content=prompt)])
-            result = self.normalization_parser.parse(response.content)
+            outcomes = await asyncio.gather(*(extract(chunk) for chunk in chunks), return_exceptions=True)
+            return self._merge_chunk_results(list(outcomes))
+            
+        except Exception as e:
+            raise Exception(f"재료 추출 중 오류 발생: {str(e)}")
+    
+    def _learned_mapping(self, unknown: List[str], result: IngredientNormalizer) -> Dict[str, str]:
+        """
+        LLM 정규화 결과에서 {입력 재료명: 정규화된 재료명} 대응을 찾습니다.
+        사전에 영구히 저장되므로 출력 순서에 기대지 않고 mapping에 명시된 대응만 사용합니다.
+        """
+        return {name: result.mapping[name] for name in unknown if result.mapping.get(name)}
+    
+    def _merge_normalized(self, stage: str, ingredients: List[str], known: Dict[str, str],
+                          unknown: List[str], result: Optional[IngredientNormalizer]) -> List[str]:
+        """
+        사전으로 정규화한 이름과 LLM 결과를 입력 순서대로 합치고, LLM 결과를 사전에 학습시킵니다.
+        """
+        learned: Dict[str, str] = {}
+        if result is not None:
+            learned = self._learned_mapping(unknown, result)
+            self.ingredient_dictionary.learn(stage, learned)
+        
+        normalized = [known.get(name) or learned.get(name) for name in ingredients]
+        if result is not None:
+            normalized += result.normalized_ingredients
+        return merge_ingredients([[name for name in normalized if name]])
+    
+    def _normalize(self, stage: str, ingredients: List[str], build_prompt: Callable[[List[str]], str]) -> List[str]:
+        if self.ingredient_dictionary is None:
+            return self._run_stage(
+                stage,
+                build_prompt(ingredients),
+                lambda content: self.normalization_parser.parse(content).normalized_ingredients
+            )
+        
+        # 사전에 있는 이름은 바로 정규화하고, 모르는 이름만 LLM으로 보냅니다.
+        known, unknown = self.ingredient_dictionary.partition(stage, ingredients)
+        print(f"📖 사전 정규화 ({stage}): {len(known)}/{len(ingredients)}개, LLM 요청 {len(unknown)}개")
+        result = self._run_stage(stage, build_prompt(unknown), self.normalization_parser.parse) if unknown else None
+        return self._merge_normalized(stage, ingredients, known, unknown, result)
+    
+    async def _anormalize(self, stage: str, ingredients: List[str], build_prompt: Callable[[List[str]], str]) -> List[str]:
+        if self.ingredient_dictionary is None:
+            return await self._arun_stage(
+                stage,
+                build_prompt(ingredients),
+                lambda content: self.normalization_parser.parse(content).normalized_ingredients
+            )
+        
+        known, unknown = self.ingredient_dictionary.partition(stage, ingredients)
+        print(f"📖 사전 정규화 ({stage}): {len(known)}/{len(ingredients)}개, LLM 요청 {len(unknown)}개")
+        result = await self._arun_stage(stage, build_prompt(unknown), self.normalization_parser.parse) if unknown else None
+        return self._merge_normalized(stage, ingredients, known, unknown, result)
+    
+    def normalize_ingredients(self, ingredients: List[str]) -> List[str]:
+        """
+        재료명을 정규화합니다.
+        """
+        try:
+            return self._normalize("normalization", ingredients, self._build_normalization_prompt)
             
-            return result.normalized_ingredients
+        except Exception as e:
+            raise Exception(f"재료 정규화 중 오류 발생: {str(e)}")
+    
+    async def anormalize_ingredients(self, ingredients: List[str]) -> List[str]:
+        """
+        재료명을 비동기로 정규화합니다.
+        """
+        try:
+            return await self._anormalize("normalization", ingredients, self._build_normalization_prompt)
             
         except Exception as e:
             raise Exception(f"재료 정규화 중 오류 발생: {str(e)}")
@@ -154,36 +703,17 @@ class IngredientExtractorAgent:
         2차 정규화를 수행합니다.
         """
         try:
-            # 2차 정규화를 위한 더 엄격한 프롬프트
-            strict_prompt = PromptTemplate.from_template(
-                """
-                다음 재료 목록을 더 엄격하게 정규화해주세요. 최대한 일반적이고 표준적인 재료명으로 변경하세요.
-
-                재료 목록:
-                {ingredients}
-
-                엄격한 정규화 지침:
-                1. 매우 구체적인 재료명을 가장 일반적인 이름으로 변경
-                2. 지역 방언이나 특수 표기를 표준어로 변경
-                3. 유사한 재료는 하나로 통합 (예: '쪽파', '실파', '대파' → '파')
-                4. 불필요한 수식어 제거
-                5. 최종적으로 가장 기본적인 재료명만 남기기
-
-                {format_instructions}
-                """
-            )
+            return self._normalize("strict_normalization", ingredients, self._build_strict_normalization_prompt)
             
-            ingredients_text = "\n".join([f"- {ingredient}" for ingredient in ingredients])
-            
-            prompt = strict_prompt.format(
-                ingredients=ingredients_text,
-                format_instructions=self.normalization_parser.get_format_instructions()
-            )
-            
-            response = self.llm.invoke([HumanMessage(content=prompt)])
-            result = self.normalization_parser.parse(response.content)
-            
-            return result.normalized_ingredients
+        except Exception as e:
+            raise Exception(f"2차 정규화 중 오류 발생: {str(e)}")
+    
+    async def asecond_pass_normalization(self, ingredients: List[str]) -> List[str]:
+        """
+        2차 정규화를 비동기로 수행합니다.
+        """
+        try:
+            return await self._anormalize("strict_normalization", ingredients, self._build_strict_normalization_prompt)
             
         except Exception as e:
             raise Exception(f"2차 정규화 중 오류 발생: {str(e)}")
@@ -191,184 +721,417 @@ class IngredientExtractorAgent:
     def classify_cuisine(self, transcript: str, ingredients: List[str], title: str = "") -> CuisineInfo:
         """
         음식 장르를 분류합니다.
+        재료와 제목의 특징 키워드로 먼저 분류하고, 신뢰도가 낮을 때만 LLM을 호출합니다.
         """
+        rule_info = classify_by_rules(ingredients, title)
+        if self._accepted_by_rules(rule_info):
+            return rule_info
+        
         try:
-            ingredients_text = ", ".join(ingredients)
-            
-            prompt = self.cuisine_prompt.format(
-                transcript=transcript[:500],  # 자막이 너무 길면 처음 500자만
-                ingredients=ingredients_text,
-                title=title or "제목 없음",
-                format_instructions=self.cuisine_parser.get_format_instructions()
+            return self._run_stage(
+                "cuisine",
+                self._build_cuisine_prompt(transcript, ingredients, title),
+                self._parse_cuisine_info
             )
             
-            response = self.llm.invoke([HumanMessage(content=prompt)])
-            result = self.cuisine_parser.parse(response.content)
-            
-            # CuisineType enum으로 변환
-            try:
-                cuisine_type = CuisineType(result.cuisine_type)
-            except ValueError:
-                # 매칭되지 않는 경우 기타로 설정
-                cuisine_type = CuisineType.OTHER
-            
-            return CuisineInfo(
-                cuisine_type=cuisine_type,
-                confidence=result.confidence,
-                reasoning=result.reasoning
+        except Exception as e:
+            return self._classification_failed(e, rule_info)
+    
+    async def aclassify_cuisine(self, transcript: str, ingredients: List[str], title: str = "") -> CuisineInfo:
+        """
+        음식 장르를 비동기로 분류합니다.
+        재료와 제목의 특징 키워드로 먼저 분류하고, 신뢰도가 낮을 때만 LLM을 호출합니다.
+        """
+        rule_info = classify_by_rules(ingredients, title)
+        if self._accepted_by_rules(rule_info):
+            return rule_info
+        
+        try:
+            return await self._arun_stage(
+                "cuisine",
+                self._build_cuisine_prompt(transcript, ingredients, title),
+                self._parse_cuisine_info
             )
             
         except Exception as e:
-            print(f"음식 장르 분류 실패: {e}")
-            return CuisineInfo(
-                cuisine_type=CuisineType.OTHER,
-                confidence=0.0,
-                reasoning="분류 실패"
-            )
+            return self._classification_failed(e, rule_info)
     
     def verify_cuisine_classification(self, cuisine_info: CuisineInfo, transcript: str, ingredients: List[str]) -> CuisineInfo:
         """
         음식 장르 분류를 2차 검증합니다.
         """
         try:
-            # 2차 검증을 위한 다른 접근법 사용
-            verification_prompt = PromptTemplate.from_template(
-                """
-                다음은 1차 분류 결과입니다:
-                - 분류: {cuisine_type}
-                - 신뢰도: {confidence}
-                - 근거: {reasoning}
-
-                이 분류가 맞는지 다시 한번 검증해주세요:
-
-                재료 목록: {ingredients}
-                자막 일부: {transcript}
-
-                검증 지침:
-                1. 1차 분류 결과가 합리적인지 평가하세요
-                2. 재료와 조리법을 다시 분석하세요
-                3. 확실하지 않으면 신뢰도를 낮추거나 "기타"로 변경하세요
-                4. 최종 신뢰도는 보수적으로 평가하세요
-
-                {format_instructions}
-                """
+            return self._run_stage(
+                "verification",
+                self._build_verification_prompt(cuisine_info, transcript, ingredients),
+                lambda content: self._parse_verified_cuisine_info(content, cuisine_info)
             )
             
-            ingredients_text = ", ".join(ingredients)
-            
-            prompt = verification_prompt.format(
-                cuisine_type=cuisine_info.cuisine_type.value,
-                confidence=cuisine_info.confidence,
-                reasoning=cuisine_info.reasoning,
-                ingredients=ingredients_text,
-                transcript=transcript[:300],  # 더 짧게
-                format_instructions=self.cuisine_parser.get_format_instructions()
+        except Exception as e:
+            return self._verification_failed(cuisine_info, e)
+    
+    async def averify_cuisine_classification(self, cuisine_info: CuisineInfo, transcript: str, ingredients: List[str]) -> CuisineInfo:
+        """
+        음식 장르 분류를 비동기로 2차 검증합니다.
+        """
+        try:
+            return await self._arun_stage(
+                "verification",
+                self._build_verification_prompt(cuisine_info, transcript, ingredients),
+                lambda content: self._parse_verified_cuisine_info(content, cuisine_info)
             )
             
-            response = self.llm.invoke([HumanMessage(content=prompt)])
-            result = self.cuisine_parser.parse(response.content)
-            
-            # 검증된 결과로 업데이트
-            try:
-                verified_cuisine_type = CuisineType(result.cuisine_type)
-            except ValueError:
-                verified_cuisine_type = CuisineType.OTHER
-            
-            # 2차 검증에서는 신뢰도를 더 보수적으로 설정
-            final_confidence = min(result.confidence, cuisine_info.confidence)
+        except Exception as e:
+            return self._verification_failed(cuisine_info, e)
+    
+    def analyze_transcript(self, transcript: str, title: str = "") -> RecipeAnalysis:
+        """
+        재료 추출, 2단계 정규화, 음식 장르 분류를 한 번의 LLM 호출로 수행합니다.
+        """
+        try:
+            return self._run_stage(
+                "single_shot",
+                self._build_single_shot_prompt(transcript, title),
+                self.analysis_parser.parse
+            )
             
-            return CuisineInfo(
-                cuisine_type=verified_cuisine_type,
-                confidence=final_confidence,
-                reasoning=f"2차 검증: {result.reasoning}"
+        except Exception as e:
+            raise Exception(f"통합 분석 중 오류 발생: {str(e)}")
+    
+    async def aanalyze_transcript(self, transcript: str, title: str = "") -> RecipeAnalysis:
+        """
+        analyze_transcript의 비동기 버전입니다.
+        """
+        try:
+            return await self._arun_stage(
+                "single_shot",
+                self._build_single_shot_prompt(transcript, title),
+                self.analysis_parser.parse
             )
             
         except Exception as e:
-            print(f"음식 장르 2차 검증 실패: {e}")
-            # 검증 실패 시 원래 결과 반환하되 신뢰도 낮춤
-            return CuisineInfo(
-                cuisine_type=cuisine_info.cuisine_type,
-                confidence=max(0.3, cuisine_info.confidence - 0.2),
-                reasoning=f"검증 실패, 원본: {cuisine_info.reasoning}"
+            raise Exception(f"통합 분석 중 오류 발생: {str(e)}")
+    
+    @staticmethod
+    def _build_recipe(youtube_url: str, metadata: Optional[VideoMetadata], transcript: str,
+                      final_ingredients: List[str], cuisine_info: CuisineInfo) -> Recipe:
+        # Ingredient 객체 생성 - 단순화하여 매핑 오류 방지
+        ingredients = []
+        for final_ingredient in final_ingredients:
+            ingredients.append(Ingredient(
+                name=final_ingredient,
+                original_name=final_ingredient,  # 일단 같은 이름으로 설정
+                normalized_name=final_ingredient,  # 일단 같은 이름으로 설정
+                confidence=0.9
+            ))
+        
+        return Recipe(
+            youtube_url=youtube_url,
+            title=metadata.title if metadata else None,
+            metadata=metadata,
+            ingredients=ingredients,
+            cuisine_info=cuisine_info,
+            transcript=transcript,
+            processing_status="completed"
+        )
+    
+    @staticmethod
+    def _fetch_metadata(youtube_url: str) -> Optional[VideoMetadata]:
+        try:
+            return YouTubeMetadataExtractor.get_video_metadata(youtube_url)
+        except Exception as e:
+            print(f"메타데이터 추출 실패: {e}")
+            return None
+    
+    @staticmethod
+    async def _afetch_metadata(youtube_url: str) -> Optional[VideoMetadata]:
+        try:
+            return await YouTubeMetadataExtractor.aget_video_metadata(youtube_url)
+        except Exception as e:
+            print(f"메타데이터 추출 실패: {e}")
+            return None
+    
+    @staticmethod
+    def _fetch_segments(youtube_url: str) -> List[Dict[str, Any]]:
+        return YouTubeTranscriptExtractor.get_transcript_segments(youtube_url)
+    
+    @staticmethod
+    async def _afetch_segments(youtube_url: str) -> List[Dict[str, Any]]:
+        return await YouTubeTranscriptExtractor.aget_transcript_segments(youtube_url)
+    
+    @staticmethod
+    def _join_segments(segments: List[Dict[str, Any]]) -> str:
+        transcript = " ".join([entry['text'] for entry in segments])
+        if not transcript:
+            raise Exception("자막을 추출할 수 없습니다.")
+        return transcript
+    
+    def _filter_transcript(self, segments: List[Dict[str, Any]]) -> TranscriptFilterResult:
+        """
+        재료를 언급하는 세그먼트만 남긴 자막을 만듭니다. (재료 추출 단계에서만 사용)
+        """
+        if not self.transcript_filter:
+            return filter_segments(segments, enabled=False)
+        
+        result = filter_segments(segments)
+        if result.applied:
+            print(f"✂️ 자막 사전 필터링: {result.kept_segments}/{result.total_segments}개 세그먼트, "
+                  f"{result.filtered_chars}/{result.original_chars}자 (압축률 {result.compression_ratio:.0%})")
+        return result
+    
+    @staticmethod
+    def _title_of(metadata: Optional[VideoMetadata]) -> str:
+        return metadata.title if metadata else ""
+    
+    def _build_pipeline_stages(self, youtube_url: str) -> List[PipelineStage]:
+        """
+        동기 파이프라인(multi_pass) 단계와 의존 관계를 정의합니다.
+        
+        메타데이터와 자막은 서로 독립적으로, 장르 분류는 1차 정규화된 재료 목록으로
+        2차 정규화 단계와 동시에 실행됩니다. 재료 추출에는 사전 필터링된 자막을,
+        장르 분류와 결과 레시피에는 전체 자막을 사용합니다.
+        """
+        def classify(inputs: Dict[str, Any]) -> CuisineInfo:
+            print("🍽️ 음식 장르 분류 중...")
+            return self.classify_cuisine(
+                transcript=inputs["transcript"],
+                ingredients=inputs["normalized"],
+                title=self._title_of(inputs["metadata"])
             )
+        
+        def verify(inputs: Dict[str, Any]) -> CuisineInfo:
+            return self.verify_if_needed(
+                cuisine_info=inputs["cuisine"],
+                transcript=inputs["transcript"],
+                ingredients=inputs["normalized"]
+            )
+        
+        return [
+            PipelineStage("metadata", lambda inputs: self._fetch_metadata(youtube_url)),
+            PipelineStage("segments", lambda inputs: self._fetch_segments(youtube_url)),
+            PipelineStage("transcript", lambda inputs: self._join_segments(inputs["segments"]), ["segments"]),
+            PipelineStage("filtered_transcript", lambda inputs: self._filter_transcript(inputs["segments"]), ["segments"]),
+            PipelineStage("raw_ingredients", lambda inputs: self.extract_ingredients_from_transcript(inputs["filtered_transcript"].text), ["filtered_transcript"]),
+            PipelineStage("normalized", lambda inputs: self.normalize_ingredients(inputs["raw_ingredients"]), ["raw_ingredients"]),
+            PipelineStage("final_ingredients", lambda inputs: self.second_pass_normalization(inputs["normalized"]), ["normalized"]),
+            PipelineStage("cuisine", classify, ["transcript", "metadata", "normalized"]),
+            PipelineStage("verified_cuisine", verify, ["cuisine", "transcript", "normalized"]),
+        ]
     
-    def process_youtube_video(self, youtube_url: str) -> Recipe:
+    def _build_async_pipeline_stages(self, youtube_url: str) -> List[PipelineStage]:
         """
-        YouTube 영상을 분석하여 재료를 추출하고 정규화합니다.
+        _build_pipeline_stages와 같은 의존 관계를 갖는 비동기 단계를 정의합니다.
         """
-        # 데모 모드 확인 (URL에 'demo'가 포함된 경우)
-        if "demo" in youtube_url.lower():
-            return self._create_demo_recipe(youtube_url)
+        async def fetch_metadata(inputs: Dict[str, Any]) -> Optional[VideoMetadata]:
+            return await self._afetch_metadata(youtube_url)
         
-        try:
-            # 1. 메타데이터 추출
-            try:
-                metadata = YouTubeMetadataExtractor.get_video_metadata(youtube_url)
-            except Exception as e:
-                print(f"메타데이터 추출 실패: {e}")
-                metadata = None
-            
-            # 2. 자막 추출
-            transcript = YouTubeTranscriptExtractor.get_transcript(youtube_url)
-            if not transcript:
-                raise Exception("자막을 추출할 수 없습니다.")
-            
-            # 3. 재료 추출
-            raw_ingredients = self.extract_ingredients_from_transcript(transcript)
-            
-            # 4. 1차 정규화
-            normalized_ingredients = self.normalize_ingredients(raw_ingredients)
-            
-            # 5. 2차 정규화
-            final_ingredients = self.second_pass_normalization(normalized_ingredients)
-            
-            # 6. Ingredient 객체 생성 - 단순화하여 매핑 오류 방지
-            ingredients = []
-            for final_ingredient in final_ingredients:
-                ingredients.append(Ingredient(
-                    name=final_ingredient,
-                    original_name=final_ingredient,  # 일단 같은 이름으로 설정
-                    normalized_name=final_ingredient,  # 일단 같은 이름으로 설정
-                    confidence=0.9
-                ))
-            
-            # 7. 음식 장르 분류
+        async def fetch_segments(inputs: Dict[str, Any]) -> List[Dict[str, Any]]:
+            return await self._afetch_segments(youtube_url)
+        
+        async def join_segments(inputs: Dict[str, Any]) -> str:
+            return self._join_segments(inputs["segments"])
+        
+        async def filter_transcript(inputs: Dict[str, Any]) -> TranscriptFilterResult:
+            return self._filter_transcript(inputs["segments"])
+        
+        async def extract(inputs: Dict[str, Any]) -> List[str]:
+            return await self.aextract_ingredients_from_transcript(inputs["filtered_transcript"].text)
+        
+        async def normalize(inputs: Dict[str, Any]) -> List[str]:
+            return await self.anormalize_ingredients(inputs["raw_ingredients"])
+        
+        async def second_pass(inputs: Dict[str, Any]) -> List[str]:
+            return await self.asecond_pass_normalization(inputs["normalized"])
+        
+        async def classify(inputs: Dict[str, Any]) -> CuisineInfo:
             print("🍽️ 음식 장르 분류 중...")
-            cuisine_info = self.classify_cuisine(
-                transcript=transcript,
-                ingredients=final_ingredients,
-                title=metadata.title if metadata else ""
+            return await self.aclassify_cuisine(
+                transcript=inputs["transcript"],
+                ingredients=inputs["normalized"],
+                title=self._title_of(inputs["metadata"])
             )
-            
-            # 8. 음식 장르 2차 검증
-            print("🔍 음식 장르 검증 중...")
-            verified_cuisine_info = self.verify_cuisine_classification(
-                cuisine_info=cuisine_info,
-                transcript=transcript,
-                ingredients=final_ingredients
+        
+        async def verify(inputs: Dict[str, Any]) -> CuisineInfo:
+            return await self.averify_if_needed(
+                cuisine_info=inputs["cuisine"],
+                transcript=inputs["transcript"],
+                ingredients=inputs["normalized"]
             )
-            
-            # 9. Recipe 객체 생성
-            recipe = Recipe(
-                youtube_url=youtube_url,
-                title=metadata.title if metadata else None,
-                metadata=metadata,
-                ingredients=ingredients,
-                cuisine_info=verified_cuisine_info,
-                transcript=transcript,
-                processing_status="completed"
+        
+        return [
+            PipelineStage("metadata", fetch_metadata),
+            PipelineStage("segments", fetch_segments),
+            PipelineStage("transcript", join_segments, ["segments"]),
+            PipelineStage("filtered_transcript", filter_transcript, ["segments"]),
+            PipelineStage("raw_ingredients", extract, ["filtered_transcript"]),
+            PipelineStage("normalized", normalize, ["raw_ingredients"]),
+            PipelineStage("final_ingredients", second_pass, ["normalized"]),
+            PipelineStage("cuisine", classify, ["transcript", "metadata", "normalized"]),
+            PipelineStage("verified_cuisine", verify, ["cuisine", "transcript", "normalized"]),
+        ]
+    
+    def _build_single_shot_stages(self, youtube_url: str) -> List[PipelineStage]:
+        """
+        single_shot 모드 단계를 정의합니다. 자막 수집 후 통합 분석 한 번으로 끝납니다.
+        """
+        def analyze(inputs: Dict[str, Any]) -> RecipeAnalysis:
+            print("🧠 통합 분석 중...")
+            return self.analyze_transcript(inputs["transcript"], self._title_of(inputs["metadata"]))
+        
+        return [
+            PipelineStage("metadata", lambda inputs: self._fetch_metadata(youtube_url)),
+            PipelineStage("segments", lambda inputs: self._fetch_segments(youtube_url)),
+            PipelineStage("transcript", lambda inputs: self._join_segments(inputs["segments"]), ["segments"]),
+            PipelineStage("analysis", analyze, ["transcript", "metadata"]),
+        ]
+    
+    def _build_async_single_shot_stages(self, youtube_url: str) -> List[PipelineStage]:
+        """
+        _build_single_shot_stages의 비동기 버전입니다.
+        """
+        async def fetch_metadata(inputs: Dict[str, Any]) -> Optional[VideoMetadata]:
+            return await self._afetch_metadata(youtube_url)
+        
+        async def fetch_segments(inputs: Dict[str, Any]) -> List[Dict[str, Any]]:
+            return await self._afetch_segments(youtube_url)
+        
+        async def join_segments(inputs: Dict[str, Any]) -> str:
+            return self._join_segments(inputs["segments"])
+        
+        async def analyze(inputs: Dict[str, Any]) -> RecipeAnalysis:
+            print("🧠 통합 분석 중...")
+            return await self.aanalyze_transcript(inputs["transcript"], self._title_of(inputs["metadata"]))
+        
+        return [
+            PipelineStage("metadata", fetch_metadata),
+            PipelineStage("segments", fetch_segments),
+            PipelineStage("transcript", join_segments, ["segments"]),
+            PipelineStage("analysis", analyze, ["transcript", "metadata"]),
+        ]
+    
+    def _recipe_from_results(self, youtube_url: str, results: Dict[str, Any]) -> Recipe:
+        if "analysis" in results:
+            analysis: RecipeAnalysis = results["analysis"]
+            final_ingredients = analysis.final_ingredients
+            cuisine_info = CuisineInfo(
+                cuisine_type=self._to_cuisine_type(analysis.cuisine_type),
+                confidence=analysis.confidence,
+                reasoning=analysis.reasoning
             )
-            
-            return recipe
-            
+        else:
+            final_ingredients = results["final_ingredients"]
+            cuisine_info = results["verified_cuisine"]
+        
+        return self._build_recipe(youtube_url, results["metadata"], results["transcript"], final_ingredients, cuisine_info)
+    
+    def run_pipeline(self, youtube_url: str, pipeline_mode: Optional[str] = None,
+                     on_stage_complete: Optional[StageCallback] = None) -> Tuple[Recipe, PipelineReport]:
+        """
+        YouTube 영상을 분석하고, 레시피와 단계별 소요 시간 리포트를 함께 반환합니다.
+        
+        pipeline_mode를 지정하면 에이전트 기본 모드 대신 해당 모드로 실행합니다.
+        on_stage_complete는 각 단계가 끝날 때마다 (단계 이름, 결과, 소요 시간)으로 호출됩니다.
+        """
+        mode = validate_pipeline_mode(pipeline_mode or self.pipeline_mode)
+        
+        # 데모 모드 확인 (URL에 'demo'가 포함된 경우)
+        if "demo" in youtube_url.lower():
+            return self._create_demo_recipe(youtube_url), PipelineReport()
+        
+        # 이 영상의 LLM 호출을 LLMGateway 대기열에서 한 요청으로 묶습니다.
+        key_token = current_request_key.set(YouTubeTranscriptExtractor.extract_video_id(youtube_url) or youtube_url)
+        try:
+            if mode == PIPELINE_MODE_SINGLE_SHOT:
+                stages = self._build_single_shot_stages(youtube_url)
+            else:
+                stages = self._build_pipeline_stages(youtube_url)
+            results, report = PipelineExecutor(stages).run(on_stage_complete=on_stage_complete)
         except Exception as e:
-            # 실패한 경우 Recipe 객체 반환
-            recipe = Recipe(
-                youtube_url=youtube_url,
-                processing_status="failed",
-                transcript=transcript if 'transcript' in locals() else None
-            )
+            PIPELINE_RUNS.inc(mode=mode, status="failed")
+            raise Exception(f"YouTube 영상 처리 중 오류 발생: {str(e)}")
+        finally:
+            current_request_key.reset(key_token)
+        
+        print(f"⏱️ 파이프라인 완료: {report.summary()}")
+        observe_pipeline(mode, report, len(results["transcript"]))
+        recipe = self._recipe_from_results(youtube_url, results)
+        self._remember_recipe(youtube_url, recipe)
+        return recipe, report
+    
+    async def arun_pipeline(self, youtube_url: str, pipeline_mode: Optional[str] = None,
+                            on_stage_complete: Optional[StageCallback] = None) -> Tuple[Recipe, PipelineReport]:
+        """
+        run_pipeline의 비동기 버전입니다.
+        
+        LLM 호출은 ainvoke로, 메타데이터/자막 수집은 비동기 I/O로 수행하여
+        요청마다 스레드를 점유하지 않습니다.
+        """
+        mode = validate_pipeline_mode(pipeline_mode or self.pipeline_mode)
+        
+        # 데모 모드 확인 (URL에 'demo'가 포함된 경우)
+        if "demo" in youtube_url.lower():
+            return self._create_demo_recipe(youtube_url), PipelineReport()
+        
+        key_token = current_request_key.set(YouTubeTranscriptExtractor.extract_video_id(youtube_url) or youtube_url)
+        try:
+            if mode == PIPELINE_MODE_SINGLE_SHOT:
+                stages = self._build_async_single_shot_stages(youtube_url)
+            else:
+                stages = self._build_async_pipeline_stages(youtube_url)
+            results, report = await PipelineExecutor(stages).arun(on_stage_complete=on_stage_complete)
+        except Exception as e:
+            PIPELINE_RUNS.inc(mode=mode, status="failed")
             raise Exception(f"YouTube 영상 처리 중 오류 발생: {str(e)}")
+        finally:
+            current_request_key.reset(key_token)
+        
+        print(f"⏱️ 파이프라인 완료: {report.summary()}")
+        observe_pipeline(mode, report, len(results["transcript"]))
+        recipe = self._recipe_from_results(youtube_url, results)
+        self._remember_recipe(youtube_url, recipe)
+        return recipe, report
+    
+    def get_cached_recipe(self, youtube_url: str) -> Optional[Recipe]:
+        """
+        이미 처리된 영상이면 저장된 레시피를 반환합니다.
+        """
+        video_id = YouTubeTranscriptExtractor.extract_video_id(youtube_url)
+        if self.recipe_store is None or not video_id:
+            return None
+        return self.recipe_store.get(video_id)
+    
+    def invalidate_cached_recipe(self, video_id: str) -> bool:
+        """
+        저장된 레시피를 삭제하여 다음 요청 때 다시 처리되도록 합니다.
+        """
+        if self.recipe_store is None:
+            return False
+        return self.recipe_store.invalidate(video_id)
+    
+    def _remember_recipe(self, youtube_url: str, recipe: Recipe) -> None:
+        video_id = YouTubeTranscriptExtractor.extract_video_id(youtube_url)
+        if self.recipe_store is None or not video_id:
+            return
+        try:
+            self.recipe_store.save(video_id, recipe)
+        except Exception as e:
+            print(f"레시피 저장 실패: {e}")
+    
+    def process_youtube_video(self, youtube_url: str, pipeline_mode: Optional[str] = None,
+                              on_stage_complete: Optional[StageCallback] = None) -> Recipe:
+        """
+        YouTube 영상을 분석하여 재료를 추출하고 정규화합니다.
+        """
+        recipe, _ = self.run_pipeline(youtube_url, pipeline_mode, on_stage_complete)
+        return recipe
+    
+    async def aprocess_youtube_video(self, youtube_url: str, pipeline_mode: Optional[str] = None,
+                                     on_stage_complete: Optional[StageCallback] = None) -> Recipe:
+        """
+        process_youtube_video의 비동기 버전입니다.
+        """
+        recipe, _ = await self.arun_pipeline(youtube_url, pipeline_mode, on_stage_complete)
+        return recipe
     
     def send_recipe_to_api(self, recipe: Recipe, user_id: str = None) -> dict:
         """
@@ -383,6 +1146,12 @@ class IngredientExtractorAgent:
         """
         return self.api_client.send_recipe_to_api(recipe, user_id)
     
+    def send_recipes_to_api(self, recipes: List[Recipe], user_id: str = None) -> dict:
+        """
+        여러 레시피를 API 서버로 일괄 전송합니다. (동시 요청 수 제한, 재시도, 실패 시 보관함 저장)
+        """
+        return self.api_client.send_recipes(recipes, user_id)
+    
     def _create_demo_recipe(self, youtube_url: str) -> Recipe:
         """
         데모용 레시피 생성
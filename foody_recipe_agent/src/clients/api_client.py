@@ -1,21 +1,244 @@
 import requests
 import os
-from typing import Dict, Any, Optional
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 import logging
 
 from models.recipe import Recipe
+from utils.rate_limiter import backoff_delay
+from utils.sqlite_utils import open_sqlite
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# 잠시 후 다시 보내면 성공할 수 있는 응답 코드
+TRANSIENT_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+# 보관함 재전송 간격(초): 실패할 때마다 두 배씩 늘리고 최대값에서 멈춤
+OUTBOX_RETRY_BASE = 30.0
+OUTBOX_RETRY_MAX = 3600.0
+
+
+def idempotency_key(payload: Dict[str, Any]) -> str:
+    """
+    같은 영상의 레시피를 한 건으로 다루기 위한 키 (영상 ID, 없으면 YouTube URL)
+    """
+    video_id = (payload.get("metadata") or {}).get("video_id")
+    return f"recipe:{video_id}" if video_id else f"recipe-url:{payload.get('youtube_url')}"
+
+
+class RecipeOutbox:
+    """
+    API 서버로 보낼 레시피 요청을 먼저 기록해 두는 SQLite 보관함(write-ahead outbox)입니다.
+
+    요청은 보내기 전에 저장되고 서버가 받은 것이 확인된 뒤에야 지워지므로,
+    API 서버가 내려가 있거나 전송 중에 프로세스가 죽어도 LLM 분석 결과가 사라지지 않습니다.
+    같은 영상(idempotency_key)은 한 항목으로 합쳐지고, 영구적인 오류(4xx)로 거절된 요청은
+    'dead' 상태로 남겨 자동으로 다시 보내지 않습니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = open_sqlite(path)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS api_outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                video_id TEXT,
+                payload TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                idempotency_key TEXT,
+                status TEXT NOT NULL DEFAULT 'pending',
+                next_attempt_at REAL NOT NULL DEFAULT 0
+            )
+            """
+        )
+        # 실패한 요청만 보관하던 이전 형식의 파일이면 컬럼을 추가
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(api_outbox)")}
+        for column, definition in (
+            ("idempotency_key", "TEXT"),
+            ("status", "TEXT NOT NULL DEFAULT 'pending'"),
+            ("next_attempt_at", "REAL NOT NULL DEFAULT 0"),
+        ):
+            if column not in columns:
+                self._connection.execute(f"ALTER TABLE api_outbox ADD COLUMN {column} {definition}")
+        self._connection.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS api_outbox_idempotency_key ON api_outbox (idempotency_key)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS api_outbox_due ON api_outbox (status, next_attempt_at)"
+        )
+
+    @staticmethod
+    def _dumps(payload: Dict[str, Any]) -> str:
+        return json.dumps(payload, ensure_ascii=False)
+
+    def add(self, payload: Dict[str, Any], hold_seconds: float = 0.0) -> int:
+        """
+        요청 본문을 보관하고 항목 ID를 반환합니다.
+
+        같은 idempotency_key의 항목이 있으면 본문을 새 결과로 바꾸고 다시 'pending'으로 되돌립니다.
+        hold_seconds 동안은 claim()이 가져가지 않으므로, 바로 보내는 중인 요청을 백그라운드 전송이
+        중복으로 보내지 않습니다.
+        """
+        now = time.time()
+        key = idempotency_key(payload)
+        video_id = (payload.get("metadata") or {}).get("video_id")
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO api_outbox (video_id, payload, attempts, last_error, created_at, updated_at, "
+                "idempotency_key, status, next_attempt_at) VALUES (?, ?, 0, NULL, ?, ?, ?, 'pending', ?) "
+                "ON CONFLICT(idempotency_key) DO UPDATE SET payload = excluded.payload, "
+                "status = 'pending', updated_at = excluded.updated_at, next_attempt_at = excluded.next_attempt_at",
+                (video_id, self._dumps(payload), now, now, key, now + hold_seconds)
+            )
+            (entry_id,) = self._connection.execute(
+                "SELECT id FROM api_outbox WHERE idempotency_key = ?", (key,)
+            ).fetchone()
+        return entry_id
+
+    def claim(self, limit: int = 100, lease_seconds: float = 60.0,
+              due_only: bool = True) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        보낼 차례가 된 'pending' 요청을 오래된 순서로 가져옵니다.
+
+        가져간 항목은 lease_seconds 동안 다른 전송자(다른 워커 프로세스 포함)가 가져가지 않습니다.
+        전송 결과를 기록하지 못하고 프로세스가 죽으면 lease가 끝난 뒤 다시 보내집니다.
+        due_only가 False면 재전송 대기 시간과 관계없이 가져옵니다.
+        """
+        now = time.time()
+        condition = "status = 'pending'" + (" AND next_attempt_at <= ?" if due_only else "")
+        params = (now, limit) if due_only else (limit,)
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._connection.execute(
+                    f"SELECT id, payload FROM api_outbox WHERE {condition} ORDER BY id LIMIT ?", params
+                ).fetchall()
+                self._connection.executemany(
+                    "UPDATE api_outbox SET next_attempt_at = ? WHERE id = ?",
+                    [(now + lease_seconds, entry_id) for entry_id, _ in rows]
+                )
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+        return [(entry_id, json.loads(payload)) for entry_id, payload in rows]
+
+    def pending(self, limit: int = 100) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        보관 중인 'pending' 요청을 오래된 순서로 반환합니다.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, payload FROM api_outbox WHERE status = 'pending' ORDER BY id LIMIT ?", (limit,)
+            ).fetchall()
+        return [(entry_id, json.loads(payload)) for entry_id, payload in rows]
+
+    def remove(self, entry_id: int, payload: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        전송이 확인된 항목을 지웁니다.
+        payload를 주면 보내는 동안 같은 영상의 새 결과로 바뀌지 않았을 때만 지웁니다.
+        """
+        with self._lock:
+            if payload is None:
+                cursor = self._connection.execute("DELETE FROM api_outbox WHERE id = ?", (entry_id,))
+            else:
+                cursor = self._connection.execute(
+                    "DELETE FROM api_outbox WHERE id = ? AND payload = ?", (entry_id, self._dumps(payload))
+                )
+            return cursor.rowcount > 0
+
+    def record_failure(self, entry_id: int, error: str) -> None:
+        """
+        일시적인 실패를 기록하고 다음 재전송 시각을 지수 백오프로 미룹니다.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute("SELECT attempts FROM api_outbox WHERE id = ?", (entry_id,)).fetchone()
+            if row is None:
+                return
+            delay = min(OUTBOX_RETRY_MAX, OUTBOX_RETRY_BASE * 2 ** row[0])
+            self._connection.execute(
+                "UPDATE api_outbox SET attempts = attempts + 1, last_error = ?, updated_at = ?, "
+                "next_attempt_at = ? WHERE id = ?",
+                (error, now, now + delay, entry_id)
+            )
+
+    def mark_dead(self, entry_id: int, error: str) -> None:
+        """
+        다시 보내도 성공할 수 없는 요청(4xx)을 'dead'로 표시합니다. 확인용으로 지우지 않고 남겨 둡니다.
+        """
+        with self._lock:
+            self._connection.execute(
+                "UPDATE api_outbox SET status = 'dead', attempts = attempts + 1, last_error = ?, updated_at = ? "
+                "WHERE id = ?",
+                (error, time.time(), entry_id)
+            )
+
+    def count(self) -> int:
+        """
+        아직 보내지 못한 'pending' 요청 수를 반환합니다.
+        """
+        with self._lock:
+            (entries,) = self._connection.execute(
+                "SELECT COUNT(*) FROM api_outbox WHERE status = 'pending'"
+            ).fetchone()
+        return entries
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            pending, dead, oldest = self._connection.execute(
+                "SELECT COALESCE(SUM(status = 'pending'), 0), COALESCE(SUM(status = 'dead'), 0), "
+                "MIN(CASE WHEN status = 'pending' THEN created_at END) FROM api_outbox"
+            ).fetchone()
+        return {
+            "pending": pending,
+            "dead": dead,
+            "oldest_pending_age": round(time.time() - oldest, 1) if oldest is not None else None
+        }
+
 
 class ApiClient:
-    def __init__(self, base_url: str = None, auth_token: str = None):
+    def __init__(self, base_url: str = None, auth_token: str = None, timeout: Optional[float] = None,
+                 max_retries: Optional[int] = None, backoff_base: float = 1.0, backoff_max: float = 30.0,
+                 max_concurrency: Optional[int] = None, batch_size: Optional[int] = None,
+                 outbox_path: Optional[str] = None):
         self.base_url = base_url or os.getenv("API_SERVER_URL", "http://localhost:4000")
         self.auth_token = auth_token or os.getenv("API_AUTH_TOKEN")
+        
+        # 요청 타임아웃(초)과 일시적인 실패(연결 오류, 429, 5xx)의 재시도 횟수
+        self.timeout = timeout if timeout is not None else float(os.getenv("API_TIMEOUT", "10"))
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv("API_MAX_RETRIES", "3"))
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        
+        # 일괄 전송 시 동시 요청 수와 queue_recipe()가 모아서 보내는 레시피 수
+        self.max_concurrency = max_concurrency or int(os.getenv("API_BATCH_CONCURRENCY", "4"))
+        self.batch_size = batch_size or int(os.getenv("API_BATCH_SIZE", "20"))
+        self._buffer: List[Recipe] = []
+        self._buffer_lock = threading.Lock()
+        
+        # 보내기 전에 요청을 기록해 두는 보관함 (경로가 없으면 보관하지 않음)
+        outbox_path = outbox_path or os.getenv("API_OUTBOX_PATH")
+        self.outbox = RecipeOutbox(outbox_path) if outbox_path else None
+        # 보내는 중인 보관함 항목을 다른 전송자가 가져가지 않는 시간 (재시도를 모두 마칠 만큼)
+        self._lease_seconds = self.timeout * (self.max_retries + 1) + self.backoff_max * self.max_retries + 30
+        
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_concurrency, pool_maxsize=self.max_concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         
         # 기본 헤더 설정
         self.session.headers.update({
@@ -29,9 +252,147 @@ class ApiClient:
                 "Authorization": f"Bearer {self.auth_token}"
             })
 
+    @staticmethod
+    def _build_payload(recipe: Recipe) -> Dict[str, Any]:
+        """
+        Recipe 객체를 API 서버가 요구하는 형태로 변환합니다.
+        """
+        return {
+            "youtube_url": str(recipe.youtube_url),
+            "title": recipe.title,
+            "metadata": {
+                "title": recipe.metadata.title if recipe.metadata else None,
+                "author_name": recipe.metadata.author_name if recipe.metadata else None,
+                "author_url": recipe.metadata.author_url if recipe.metadata else None,
+                "thumbnail_url": recipe.metadata.thumbnail_url if recipe.metadata else None,
+                "video_id": recipe.metadata.video_id if recipe.metadata else None,
+            } if recipe.metadata else None,
+            "ingredients": [
+                {
+                    "name": ingredient.name,
+                    "original_name": ingredient.original_name,
+                    "normalized_name": ingredient.normalized_name,
+                    "confidence": ingredient.confidence
+                }
+                for ingredient in recipe.ingredients
+            ],
+            "cuisine_info": {
+                "cuisine_type": recipe.cuisine_info.cuisine_type.value,
+                "confidence": recipe.cuisine_info.confidence,
+                "reasoning": recipe.cuisine_info.reasoning
+            } if recipe.cuisine_info else None,
+            "transcript": recipe.transcript,
+            "processing_status": recipe.processing_status
+        }
+    
+    @staticmethod
+    def _retry_after(response: Optional[requests.Response]) -> float:
+        try:
+            return float(response.headers.get("Retry-After", 0)) if response is not None else 0.0
+        except (TypeError, ValueError):
+            return 0.0
+    
+    def _already_delivered(self, payload: Dict[str, Any]) -> bool:
+        """
+        이전 시도에서 서버가 이미 레시피를 저장했는지 확인합니다.
+        API 서버는 같은 영상을 다시 보내면 500으로 거절하므로, 응답을 받지 못한 요청을 다시 보내기 전에 확인합니다.
+        확인할 수 없으면 False를 반환합니다.
+        """
+        try:
+            response = self.session.post(
+                f"{self.base_url}/v1/recipes/check-exists",
+                json={"youtubeUrl": payload.get("youtube_url")},
+                timeout=self.timeout
+            )
+            if response.status_code not in (200, 201):
+                return False
+            return bool((response.json() or {}).get("exists"))
+        except (requests.exceptions.RequestException, ValueError, AttributeError):
+            return False
+    
+    def _post_payload(self, payload: Dict[str, Any], redelivery: bool = False) -> Dict[str, Any]:
+        """
+        레시피 요청 본문을 API 서버로 보냅니다.
+        연결 오류, 타임아웃, 429, 5xx는 지터를 넣은 지수 백오프로 max_retries번까지 재시도합니다.
+        결과의 transient는 재시도 후에도 일시적인 오류로 실패했는지를 나타냅니다.
+        
+        요청에는 영상 ID 기반 Idempotency-Key 헤더를 붙이고, 재시도와 재전송(redelivery) 전에는
+        서버에 이미 저장되었는지 확인해 같은 레시피가 두 번 저장되지 않게 합니다.
+        """
+        # API 서버로 POST 요청 (Agent 전용 endpoint)
+        url = f"{self.base_url}/v1/recipes/from-agent"
+        headers = {"Idempotency-Key": idempotency_key(payload)}
+        attempt = 0
+        while True:
+            if (attempt > 0 or redelivery) and self._already_delivered(payload):
+                logger.info(f"Recipe already stored on API server: {payload.get('title')}")
+                return {"success": True, "data": None, "duplicate": True}
+            
+            response = None
+            try:
+                response = self.session.post(url, json=payload, headers=headers, timeout=self.timeout)
+            except requests.exceptions.RequestException as e:
+                result = {"success": False, "error": f"Network error: {str(e)}", "transient": True}
+            else:
+                # 응답 확인
+                if response.status_code == 200 or response.status_code == 201:
+                    return {
+                        "success": True,
+                        "data": response.json() if response.content else None,
+                        "status_code": response.status_code
+                    }
+                result = {
+                    "success": False,
+                    "error": f"API server returned {response.status_code}",
+                    "response": response.text,
+                    "status_code": response.status_code,
+                    "transient": response.status_code in TRANSIENT_STATUS_CODES
+                }
+            
+            if not result["transient"] or attempt >= self.max_retries:
+                return result
+            
+            delay = max(backoff_delay(attempt, self.backoff_base, self.backoff_max), self._retry_after(response))
+            logger.warning(f"Retrying recipe upload ({attempt + 1}/{self.max_retries}) in {delay:.1f}s: {result['error']}")
+            time.sleep(delay)
+            attempt += 1
+    
+    def _settle(self, entry_id: int, payload: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """
+        전송 결과를 보관함에 반영합니다.
+        성공하면 지우고, 일시적인 오류면 나중에 다시 보내도록 남기고, 영구적인 오류면 'dead'로 표시합니다.
+        """
+        if result["success"]:
+            self.outbox.remove(entry_id, payload)
+        elif result.get("transient"):
+            self.outbox.record_failure(entry_id, result["error"])
+            result["outbox_id"] = entry_id
+        else:
+            self.outbox.mark_dead(entry_id, result["error"])
+    
+    def _deliver(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        요청 본문을 보관함(outbox)에 먼저 기록한 뒤 보냅니다.
+        일시적인 오류로 끝내 실패한 요청은 보관함에 남아 OutboxFlusher나 replay_outbox()가 다시 보냅니다.
+        """
+        entry_id = self.outbox.add(payload, hold_seconds=self._lease_seconds) if self.outbox is not None else None
+        
+        result = self._post_payload(payload)
+        if entry_id is not None:
+            self._settle(entry_id, payload, result)
+        
+        if result["success"]:
+            logger.info(f"Successfully sent recipe to API server: {payload.get('title')}")
+        else:
+            logger.error(f"Failed to send recipe to API server: {result['error']} ({payload.get('title')})")
+            if "outbox_id" in result:
+                logger.warning(f"Recipe kept in outbox for later delivery: {payload.get('title')}")
+        return result
+    
     def send_recipe_to_api(self, recipe: Recipe, user_id: str = None) -> Dict[str, Any]:
         """
         분석 완료된 레시피를 API 서버로 전송합니다.
+        보관함이 있으면 보내기 전에 먼저 기록하므로 API 서버가 내려가 있어도 결과가 사라지지 않습니다.
         
         Args:
             recipe: 분석 완료된 Recipe 객체
@@ -41,73 +402,97 @@ class ApiClient:
             API 서버 응답
         """
         try:
-            # Recipe 객체를 API 서버가 요구하는 형태로 변환
-            recipe_data = {
-                "youtube_url": str(recipe.youtube_url),
-                "title": recipe.title,
-                "metadata": {
-                    "title": recipe.metadata.title if recipe.metadata else None,
-                    "author_name": recipe.metadata.author_name if recipe.metadata else None,
-                    "author_url": recipe.metadata.author_url if recipe.metadata else None,
-                    "thumbnail_url": recipe.metadata.thumbnail_url if recipe.metadata else None,
-                    "video_id": recipe.metadata.video_id if recipe.metadata else None,
-                } if recipe.metadata else None,
-                "ingredients": [
-                    {
-                        "name": ingredient.name,
-                        "original_name": ingredient.original_name,
-                        "normalized_name": ingredient.normalized_name,
-                        "confidence": ingredient.confidence
-                    }
-                    for ingredient in recipe.ingredients
-                ],
-                "cuisine_info": {
-                    "cuisine_type": recipe.cuisine_info.cuisine_type.value,
-                    "confidence": recipe.cuisine_info.confidence,
-                    "reasoning": recipe.cuisine_info.reasoning
-                } if recipe.cuisine_info else None,
-                "transcript": recipe.transcript,
-                "processing_status": recipe.processing_status
-            }
-            
-            # API 서버로 POST 요청 (Agent 전용 endpoint)
-            url = f"{self.base_url}/v1/recipes/from-agent"
-            
-            logger.info(f"Sending recipe to API server: {url}")
-            logger.debug(f"Recipe data: {recipe_data}")
+            recipe_data = self._build_payload(recipe)
             
-            response = self.session.post(url, json=recipe_data)
+            logger.info(f"Sending recipe to API server: {self.base_url}/v1/recipes/from-agent")
+            # 자막 전체가 로그에 남지 않도록 크기만 기록
+            logger.debug(
+                f"Recipe payload: {len(recipe_data['ingredients'])} ingredients, "
+                f"transcript {len(recipe_data['transcript'] or '')} chars"
+            )
             
-            # 응답 확인
-            if response.status_code == 200 or response.status_code == 201:
-                logger.info(f"Successfully sent recipe to API server: {recipe.title}")
-                return {
-                    "success": True,
-                    "data": response.json(),
-                    "status_code": response.status_code
-                }
-            else:
-                logger.error(f"Failed to send recipe to API server: {response.status_code}")
-                logger.error(f"Response: {response.text}")
-                return {
-                    "success": False,
-                    "error": f"API server returned {response.status_code}",
-                    "response": response.text,
-                    "status_code": response.status_code
-                }
+            return self._deliver(recipe_data)
                 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Network error sending recipe to API server: {e}")
-            return {
-                "success": False,
-                "error": f"Network error: {str(e)}"
-            }
         except Exception as e:
             logger.error(f"Unexpected error sending recipe to API server: {e}")
             return {
                 "success": False,
                 "error": f"Unexpected error: {str(e)}"
             }
+    
+    def send_recipes(self, recipes: List[Recipe], user_id: str = None) -> Dict[str, Any]:
+        """
+        여러 레시피를 최대 max_concurrency개씩 동시에 전송합니다.
+        재시도 후에도 일시적인 오류로 실패한 레시피는 보관함(outbox)에 남습니다.
+        
+        Returns:
+            전체 성공 여부, 성공/실패/보관 수와 레시피별 결과
+        """
+        if not recipes:
+            return {"success": True, "total": 0, "sent": 0, "failed": 0, "spilled": 0, "results": []}
+        
+        logger.info(f"Sending {len(recipes)} recipes to API server (concurrency {self.max_concurrency})")
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(recipes))) as executor:
+            outcomes = list(executor.map(lambda recipe: self.send_recipe_to_api(recipe, user_id), recipes))
+        
+        results = [
+            {"youtube_url": str(recipe.youtube_url), "title": recipe.title, **outcome}
+            for recipe, outcome in zip(recipes, outcomes)
+        ]
+        sent = sum(1 for result in results if result["success"])
+        return {
+            "success": sent == len(results),
+            "total": len(results),
+            "sent": sent,
+            "failed": len(results) - sent,
+            "spilled": sum(1 for result in results if "outbox_id" in result),
+            "results": results
+        }
+    
+    def queue_recipe(self, recipe: Recipe) -> Optional[Dict[str, Any]]:
+        """
+        레시피를 버퍼에 모으고, batch_size개가 모이면 한꺼번에 전송합니다.
+        전송했으면 send_recipes 결과를, 아직 모으는 중이면 None을 반환합니다.
+        버퍼는 메모리에만 있으므로 보관함이 있으면 레시피를 먼저 보관함에 기록합니다.
+        """
+        if self.outbox is not None:
+            self.outbox.add(self._build_payload(recipe), hold_seconds=self._lease_seconds)
+        with self._buffer_lock:
+            self._buffer.append(recipe)
+            if len(self._buffer) < self.batch_size:
+                return None
+            batch, self._buffer = self._buffer, []
+        return self.send_recipes(batch)
+    
+    def flush(self) -> Dict[str, Any]:
+        """
+        버퍼에 남아 있는 레시피를 모두 전송합니다.
+        """
+        with self._buffer_lock:
+            batch, self._buffer = self._buffer, []
+        return self.send_recipes(batch)
+    
+    def replay_outbox(self, limit: int = 100, due_only: bool = False) -> Dict[str, Any]:
+        """
+        보관함에 있는 요청을 다시 보냅니다. 성공한 요청은 보관함에서 지웁니다.
+        서버에 이미 저장된 레시피는 다시 보내지 않고 전송된 것으로 처리합니다. (at-least-once)
+        due_only가 True면 재전송 시각이 된 요청만 보냅니다.
+        """
+        if self.outbox is None:
+            return {"sent": 0, "failed": 0, "remaining": 0}
+        
+        sent = failed = 0
+        for entry_id, payload in self.outbox.claim(limit, self._lease_seconds, due_only=due_only):
+            result = self._post_payload(payload, redelivery=True)
+            self._settle(entry_id, payload, result)
+            if result["success"]:
+                sent += 1
+            else:
+                failed += 1
+        
+        if sent or failed:
+            logger.info(f"Replayed recipe outbox: {sent} sent, {failed} failed")
+        return {"sent": sent, "failed": failed, "remaining": self.outbox.count()}
 
     def test_connection(self) -> bool:
         """
@@ -128,4 +513,54 @@ class ApiClient:
                 response = self.session.get(url, timeout=5)
                 return response.status_code < 500  # 4xx도 연결은 성공
             except:
-                return False
\ No newline at end of file
+                return False
+
+
+class OutboxFlusher:
+    """
+    보관함(outbox)에 남은 요청을 주기적으로 API 서버로 보내는 백그라운드 스레드입니다.
+    재전송 시각이 된 요청만 보내므로 API 서버가 오래 내려가 있어도 요청이 몰리지 않습니다.
+    """
+
+    def __init__(self, client: ApiClient, interval: Optional[float] = None, batch_size: int = 50):
+        self.client = client
+        self.interval = interval if interval is not None else float(os.getenv("API_OUTBOX_FLUSH_INTERVAL", "10"))
+        self.batch_size = batch_size
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self.client.outbox is None or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="api-outbox-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def flush_once(self) -> Dict[str, Any]:
+        """
+        재전송 시각이 된 요청을 batch_size개씩 더 이상 보낼 것이 없을 때까지 보냅니다.
+        """
+        sent = failed = 0
+        while not self._stop_event.is_set():
+            result = self.client.replay_outbox(self.batch_size, due_only=True)
+            sent += result["sent"]
+            failed += result["failed"]
+            if result["sent"] + result["failed"] < self.batch_size:
+                break
+        return {"sent": sent, "failed": failed, "remaining": self.client.outbox.count()}
+
+    def _run(self) -> None:
+        # 시작 직후에도 이전 실행에서 남은 요청을 보냄
+        while True:
+            try:
+                self.flush_once()
+            except Exception as e:
+                logger.error(f"Recipe outbox flush failed: {e}")
+            if self._stop_event.wait(self.interval):
+                return
@@ -0,0 +1,326 @@
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterator, List, Optional
+
+import openai
+from langchain.schema import BaseMessage
+
+from utils.rate_limiter import backoff_delay
+from utils.transcript_chunker import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# 현재 LLM 호출이 어느 요청(영상)에 속하는지 나타내는 키 (공정 대기열에서 사용)
+current_request_key: contextvars.ContextVar[str] = contextvars.ContextVar("llm_request_key", default="")
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """
+    429 응답의 Retry-After 헤더(초)를 읽습니다.
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def token_usage(response: Any) -> Dict[str, int]:
+    """
+    LLM 응답의 토큰 사용량(input_tokens, output_tokens, total_tokens)을 반환합니다.
+    사용량을 알려주지 않는 모델이면 빈 딕셔너리를 반환합니다.
+    """
+    usage = getattr(response, "usage_metadata", None)
+    return usage if isinstance(usage, dict) else {}
+
+
+def is_retryable(error: Exception) -> bool:
+    """
+    재시도할 만한 오류인지 확인합니다. (429, 5xx, 연결 오류, 타임아웃)
+    """
+    if isinstance(error, (openai.RateLimitError, openai.APIConnectionError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code >= 500
+    return False
+
+
+class _Budget:
+    """
+    분당 한도를 가진 예약형 토큰 버킷입니다.
+
+    reserve()는 사용량을 바로 차감하고(잔량이 음수가 될 수 있음), 잔량이 다시 0 이상이 될 때까지
+    기다려야 하는 시간을 반환합니다. 한도가 0이면 제한하지 않습니다.
+    """
+
+    def __init__(self, per_minute: float):
+        self.per_minute = per_minute
+        self._lock = threading.Lock()
+        self._available = float(per_minute)
+        self._updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._available = min(float(self.per_minute), self._available + elapsed * self.per_minute / 60)
+        self._updated_at = now
+
+    def reserve(self, amount: float) -> float:
+        if not self.per_minute:
+            return 0.0
+        with self._lock:
+            self._refill(time.monotonic())
+            self._available -= amount
+            if self._available >= 0:
+                return 0.0
+            return -self._available * 60 / self.per_minute
+
+    def adjust(self, amount: float) -> None:
+        """
+        예상 사용량과 실제 사용량의 차이를 반영합니다. (양수면 추가 차감)
+        """
+        if not self.per_minute:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self._available -= amount
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._available
+
+
+class _Ticket:
+    def __init__(self, key: str, grant: Callable[[], None]):
+        self.key = key
+        self.grant = grant
+
+
+class LLMGateway:
+    """
+    모든 LLM 호출이 거쳐가는 관문입니다.
+
+    - 동시 호출 수를 max_concurrency로 제한하고, 대기 중인 호출은 요청(영상)별로 번갈아 실행하여
+      긴 영상 하나가 청크 호출로 대기열을 독차지하지 않게 합니다.
+    - 분당 요청 수(requests_per_minute)와 분당 토큰 수(tokens_per_minute)를 넘지 않도록 기다립니다.
+      토큰은 프롬프트 토큰 + expected_output_tokens로 예약한 뒤 응답의 실제 사용량으로 보정합니다.
+    - 429, 5xx, 연결 오류는 지터를 넣은 지수 백오프로 max_retries번까지 재시도합니다.
+      (429 응답에 Retry-After가 있으면 그만큼 기다립니다)
+    - 한도 대기와 재시도 대기 중에는 동시 호출 자리를 비워 두고, 대기가 끝나면 다시 줄을 섭니다.
+      실패한 시도의 토큰 예약은 돌려받습니다.
+    동기 호출(invoke)과 비동기 호출(ainvoke)이 같은 한도와 대기열을 공유합니다.
+    """
+
+    def __init__(self, requests_per_minute: int = 500, tokens_per_minute: int = 200000, max_concurrency: int = 8,
+                 max_retries: int = 3, backoff_base: float = 1.0, backoff_max: float = 30.0,
+                 expected_output_tokens: int = 500, model_name: str = "gpt-4o-mini"):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency는 1 이상이어야 합니다.")
+
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.expected_output_tokens = expected_output_tokens
+        self.model_name = model_name
+        self._requests = _Budget(requests_per_minute)
+        self._tokens = _Budget(tokens_per_minute)
+
+        self._lock = threading.Lock()
+        self._active = 0
+        self._waiting: "OrderedDict[str, Deque[_Ticket]]" = OrderedDict()
+
+        self.calls = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.failures = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.total_wait_seconds = 0.0
+
+    # 공정 대기열
+
+    def _dispatch(self) -> None:
+        """
+        빈 자리가 있으면 대기 중인 요청 키를 돌아가며 하나씩 실행을 허가합니다. (lock 안에서 호출)
+        """
+        while self._active < self.max_concurrency and self._waiting:
+            key, tickets = next(iter(self._waiting.items()))
+            ticket = tickets.popleft()
+            del self._waiting[key]
+            if tickets:
+                self._waiting[key] = tickets  # 남은 호출은 다른 요청 뒤로
+            self._active += 1
+            ticket.grant()
+
+    def _enqueue(self, ticket: _Ticket) -> None:
+        with self._lock:
+            self._waiting.setdefault(ticket.key, deque()).append(ticket)
+            self._dispatch()
+
+    def _withdraw(self, ticket: _Ticket) -> bool:
+        """
+        아직 허가되지 않은 호출을 대기열에서 뺍니다. 이미 허가되었으면 False를 반환합니다.
+        """
+        with self._lock:
+            tickets = self._waiting.get(ticket.key)
+            if tickets and ticket in tickets:
+                tickets.remove(ticket)
+                if not tickets:
+                    del self._waiting[ticket.key]
+                return True
+            return False
+
+    def _release(self) -> None:
+        with self._lock:
+            self._active -= 1
+            self._dispatch()
+
+    @contextmanager
+    def _slot(self) -> Iterator[None]:
+        granted = threading.Event()
+        self._enqueue(_Ticket(current_request_key.get(), granted.set))
+        granted.wait()
+        try:
+            yield
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def _aslot(self) -> AsyncIterator[None]:
+        loop = asyncio.get_running_loop()
+        granted = loop.create_future()
+
+        def grant() -> None:
+            loop.call_soon_threadsafe(lambda: granted.done() or granted.set_result(None))
+
+        ticket = _Ticket(current_request_key.get(), grant)
+        self._enqueue(ticket)
+        try:
+            await granted
+        except asyncio.CancelledError:
+            if not self._withdraw(ticket):
+                self._release()
+            raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    # 분당 한도
+
+    def _estimate_tokens(self, messages: List[BaseMessage]) -> int:
+        prompt = "".join(str(message.content) for message in messages)
+        return estimate_tokens(prompt, self.model_name) + self.expected_output_tokens
+
+    def _reserve(self, estimated_tokens: int) -> float:
+        wait = max(self._requests.reserve(1), self._tokens.reserve(estimated_tokens))
+        if wait:
+            with self._lock:
+                self.total_wait_seconds += wait
+        return wait
+
+    def _record_usage(self, response: Any, estimated_tokens: int) -> None:
+        usage = token_usage(response)
+        with self._lock:
+            self.calls += 1
+            self.prompt_tokens += usage.get("input_tokens", 0)
+            self.completion_tokens += usage.get("output_tokens", 0)
+        if usage.get("total_tokens"):
+            self._tokens.adjust(usage["total_tokens"] - estimated_tokens)
+
+    def _retry_delay(self, error: Exception, attempt: int, estimated_tokens: int) -> Optional[float]:
+        """
+        실패한 시도의 토큰 예약을 돌려주고 재시도 전 대기 시간을 반환합니다.
+        재시도하지 않을 오류거나 횟수를 다 썼으면 None을 반환합니다.
+        """
+        self._tokens.adjust(-estimated_tokens)
+        with self._lock:
+            if isinstance(error, openai.RateLimitError):
+                self.rate_limited += 1
+            if not is_retryable(error) or attempt >= self.max_retries:
+                self.failures += 1
+                return None
+            self.retries += 1
+
+        delay = backoff_delay(attempt, self.backoff_base, self.backoff_max)
+        retry_after = _retry_after(error) if isinstance(error, openai.RateLimitError) else None
+        delay = max(delay, retry_after or 0.0)
+        logger.warning(f"Retrying LLM call ({attempt + 1}/{self.max_retries}) in {delay:.1f}s: {type(error).__name__}")
+        return delay
+
+    # 호출
+
+    def invoke(self, llm: Any, messages: List[BaseMessage]) -> Any:
+        """
+        한도와 대기열을 지키면서 llm.invoke(messages)를 호출합니다.
+        """
+        estimated_tokens = self._estimate_tokens(messages)
+        attempt = 0
+        while True:
+            # 한도 대기와 재시도 대기는 자리를 차지하지 않은 채로 함
+            wait = self._reserve(estimated_tokens)
+            if wait:
+                time.sleep(wait)
+            try:
+                with self._slot():
+                    response = llm.invoke(messages)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, estimated_tokens)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+                continue
+            self._record_usage(response, estimated_tokens)
+            return response
+
+    async def ainvoke(self, llm: Any, messages: List[BaseMessage]) -> Any:
+        """
+        invoke의 비동기 버전입니다.
+        """
+        estimated_tokens = self._estimate_tokens(messages)
+        attempt = 0
+        while True:
+            wait = self._reserve(estimated_tokens)
+            if wait:
+                await asyncio.sleep(wait)
+            try:
+                async with self._aslot():
+                    response = await llm.ainvoke(messages)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, estimated_tokens)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            self._record_usage(response, estimated_tokens)
+            return response
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            waiting = sum(len(tickets) for tickets in self._waiting.values())
+            return {
+                "max_concurrency": self.max_concurrency,
+                "active": self._active,
+                "waiting": waiting,
+                "waiting_requests": len(self._waiting),
+                "requests_per_minute": self._requests.per_minute,
+                "tokens_per_minute": self._tokens.per_minute,
+                "available_tokens": round(self._tokens.available) if self._tokens.per_minute else None,
+                "calls": self.calls,
+                "retries": self.retries,
+                "rate_limited": self.rate_limited,
+                "failures": self.failures,
+                "prompt_tokens": self.prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+                "total_wait_seconds": round(self.total_wait_seconds, 3),
+            }
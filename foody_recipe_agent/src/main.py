@@ -1,11 +1,31 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import ValidationError
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, ValidationError
 import uvicorn
-from typing import Dict, Any
+import asyncio
+import json
+import os
+from typing import AsyncIterator, Dict, Any, Optional, Tuple
 
-from models import IngredientExtractionRequest, IngredientExtractionResponse, Recipe
+from models import (
+    IngredientExtractionRequest, IngredientExtractionResponse, Recipe,
+    BatchExtractionRequest, BatchExtractionItem, BatchExtractionResponse, ExtractionJob, ExtractionTimings
+)
 from agents import IngredientExtractorAgent
+from clients.api_client import ApiClient, OutboxFlusher
+from utils.extraction_pool import ExtractionPool, ExtractionQueueFullError
+from utils.transcript_cache import TranscriptCache
+from utils.llm_cache import create_llm_cache
+from utils.recipe_store import RecipeStore
+from utils.ingredient_dictionary import IngredientDictionary
+from utils.job_queue import JobQueue, JobWorkers
+from utils.pipeline import PipelineReport, StageCallback, StageTiming
+from utils.metrics import METRICS, build_extraction_timings
+from utils.youtube_transcript import YouTubeTranscriptExtractor
+from utils.youtube_metadata import YouTubeMetadataExtractor
+from utils.http_client import HttpClients
+from utils.rate_limiter import RateLimiter
 
 app = FastAPI(
     title="Foody Recipe Agent",
@@ -22,8 +42,131 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 로컬 캐시 저장 경로 (foody_recipe_agent/cache)
+CACHE_DIR = os.getenv("CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "cache"))
+
+# YouTube(oEmbed, 자막) 요청용 공유 HTTP 연결 풀 (YOUTUBE_BASE_URL: 가짜 YouTube 서버 등 대체 주소)
+http_clients = HttpClients(
+    pool_size=int(os.getenv("HTTP_POOL_SIZE", "20")),
+    connect_timeout=float(os.getenv("HTTP_CONNECT_TIMEOUT", "5")),
+    read_timeout=float(os.getenv("HTTP_READ_TIMEOUT", "10")),
+    youtube_base_url=os.getenv("YOUTUBE_BASE_URL") or None
+)
+YouTubeTranscriptExtractor.configure_http_clients(http_clients)
+YouTubeMetadataExtractor.configure_http_clients(http_clients)
+
+# YouTube 자막 요청 속도 제한 (YOUTUBE_RATE_LIMIT_PATH를 비우면 프로세스 안에서만 공유)
+YOUTUBE_RATE_LIMIT_PATH = os.getenv("YOUTUBE_RATE_LIMIT_PATH", os.path.join(CACHE_DIR, "youtube_rate_limit.sqlite3"))
+youtube_rate_limiter = RateLimiter(
+    rate=float(os.getenv("YOUTUBE_RATE_LIMIT", "1")),
+    burst=int(os.getenv("YOUTUBE_RATE_BURST", "5")),
+    path=YOUTUBE_RATE_LIMIT_PATH or None,
+    cooldown_seconds=float(os.getenv("YOUTUBE_BLOCK_COOLDOWN", "300")),
+    max_cooldown_seconds=float(os.getenv("YOUTUBE_BLOCK_MAX_COOLDOWN", "3600"))
+)
+YouTubeTranscriptExtractor.configure_rate_limiter(
+    youtube_rate_limiter,
+    max_retries=int(os.getenv("YOUTUBE_MAX_RETRIES", "3"))
+)
+
+# 자막 캐시 (TRANSCRIPT_CACHE_PATH를 빈 값으로 두면 사용하지 않음)
+TRANSCRIPT_CACHE_PATH = os.getenv("TRANSCRIPT_CACHE_PATH", os.path.join(CACHE_DIR, "transcripts.sqlite3"))
+transcript_cache = None
+if TRANSCRIPT_CACHE_PATH:
+    transcript_cache = TranscriptCache(
+        TRANSCRIPT_CACHE_PATH,
+        ttl_seconds=float(os.getenv("TRANSCRIPT_CACHE_TTL", str(7 * 24 * 3600))),
+        max_entries=int(os.getenv("TRANSCRIPT_CACHE_MAX_ENTRIES", "5000"))
+    )
+YouTubeTranscriptExtractor.configure_cache(transcript_cache)
+
+# 영상별 자막 목록 메모리 캐시 (자막 추출과 /video-info가 같은 목록 조회 결과를 재사용)
+YouTubeTranscriptExtractor.configure_listing_cache(
+    ttl_seconds=float(os.getenv("TRANSCRIPT_LISTING_TTL", "600")),
+    max_entries=int(os.getenv("TRANSCRIPT_LISTING_MAX_ENTRIES", "256"))
+)
+
+# LLM 단계 결과 캐시 (LLM_CACHE_BACKEND: memory, disk, none)
+llm_cache = create_llm_cache(
+    os.getenv("LLM_CACHE_BACKEND", "memory"),
+    max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1024")),
+    directory=os.getenv("LLM_CACHE_DIR", os.path.join(CACHE_DIR, "llm"))
+)
+
+# 처리 완료된 레시피 저장소 (RECIPE_STORE_PATH를 빈 값으로 두면 사용하지 않음)
+RECIPE_STORE_PATH = os.getenv("RECIPE_STORE_PATH", os.path.join(CACHE_DIR, "recipes.sqlite3"))
+recipe_store = RecipeStore(RECIPE_STORE_PATH) if RECIPE_STORE_PATH else None
+
+# 로컬 재료명 정규화 사전 (INGREDIENT_DICTIONARY_PATH를 빈 값으로 두면 사용하지 않음)
+INGREDIENT_DICTIONARY_PATH = os.getenv("INGREDIENT_DICTIONARY_PATH", os.path.join(CACHE_DIR, "ingredient_aliases.json"))
+ingredient_dictionary = None
+if INGREDIENT_DICTIONARY_PATH:
+    ingredient_dictionary = IngredientDictionary(
+        INGREDIENT_DICTIONARY_PATH,
+        max_distance=int(os.getenv("INGREDIENT_FUZZY_DISTANCE", "1"))
+    )
+
+# API 서버(레시피 저장) 클라이언트 - 레시피를 보내기 전에 보관함에 기록하고,
+# 보내지 못한 레시피는 백그라운드에서 API_OUTBOX_FLUSH_INTERVAL초마다 다시 보냄
+# (API_OUTBOX_PATH를 빈 값으로 두면 보관하지 않음)
+API_OUTBOX_PATH = os.getenv("API_OUTBOX_PATH", os.path.join(CACHE_DIR, "api_outbox.sqlite3"))
+api_client = ApiClient(outbox_path=API_OUTBOX_PATH or None)
+outbox_flusher = OutboxFlusher(api_client)
+
 # AI 에이전트 인스턴스
-agent = IngredientExtractorAgent()
+agent = IngredientExtractorAgent(
+    llm_cache=llm_cache,
+    recipe_store=recipe_store,
+    ingredient_dictionary=ingredient_dictionary,
+    api_client=api_client
+)
+
+# 추출 실행 방식: "threadpool" (동기 파이프라인을 워커 스레드에서 실행) 또는 "async" (ainvoke 기반)
+EXTRACTION_MODE = os.getenv("EXTRACTION_MODE", "threadpool")
+
+# 추출 파이프라인 워커 풀 (이벤트 루프 블로킹 방지 및 동시 실행 제한)
+extraction_pool = ExtractionPool(
+    max_workers=int(os.getenv("EXTRACTION_MAX_WORKERS", "4")),
+    max_queue_size=int(os.getenv("EXTRACTION_MAX_QUEUE", "100"))
+)
+
+
+# 배치 추출 설정 (요청당 최대 URL 수, 배치 하나가 동시에 실행할 최대 작업 수)
+BATCH_MAX_URLS = int(os.getenv("BATCH_MAX_URLS", "500"))
+BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_MAX_CONCURRENCY", str(extraction_pool.max_workers)))
+
+# 백그라운드 작업 큐 (POST /jobs로 등록하고 GET /jobs/{job_id}로 상태 조회)
+JOB_QUEUE_PATH = os.getenv("JOB_QUEUE_PATH", os.path.join(CACHE_DIR, "jobs.sqlite3"))
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+job_queue = JobQueue(JOB_QUEUE_PATH)
+
+YOUTUBE_URL_PREFIXES = ('https://www.youtube.com/', 'https://youtu.be/')
+
+
+async def handle_job(job: ExtractionJob) -> Tuple[Recipe, bool]:
+    recipe, cached, _ = await extract_recipe(str(job.youtube_url), job.pipeline_mode, job.force_refresh)
+    return recipe, cached
+
+
+job_workers = JobWorkers(job_queue, handle_job, workers=JOB_WORKERS)
+
+
+@app.on_event("startup")
+async def start_job_workers():
+    # 이전 실행에서 처리 중에 중단된 작업을 다시 대기열에 넣음
+    requeued = job_queue.requeue_interrupted()
+    if requeued:
+        print(f"🔁 중단된 작업 {requeued}개를 다시 처리합니다.")
+    job_workers.start()
+    outbox_flusher.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_extraction_pool():
+    await job_workers.stop()
+    outbox_flusher.stop()
+    extraction_pool.shutdown(wait=False)
+    await http_clients.aclose()
 
 
 @app.get("/")
@@ -36,6 +179,139 @@ async def health_check():
     return {"status": "healthy", "message": "Service is running"}
 
 
+@app.get("/stats")
+async def get_stats():
+    """
+    워커 풀 대기열 길이 등 서비스 상태 지표를 반환합니다.
+    """
+    return {
+        "extraction_mode": EXTRACTION_MODE,
+        "pipeline_mode": agent.pipeline_mode,
+        "extraction_pool": extraction_pool.stats(),
+        "youtube_rate_limiter": youtube_rate_limiter.stats(),
+        "transcript_cache": transcript_cache.stats() if transcript_cache else None,
+        "llm_cache": llm_cache.stats() if llm_cache else None,
+        "recipe_store": recipe_store.stats() if recipe_store else None,
+        "ingredient_dictionary": ingredient_dictionary.stats() if ingredient_dictionary else None,
+        "cuisine_verification": agent.verification_stats(),
+        "llm_gateway": agent.llm_gateway.stats(),
+        "api_outbox": api_client.outbox.stats() if api_client.outbox else None,
+        "jobs": job_queue.stats()
+    }
+
+
+def cache_lookup_samples():
+    """
+    캐시별 적중/실패 횟수입니다.
+    """
+    caches = {
+        "transcript": transcript_cache,
+        "llm": llm_cache,
+        "recipe_store": recipe_store,
+        "ingredient_dictionary": ingredient_dictionary,
+    }
+    for name, cache in caches.items():
+        if cache is None:
+            continue
+        stats = cache.stats()
+        yield {"cache": name, "result": "hit"}, stats["hits"] + stats.get("fuzzy_hits", 0)
+        yield {"cache": name, "result": "miss"}, stats["misses"]
+
+
+METRICS.register_callback(
+    "foody_cache_lookups_total", "캐시 조회 횟수", ("cache", "result"), cache_lookup_samples, kind="counter"
+)
+METRICS.register_callback(
+    "foody_extraction_pool_tasks", "추출 워커 풀 작업 수", ("state",),
+    lambda: (({"state": state}, extraction_pool.stats()[state]) for state in ("active", "queued"))
+)
+METRICS.register_callback(
+    "foody_jobs", "상태별 백그라운드 작업 수", ("status",),
+    lambda: (({"status": status}, count) for status, count in job_queue.stats().items())
+)
+METRICS.register_callback(
+    "foody_llm_gateway_calls", "LLMGateway 실행 중/대기 중 호출 수", ("state",),
+    lambda: (({"state": state}, agent.llm_gateway.stats()[state]) for state in ("active", "waiting"))
+)
+METRICS.register_callback(
+    "foody_cuisine_verifications_total",
+    "음식 장르 2차 검증 횟수 (skipped: 생략, unchanged: 검증 후 유지, changed: 검증 후 변경)", ("outcome",),
+    lambda: (
+        ({"outcome": outcome}, agent.verification_stats()[outcome]) for outcome in ("skipped", "unchanged", "changed")
+    ),
+    kind="counter"
+)
+METRICS.register_callback(
+    "foody_youtube_circuit_open", "YouTube 요청 중단 여부 (1이면 중단)", (),
+    lambda: [({}, 1 if youtube_rate_limiter.stats()["circuit"] == "open" else 0)]
+)
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """
+    Prometheus 텍스트 형식의 지표를 반환합니다.
+    (단계별 소요 시간, LLM 호출/토큰 수, 자막 길이, 캐시 적중 수 등)
+    """
+    return PlainTextResponse(METRICS.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+async def run_extraction(youtube_url: str, pipeline_mode: str = None,
+                         on_stage_complete: Optional[StageCallback] = None) -> Tuple[Recipe, PipelineReport]:
+    """
+    설정된 실행 방식에 따라 추출 파이프라인을 실행합니다.
+    """
+    if EXTRACTION_MODE == "async":
+        return await extraction_pool.run_async(agent.arun_pipeline, youtube_url, pipeline_mode, on_stage_complete)
+    return await extraction_pool.run(agent.run_pipeline, youtube_url, pipeline_mode, on_stage_complete)
+
+
+async def extract_recipe(youtube_url: str, pipeline_mode: str = None, force_refresh: bool = False,
+                         on_stage_complete: Optional[StageCallback] = None
+                         ) -> Tuple[Recipe, bool, Optional[ExtractionTimings]]:
+    """
+    레시피를 추출합니다. 이미 처리된 영상이면 저장된 결과를 바로 반환합니다.
+    
+    Returns:
+        (레시피, 저장된 결과 사용 여부, 단계별 소요 시간/토큰 사용량)
+    """
+    if not force_refresh:
+        cached_recipe = agent.get_cached_recipe(youtube_url)
+        if cached_recipe is not None:
+            return cached_recipe, True, None
+    
+    # 재료 추출 처리 (동시 실행 제한 적용)
+    recipe, report = await run_extraction(youtube_url, pipeline_mode, on_stage_complete)
+    return recipe, False, build_extraction_timings(report, recipe.transcript)
+
+
+def format_sse(event: str, data: Any) -> str:
+    """
+    Server-Sent Events 형식의 메시지를 만듭니다.
+    """
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def stage_event_data(stage: str, value: Any, timing: StageTiming) -> Dict[str, Any]:
+    """
+    파이프라인 단계 결과를 스트리밍 이벤트 데이터로 변환합니다.
+    """
+    if stage == "segments":
+        result = {"count": len(value)}
+    elif stage == "filtered_transcript":
+        # 필터링된 자막 본문 대신 압축률 등 통계만 전송
+        result = value.model_dump(mode="json", exclude={"text"})
+    elif isinstance(value, BaseModel):
+        result = value.model_dump(mode="json")
+    elif stage == "transcript":
+        # 전체 자막은 완료 이벤트의 recipe에 포함되므로 길이와 앞부분만 전송
+        result = {"length": len(value), "preview": value[:200]}
+    else:
+        result = value
+    
+    return {"stage": stage, "duration": round(timing.duration, 3), "result": result}
+
+
 @app.post("/extract-ingredients", response_model=IngredientExtractionResponse)
 async def extract_ingredients(request: IngredientExtractionRequest):
     """
@@ -43,18 +319,23 @@ async def extract_ingredients(request: IngredientExtractionRequest):
     """
     try:
         # 유튜브 URL 유효성 검사
-        if not str(request.youtube_url).startswith(('https://www.youtube.com/', 'https://youtu.be/')):
+        if not str(request.youtube_url).startswith(YOUTUBE_URL_PREFIXES):
             raise HTTPException(
                 status_code=400,
                 detail="유효한 YouTube URL을 입력해주세요."
             )
         
-        # 재료 추출 처리
-        recipe = agent.process_youtube_video(str(request.youtube_url))
+        recipe, cached, timings = await extract_recipe(
+            str(request.youtube_url),
+            request.pipeline_mode,
+            request.force_refresh
+        )
         
         return IngredientExtractionResponse(
             success=True,
-            recipe=recipe
+            recipe=recipe,
+            cached=cached,
+            timings=timings
         )
         
     except ValidationError as e:
@@ -62,6 +343,11 @@ async def extract_ingredients(request: IngredientExtractionRequest):
             status_code=400,
             detail=f"입력 데이터 검증 오류: {str(e)}"
         )
+    except ExtractionQueueFullError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e)
+        )
     except Exception as e:
         error_message = str(e) if e else "알 수 없는 오류가 발생했습니다."
         return IngredientExtractionResponse(
@@ -71,6 +357,201 @@ async def extract_ingredients(request: IngredientExtractionRequest):
         )
 
 
+@app.post("/extract-ingredients/stream")
+async def extract_ingredients_stream(request: IngredientExtractionRequest):
+    """
+    YouTube 영상에서 재료를 추출하면서 단계별 결과를 Server-Sent Events로 전송합니다.
+    
+    이벤트 종류:
+    - stage: 파이프라인 단계 완료 (metadata, segments, transcript, filtered_transcript, raw_ingredients,
+      normalized, final_ingredients, cuisine, verified_cuisine 또는 single_shot 모드의 analysis)
+    - completed: 최종 결과 (IngredientExtractionResponse 형식)
+    - error: 처리 실패
+    """
+    youtube_url = str(request.youtube_url)
+    if not youtube_url.startswith(YOUTUBE_URL_PREFIXES):
+        raise HTTPException(
+            status_code=400,
+            detail="유효한 YouTube URL을 입력해주세요."
+        )
+    
+    async def event_stream() -> AsyncIterator[str]:
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue = asyncio.Queue()
+        
+        def on_stage_complete(stage: str, value: Any, timing: StageTiming):
+            # 워커 스레드에서 호출될 수 있으므로 이벤트 루프에 넘겨서 큐에 넣음
+            loop.call_soon_threadsafe(events.put_nowait, format_sse("stage", stage_event_data(stage, value, timing)))
+        
+        async def run():
+            try:
+                recipe, cached, timings = await extract_recipe(
+                    youtube_url, request.pipeline_mode, request.force_refresh, on_stage_complete
+                )
+                response = IngredientExtractionResponse(success=True, recipe=recipe, cached=cached, timings=timings)
+                events.put_nowait(format_sse("completed", response.model_dump(mode="json")))
+            except Exception as e:
+                events.put_nowait(format_sse("error", {"error": str(e) or "알 수 없는 오류가 발생했습니다."}))
+            events.put_nowait(None)
+        
+        yield format_sse("queued", {"youtube_url": youtube_url, "extraction_pool": extraction_pool.stats()})
+        
+        # 클라이언트 연결이 끊겨도 처리는 끝까지 진행되어 결과가 저장됨
+        task = asyncio.create_task(run())
+        while True:
+            message = await events.get()
+            if message is None:
+                break
+            yield message
+        await task
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.post("/extract-ingredients/batch", response_model=BatchExtractionResponse)
+async def extract_ingredients_batch(request: BatchExtractionRequest):
+    """
+    여러 YouTube 영상에서 재료를 한 번에 추출합니다.
+    
+    같은 영상(video_id)은 한 번만 처리하며, 실패한 항목은 전체 배치를 실패시키지 않고
+    항목별 error로 보고합니다.
+    """
+    youtube_urls = [str(url) for url in request.youtube_urls]
+    if len(youtube_urls) > BATCH_MAX_URLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {BATCH_MAX_URLS}개의 URL까지 요청할 수 있습니다."
+        )
+    
+    def valid_video_id(youtube_url: str) -> Optional[str]:
+        if not youtube_url.startswith(YOUTUBE_URL_PREFIXES):
+            return None
+        return YouTubeTranscriptExtractor.extract_video_id(youtube_url)
+    
+    # video_id 기준 중복 제거 (처음 등장한 URL로 처리)
+    unique_urls: Dict[str, str] = {}
+    for youtube_url in youtube_urls:
+        video_id = valid_video_id(youtube_url)
+        if video_id:
+            unique_urls.setdefault(video_id, youtube_url)
+    
+    semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENCY)
+    
+    async def process(video_id: str, youtube_url: str) -> BatchExtractionItem:
+        async with semaphore:
+            try:
+                recipe, cached, _ = await extract_recipe(youtube_url, request.pipeline_mode, request.force_refresh)
+                return BatchExtractionItem(
+                    youtube_url=youtube_url,
+                    video_id=video_id,
+                    success=True,
+                    recipe=recipe,
+                    cached=cached
+                )
+            except Exception as e:
+                return BatchExtractionItem(
+                    youtube_url=youtube_url,
+                    video_id=video_id,
+                    success=False,
+                    error=str(e) or "알 수 없는 오류가 발생했습니다."
+                )
+    
+    processed = await asyncio.gather(*[process(video_id, url) for video_id, url in unique_urls.items()])
+    results_by_video = {item.video_id: item for item in processed}
+    
+    # 요청 순서대로 URL별 결과 구성
+    results = []
+    for youtube_url in youtube_urls:
+        item = results_by_video.get(valid_video_id(youtube_url))
+        if item is None:
+            results.append(BatchExtractionItem(
+                youtube_url=youtube_url,
+                success=False,
+                error="유효한 YouTube URL을 입력해주세요."
+            ))
+        else:
+            results.append(item.model_copy(update={"youtube_url": youtube_url}))
+    
+    succeeded = sum(1 for item in results if item.success)
+    return BatchExtractionResponse(
+        total=len(results),
+        unique=len(unique_urls),
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        results=results
+    )
+
+
+@app.post("/jobs", response_model=ExtractionJob, status_code=202)
+async def submit_job(request: IngredientExtractionRequest):
+    """
+    재료 추출 작업을 등록하고 바로 작업 ID를 반환합니다.
+    처리 결과는 GET /jobs/{job_id}로 조회합니다.
+    """
+    youtube_url = str(request.youtube_url)
+    if not youtube_url.startswith(YOUTUBE_URL_PREFIXES):
+        raise HTTPException(
+            status_code=400,
+            detail="유효한 YouTube URL을 입력해주세요."
+        )
+    
+    # SQLite 쓰기가 잠금을 기다리는 동안 이벤트 루프가 멈추지 않도록 스레드에서 실행
+    job = await asyncio.to_thread(job_queue.submit, youtube_url, request.pipeline_mode, request.force_refresh)
+    job_workers.notify()
+    return job
+
+
+@app.get("/jobs/{job_id}", response_model=ExtractionJob)
+async def get_job(job_id: str):
+    """
+    작업 상태(pending, processing, completed, failed)와 결과를 조회합니다.
+    """
+    job = await asyncio.to_thread(job_queue.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
+
+
+@app.delete("/recipes/{video_id}")
+async def invalidate_recipe(video_id: str, include_transcript: bool = False):
+    """
+    저장된 레시피를 삭제하여 다음 요청 때 다시 처리되도록 합니다.
+    include_transcript가 True면 캐시된 자막도 함께 삭제합니다.
+    """
+    removed = agent.invalidate_cached_recipe(video_id)
+    removed_transcripts = 0
+    if include_transcript:
+        YouTubeTranscriptExtractor.invalidate_listing(video_id)
+        if transcript_cache:
+            removed_transcripts = transcript_cache.invalidate(video_id)
+    
+    return {
+        "video_id": video_id,
+        "recipe_removed": removed,
+        "transcripts_removed": removed_transcripts
+    }
+
+
+@app.post("/recipes/upload")
+async def upload_recipe(recipe: Recipe, response: Response):
+    """
+    추출한 레시피를 API 서버로 보냅니다.
+    보내기 전에 보관함에 기록하므로, API 서버에 연결할 수 없으면 202로 응답하고
+    서버가 복구되면 백그라운드에서 다시 보냅니다.
+    """
+    result = await asyncio.to_thread(api_client.send_recipe_to_api, recipe)
+    if result["success"]:
+        return {"status": "duplicate" if result.get("duplicate") else "sent", "data": result.get("data")}
+    if "outbox_id" in result:
+        response.status_code = 202
+        return {"status": "queued", "error": result["error"]}
+    raise HTTPException(status_code=502, detail=result["error"])
+
+
 @app.get("/video-info")
 async def get_video_info(youtube_url: str):
     """
@@ -79,8 +560,8 @@ async def get_video_info(youtube_url: str):
     try:
         from utils.youtube_metadata import YouTubeMetadataExtractor
         
-        # 비디오 정보와 메타데이터 함께 가져오기
-        video_info = YouTubeMetadataExtractor.get_video_info_with_metadata(youtube_url)
+        # 비디오 정보와 메타데이터 함께 가져오기 (네트워크 요청이 이벤트 루프를 막지 않도록 스레드에서 실행)
+        video_info = await asyncio.to_thread(YouTubeMetadataExtractor.get_video_info_with_metadata, youtube_url)
         
         if "error" in video_info:
             raise HTTPException(
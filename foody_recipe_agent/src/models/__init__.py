@@ -1,3 +1,3 @@
-from .recipe import Recipe, Ingredient, VideoMetadata, CuisineInfo, CuisineType, IngredientExtractionRequest, IngredientExtractionResponse
+from .recipe import Recipe, Ingredient, VideoMetadata, CuisineInfo, CuisineType, IngredientExtractionRequest, IngredientExtractionResponse, BatchExtractionRequest, BatchExtractionItem, BatchExtractionResponse, ExtractionJob, ExtractionTimings, StageBreakdown
 
-__all__ = ["Recipe", "Ingredient", "VideoMetadata", "CuisineInfo", "CuisineType", "IngredientExtractionRequest", "IngredientExtractionResponse"]
\ No newline at end of file
+__all__ = ["Recipe", "Ingredient", "VideoMetadata", "CuisineInfo", "CuisineType", "IngredientExtractionRequest", "IngredientExtractionResponse", "BatchExtractionRequest", "BatchExtractionItem", "BatchExtractionResponse", "ExtractionJob", "ExtractionTimings", "StageBreakdown"]
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Literal, Optional
 from pydantic import BaseModel, HttpUrl
 from enum import Enum
 
@@ -30,6 +30,7 @@ class CuisineInfo(BaseModel):
     cuisine_type: CuisineType = CuisineType.OTHER
     confidence: float = 1.0
     reasoning: Optional[str] = None
+    source: Literal["llm", "rules"] = "llm"  # rules: 재료/제목 특징 키워드 규칙으로 분류한 결과
 
 
 class VideoMetadata(BaseModel):
@@ -58,9 +59,70 @@ class Recipe(BaseModel):
 
 class IngredientExtractionRequest(BaseModel):
     youtube_url: HttpUrl
+    pipeline_mode: Optional[Literal["multi_pass", "single_shot"]] = None  # 지정하지 않으면 서버 기본값 사용
+    force_refresh: bool = False  # True면 저장된 결과를 무시하고 다시 처리
+
+
+class StageBreakdown(BaseModel):
+    name: str
+    duration: float  # 초
+    llm_calls: int = 0
+    llm_cache_hits: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+
+class ExtractionTimings(BaseModel):
+    total_duration: float = 0.0  # 초
+    critical_path: List[str] = []
+    stages: List[StageBreakdown] = []
+    transcript_chars: int = 0
+    llm_calls: int = 0
+    llm_cache_hits: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
 
 
 class IngredientExtractionResponse(BaseModel):
     success: bool
     recipe: Optional[Recipe] = None
-    error: Optional[str] = None
\ No newline at end of file
+    error: Optional[str] = None
+    cached: bool = False  # 이미 처리된 영상의 저장된 결과를 반환한 경우 True
+    timings: Optional[ExtractionTimings] = None  # 이번 요청의 단계별 소요 시간과 토큰 사용량 (저장된 결과면 None)
+
+
+class BatchExtractionRequest(BaseModel):
+    youtube_urls: List[str]  # 잘못된 URL이 있어도 배치 전체가 아니라 해당 항목만 실패하도록 str로 받음
+    pipeline_mode: Optional[Literal["multi_pass", "single_shot"]] = None
+    force_refresh: bool = False
+
+
+class BatchExtractionItem(BaseModel):
+    youtube_url: str
+    video_id: Optional[str] = None
+    success: bool
+    recipe: Optional[Recipe] = None
+    error: Optional[str] = None
+    cached: bool = False
+
+
+class BatchExtractionResponse(BaseModel):
+    total: int
+    unique: int  # video_id 기준 중복 제거 후 처리한 영상 수
+    succeeded: int
+    failed: int
+    results: List[BatchExtractionItem] = []
+
+
+class ExtractionJob(BaseModel):
+    job_id: str
+    youtube_url: HttpUrl
+    pipeline_mode: Optional[Literal["multi_pass", "single_shot"]] = None
+    force_refresh: bool = False
+    status: str = "pending"  # pending, processing, completed, failed
+    recipe: Optional[Recipe] = None  # 완료 전에는 processing_status만 채워진 레시피
+    error: Optional[str] = None
+    cached: bool = False
+    attempts: int = 0  # 처리 시작 횟수 (재시작으로 중단된 작업은 다시 시작됨)
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
\ No newline at end of file
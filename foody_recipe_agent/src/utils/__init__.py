@@ -1,4 +1,5 @@
 from .youtube_transcript import YouTubeTranscriptExtractor
 from .youtube_metadata import YouTubeMetadataExtractor
+from .extraction_pool import ExtractionPool, ExtractionQueueFullError
 
-__all__ = ["YouTubeTranscriptExtractor", "YouTubeMetadataExtractor"]
\ No newline at end of file
+__all__ = ["YouTubeTranscriptExtractor", "YouTubeMetadataExtractor", "ExtractionPool", "ExtractionQueueFullError"]
\ No newline at end of file
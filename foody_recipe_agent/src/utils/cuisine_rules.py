@@ -0,0 +1,121 @@
+from typing import Dict, List, Tuple
+
+from models.recipe import CuisineInfo, CuisineType
+
+
+# 규칙 기반 분류 결과의 근거(reasoning) 접두어
+RULE_BASED_REASONING_PREFIX = "규칙 기반 분류"
+
+# 장르별 특징 재료와 가중치 (재료명에 포함되어 있으면 점수 추가)
+INGREDIENT_SIGNALS: Dict[CuisineType, Dict[str, float]] = {
+    CuisineType.KOREAN: {
+        "김치": 3, "고춧가루": 3, "고추장": 3, "된장": 3, "쌈장": 3, "국간장": 2, "들기름": 2,
+        "깻잎": 2, "액젓": 2, "새우젓": 2, "참기름": 1.5, "다시다": 1.5, "떡국떡": 2, "어묵": 1,
+        "간장": 0.5,
+    },
+    CuisineType.CHINESE: {
+        "굴소스": 3, "춘장": 3, "두반장": 3, "오향분": 3, "라조장": 3, "팔각": 2.5, "화자오": 2.5,
+        "산초": 1.5, "청경채": 1.5, "죽순": 1.5, "고추기름": 1, "전분": 0.5, "녹말": 0.5,
+    },
+    CuisineType.JAPANESE: {
+        "미소": 3, "가쓰오부시": 3, "가츠오부시": 3, "와사비": 3, "쯔유": 3, "츠유": 3, "낫토": 3,
+        "미림": 2, "사케": 2, "우동": 2, "다시마": 1.5, "맛술": 0.5,
+    },
+    CuisineType.WESTERN: {
+        "로즈마리": 2, "타임": 1.5, "버터": 1.5, "생크림": 1.5, "올리브유": 1, "올리브오일": 1,
+        "치즈": 1, "머스타드": 1, "베이컨": 1,
+    },
+    CuisineType.ITALIAN: {
+        "파스타": 3, "스파게티": 3, "링귀네": 3, "페투치네": 3, "파르메산": 3, "페스토": 3,
+        "모짜렐라": 2, "리코타": 2, "바질": 2, "오레가노": 2, "토마토소스": 2,
+    },
+    CuisineType.THAI: {
+        "레몬그라스": 3, "갈랑갈": 3, "카피르": 3, "피시소스": 2, "코코넛밀크": 2, "타마린드": 2, "라임": 1,
+    },
+    CuisineType.VIETNAMESE: {
+        "쌀국수": 3, "라이스페이퍼": 3, "느억맘": 3, "고수": 1,
+    },
+    CuisineType.INDIAN: {
+        "가람마살라": 3, "탄두리": 3, "강황": 2, "커민": 2, "큐민": 2, "카다멈": 2, "카레": 1,
+    },
+    CuisineType.MEXICAN: {
+        "토르티야": 3, "또띠아": 3, "할라피뇨": 2, "살사": 2, "칠리파우더": 2, "나초": 2, "아보카도": 1,
+    },
+    CuisineType.BAKING: {
+        "박력분": 3, "강력분": 2, "베이킹파우더": 2.5, "베이킹소다": 2, "이스트": 1.5,
+    },
+    CuisineType.DESSERT: {
+        "젤라틴": 2, "슈가파우더": 2, "휘핑크림": 1.5, "연유": 1.5, "초콜릿": 1.5, "코코아": 1.5, "바닐라": 1.5,
+    },
+}
+
+# 영상 제목에 포함되면 장르를 강하게 시사하는 요리 이름
+TITLE_SIGNALS: Dict[CuisineType, List[str]] = {
+    CuisineType.KOREAN: ["찌개", "국밥", "떡볶이", "비빔밥", "불고기", "제육", "잡채", "김치", "나물", "갈비찜"],
+    CuisineType.CHINESE: ["짜장", "짬뽕", "마파", "탕수육", "깐풍", "유린기", "꿔바로우", "마라"],
+    CuisineType.JAPANESE: ["스시", "초밥", "라멘", "우동", "돈가스", "돈까스", "규동", "소바", "텐동", "가라아게"],
+    CuisineType.WESTERN: ["스테이크", "그라탕", "수프", "스프"],
+    CuisineType.ITALIAN: ["파스타", "피자", "리조또", "라자냐", "까르보나라", "알리오"],
+    CuisineType.THAI: ["팟타이", "똠얌", "그린커리"],
+    CuisineType.VIETNAMESE: ["쌀국수", "분짜", "반미", "월남쌈"],
+    CuisineType.INDIAN: ["탄두리", "마살라", "인도 커리", "인도커리"],
+    CuisineType.MEXICAN: ["타코", "부리또", "퀘사디아", "나초"],
+    CuisineType.BAKING: ["식빵", "쿠키", "케이크", "머핀", "스콘", "베이글"],
+    CuisineType.DESSERT: ["푸딩", "아이스크림", "젤리", "마카롱", "티라미수"],
+}
+TITLE_SIGNAL_WEIGHT = 3.0
+
+# 최고 점수가 이 값 이상이어야 근거가 충분하다고 봅니다.
+EVIDENCE_SATURATION = 6.0
+
+
+def score_cuisines(ingredients: List[str], title: str = "") -> Dict[CuisineType, Tuple[float, List[str]]]:
+    """
+    장르별 점수와 점수에 기여한 재료/제목 키워드를 계산합니다.
+    """
+    names = ["".join(ingredient.split()) for ingredient in ingredients]
+    compact_title = "".join((title or "").split())
+
+    scores: Dict[CuisineType, Tuple[float, List[str]]] = {}
+    for cuisine_type, signals in INGREDIENT_SIGNALS.items():
+        score = 0.0
+        matched: List[str] = []
+        for signal, weight in signals.items():
+            if any(signal in name for name in names):
+                score += weight
+                matched.append(signal)
+        for keyword in TITLE_SIGNALS.get(cuisine_type, []):
+            if "".join(keyword.split()) in compact_title:
+                score += TITLE_SIGNAL_WEIGHT
+                matched.append(f"제목 '{keyword}'")
+        if score:
+            scores[cuisine_type] = (score, matched)
+    return scores
+
+
+def classify_by_rules(ingredients: List[str], title: str = "") -> CuisineInfo:
+    """
+    재료와 영상 제목의 특징 키워드 가중치로 음식 장르를 분류합니다.
+
+    신뢰도는 (최고 점수 / 전체 점수) × min(1, 최고 점수 / EVIDENCE_SATURATION)로, 한 장르에 점수가
+    몰려 있고 근거가 많을수록 높습니다. 특징 키워드가 하나도 없으면 기타(신뢰도 0)를 반환합니다.
+    """
+    scores = score_cuisines(ingredients, title)
+    if not scores:
+        return CuisineInfo(
+            cuisine_type=CuisineType.OTHER,
+            confidence=0.0,
+            reasoning=f"{RULE_BASED_REASONING_PREFIX}: 특징 재료 없음",
+            source="rules"
+        )
+
+    cuisine_type, (top_score, matched) = max(scores.items(), key=lambda item: item[1][0])
+    total = sum(score for score, _ in scores.values())
+    confidence = (top_score / total) * min(1.0, top_score / EVIDENCE_SATURATION)
+
+    return CuisineInfo(
+        cuisine_type=cuisine_type,
+        confidence=round(confidence, 2),
+        reasoning=f"{RULE_BASED_REASONING_PREFIX}: {', '.join(matched)} ({cuisine_type.value} 점수 {top_score:g}/{total:g})",
+        source="rules"
+    )
@@ -0,0 +1,107 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class ExtractionQueueFullError(Exception):
+    """대기열이 가득 차 새 작업을 받을 수 없을 때 발생합니다."""
+
+
+class ExtractionPool:
+    """
+    추출 파이프라인의 동시 실행 수를 제한합니다.
+
+    동기 함수는 run()으로 이벤트 루프 밖의 워커 스레드에서, 코루틴 함수는
+    run_async()로 이벤트 루프 위에서 실행됩니다. 어느 쪽이든 동시에 실행되는
+    작업 수는 max_workers로 제한되며, 나머지는 대기열에서 기다립니다.
+    max_queue_size가 0이면 대기열 길이에 제한이 없습니다.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue_size: int = 100):
+        if max_workers < 1:
+            raise ValueError("max_workers는 1 이상이어야 합니다.")
+
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="extraction")
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        # 카운터는 모두 이벤트 루프 스레드에서만 변경됩니다.
+        self._active = 0
+        self._queued = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 세마포어는 실행 중인 이벤트 루프에 묶이므로 첫 사용 시 생성합니다.
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+        return self._semaphore
+
+    @asynccontextmanager
+    async def _slot(self):
+        """
+        실행 슬롯을 하나 확보하고, 대기/실행/완료 카운터를 갱신합니다.
+        """
+        if self.max_queue_size and self._queued >= self.max_queue_size:
+            self._rejected += 1
+            raise ExtractionQueueFullError(
+                f"처리 대기열이 가득 찼습니다. ({self._queued}/{self.max_queue_size}) 잠시 후 다시 시도해주세요."
+            )
+
+        self._queued += 1
+        waiting = True
+        try:
+            async with self._get_semaphore():
+                self._queued -= 1
+                waiting = False
+                self._active += 1
+                try:
+                    yield
+                    self._completed += 1
+                except Exception:
+                    self._failed += 1
+                    raise
+                finally:
+                    self._active -= 1
+        finally:
+            if waiting:
+                self._queued -= 1
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        동기 함수를 워커 풀에서 실행하고 결과를 기다립니다.
+        """
+        async with self._slot():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def run_async(self, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        코루틴 함수를 동시 실행 제한 안에서 실행합니다. (스레드를 사용하지 않음)
+        """
+        async with self._slot():
+            return await func(*args, **kwargs)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        현재 워커 풀 상태(실행 중/대기 중 작업 수 등)를 반환합니다.
+        """
+        return {
+            "max_workers": self.max_workers,
+            "max_queue_size": self.max_queue_size,
+            "active": self._active,
+            "queued": self._queued,
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        워커 풀을 종료합니다.
+        """
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,138 @@
+import asyncio
+import threading
+from typing import Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+
+YOUTUBE_BASE_URL = "https://www.youtube.com"
+
+
+class _YouTubeAdapter(HTTPAdapter):
+    """
+    보내기 직전에 요청 URL을 바꾸고, 타임아웃 없이 보낸 요청에 기본 타임아웃을 적용하는 연결 풀 어댑터입니다.
+    youtube_transcript_api는 세션으로 요청할 때 타임아웃을 지정하지 않으므로, 응답 없는 연결에
+    워커 스레드가 무한정 묶이지 않게 합니다.
+    """
+
+    def __init__(self, rewrite, timeout, **kwargs):
+        self.rewrite = rewrite
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        request.url = self.rewrite(request.url)
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+class HttpClients:
+    """
+    여러 요청이 함께 사용하는 HTTP 클라이언트입니다.
+
+    동기 요청은 연결 풀을 가진 requests.Session을, 비동기 요청은 httpx.AsyncClient를 재사용하므로
+    같은 호스트(youtube.com)에 대한 TLS 연결을 영상마다 새로 맺지 않습니다.
+
+    youtube_base_url을 지정하면 https://www.youtube.com으로 가는 요청(oEmbed, 자막 목록, 자막)을
+    해당 주소로 보냅니다. (부하 테스트용 가짜 YouTube 서버 등)
+    """
+
+    def __init__(self, pool_size: int = 20, connect_timeout: float = 5.0, read_timeout: float = 10.0,
+                 youtube_base_url: Optional[str] = None):
+        self.pool_size = pool_size
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.youtube_base_url = youtube_base_url.rstrip("/") if youtube_base_url else None
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def timeout(self):
+        """
+        requests에 전달할 (연결, 읽기) 타임아웃입니다.
+        """
+        return (self.connect_timeout, self.read_timeout)
+
+    def rewrite_url(self, url: str) -> str:
+        """
+        youtube_base_url이 설정되어 있으면 YouTube 주소를 해당 주소로 바꿉니다.
+        """
+        if self.youtube_base_url and url.startswith(YOUTUBE_BASE_URL):
+            return self.youtube_base_url + url[len(YOUTUBE_BASE_URL):]
+        return url
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        연결 풀을 공유하는 requests.Session을 반환합니다. (첫 사용 시 생성)
+        """
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = _YouTubeAdapter(
+                        self.rewrite_url, self.timeout, pool_connections=self.pool_size, pool_maxsize=self.pool_size
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+        return self._session
+
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        현재 이벤트 루프에서 사용할 httpx.AsyncClient를 반환합니다.
+        비동기 클라이언트의 연결은 이벤트 루프에 묶이므로, 루프가 바뀌면 새로 만듭니다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            async def rewrite(request: httpx.Request) -> None:
+                request.url = httpx.URL(self.rewrite_url(str(request.url)))
+                request.headers["Host"] = request.url.netloc.decode("ascii")
+
+            self._async_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+                limits=httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size),
+                event_hooks={"request": [rewrite]} if self.youtube_base_url else None
+            )
+            self._async_loop = loop
+        return self._async_client
+
+    def close(self) -> None:
+        """
+        동기 세션을 닫습니다.
+        """
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    async def aclose(self) -> None:
+        """
+        비동기 클라이언트와 동기 세션을 모두 닫습니다.
+        """
+        if self._async_client is not None and self._async_loop is asyncio.get_running_loop():
+            await self._async_client.aclose()
+        self._async_client = None
+        self._async_loop = None
+        self.close()
+
+
+_shared_clients: Optional[HttpClients] = None
+_shared_lock = threading.Lock()
+
+
+def shared_http_clients() -> HttpClients:
+    """
+    따로 설정하지 않았을 때 사용하는 프로세스 공용 HTTP 클라이언트입니다.
+    """
+    global _shared_clients
+    if _shared_clients is None:
+        with _shared_lock:
+            if _shared_clients is None:
+                _shared_clients = HttpClients()
+    return _shared_clients
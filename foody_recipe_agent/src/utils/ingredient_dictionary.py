@@ -0,0 +1,213 @@
+import json
+import os
+import tempfile
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+# 정규화 단계 이름 (IngredientExtractorAgent의 LLM 단계 이름과 같음)
+NORMALIZATION_STAGE = "normalization"
+STRICT_NORMALIZATION_STAGE = "strict_normalization"
+
+# 기본 별칭 사전 (LLM 결과를 학습하면서 확장됨)
+DEFAULT_ALIASES: Dict[str, Dict[str, str]] = {
+    # 1차 정규화: 오타 수정, 구체적인 재료명 일반화, 표준 표기
+    NORMALIZATION_STAGE: {
+        "영파": "양파", "적양파": "양파", "자색양파": "양파", "햇양파": "양파",
+        "대파": "파", "다진마늘": "마늘", "깐마늘": "마늘", "통마늘": "마늘",
+        "신김치": "김치", "묵은지": "김치", "배추김치": "김치",
+        "쇠고기": "소고기", "돼지고기": "돼지고기", "돈육": "돼지고기",
+        "진간장": "간장", "양조간장": "간장", "흑설탕": "설탕", "백설탕": "설탕",
+        "굵은소금": "소금", "꽃소금": "소금", "천일염": "소금",
+    },
+    # 2차 정규화: 유사한 재료를 가장 기본적인 재료명으로 통합
+    STRICT_NORMALIZATION_STAGE: {
+        "대파": "파", "쪽파": "파", "실파": "파", "청양고추": "고추", "홍고추": "고추", "풋고추": "고추",
+        "진간장": "간장", "양조간장": "간장", "국간장": "간장", "다진마늘": "마늘",
+        "적양파": "양파", "신김치": "김치", "묵은지": "김치",
+    },
+}
+
+# 오타 보정을 하는 최소 글자 수 (두 글자 이름은 오리/오이, 고수/고추처럼 자모 하나 차이인 다른 재료가 많음)
+FUZZY_MIN_LENGTH = 3
+
+# 한글 음절 분해 상수
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_JUNGSEONG_COUNT = 21
+_JONGSEONG_COUNT = 28
+
+
+def _key(name: str) -> str:
+    return "".join(name.split())
+
+
+@lru_cache(maxsize=4096)
+def decompose_jamo(text: str) -> Tuple[int, ...]:
+    """
+    한글 음절을 초성/중성/종성 자모로 분해합니다. 한글이 아닌 문자는 그대로 둡니다.
+    """
+    jamo: List[int] = []
+    for char in text:
+        code = ord(char)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            offset = code - _HANGUL_BASE
+            jamo.append(0x1100 + offset // (_JUNGSEONG_COUNT * _JONGSEONG_COUNT))
+            jamo.append(0x1161 + (offset // _JONGSEONG_COUNT) % _JUNGSEONG_COUNT)
+            if offset % _JONGSEONG_COUNT:
+                jamo.append(0x11A7 + offset % _JONGSEONG_COUNT)
+        else:
+            jamo.append(code)
+    return tuple(jamo)
+
+
+def jamo_distance(a: str, b: str) -> int:
+    """
+    두 문자열의 자모 단위 편집 거리입니다. ('영파'와 '양파'는 1)
+    """
+    x, y = decompose_jamo(a), decompose_jamo(b)
+    previous = list(range(len(y) + 1))
+    for i, left in enumerate(x, 1):
+        current = [i]
+        for j, right in enumerate(y, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (left != right)))
+        previous = current
+    return previous[-1]
+
+
+class IngredientDictionary:
+    """
+    재료명 정규화를 위한 로컬 별칭 사전입니다.
+
+    단계별로 {재료명: 정규화된 재료명}을 보관하며, 정확히 일치하는 이름과 이미 정규화된 이름은 사전 조회로,
+    세 글자 이상이고 같은 음절 수에서 자모 편집 거리가 max_distance 이하인 이름은 오타로 보고 바로 정규화합니다.
+    이미 정규화된 이름(새우젓 등)은 다른 재료(새우전)일 수 있어 오타 보정 대상에서 뺍니다.
+    LLM이 정규화한 결과를 learn()으로 학습하고, path가 있으면 JSON 파일에 저장해 재시작 후에도 유지합니다.
+    기본 사전(DEFAULT_ALIASES)의 항목은 학습 결과로 덮어쓰지 않습니다.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_distance: int = 1):
+        self.path = path
+        self.max_distance = max_distance
+        self._lock = threading.Lock()
+        self._aliases: Dict[str, Dict[str, str]] = {
+            stage: {_key(name): normalized for name, normalized in aliases.items()}
+            for stage, aliases in DEFAULT_ALIASES.items()
+        }
+        self._defaults: Dict[str, Set[str]] = {stage: set(aliases) for stage, aliases in self._aliases.items()}
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for stage, aliases in json.load(f).items():
+                    defaults = self._defaults.get(stage, set())
+                    self._aliases.setdefault(stage, {}).update(
+                        {key: value for key, value in aliases.items() if key not in defaults}
+                    )
+        # 단계별로 이미 정규화된 이름 (사전의 값)
+        self._canonical: Dict[str, Set[str]] = {
+            stage: {_key(value) for value in aliases.values()} for stage, aliases in self._aliases.items()
+        }
+
+        self.hits = 0
+        self.fuzzy_hits = 0
+        self.misses = 0
+
+    def _fuzzy_match(self, aliases: Dict[str, str], canonical: Set[str], key: str) -> Optional[str]:
+        # 짧은 이름은 다른 재료와 혼동되기 쉬워 오타 보정을 하지 않습니다.
+        if len(key) < FUZZY_MIN_LENGTH or not self.max_distance:
+            return None
+
+        best: Optional[Tuple[int, str]] = None
+        for candidate in aliases:
+            if len(candidate) != len(key) or candidate in canonical:
+                continue
+            distance = jamo_distance(key, candidate)
+            if distance <= self.max_distance and (best is None or distance < best[0]):
+                best = (distance, candidate)
+        return aliases[best[1]] if best else None
+
+    def resolve(self, stage: str, name: str) -> Optional[str]:
+        """
+        정규화된 재료명을 반환합니다. 사전에서 찾을 수 없으면 None을 반환합니다.
+        """
+        key = _key(name)
+        with self._lock:
+            aliases = self._aliases.get(stage, {})
+            canonical = self._canonical.get(stage, set())
+            normalized = aliases.get(key)
+            if normalized is None and key in canonical:
+                normalized = key
+            if normalized is not None:
+                self.hits += 1
+                return normalized
+
+            normalized = self._fuzzy_match(aliases, canonical, key)
+            if normalized is not None:
+                self.fuzzy_hits += 1
+            else:
+                self.misses += 1
+            return normalized
+
+    def partition(self, stage: str, names: List[str]) -> Tuple[Dict[str, str], List[str]]:
+        """
+        재료 목록을 사전으로 정규화할 수 있는 이름({이름: 정규화된 이름})과 모르는 이름 목록으로 나눕니다.
+        """
+        known: Dict[str, str] = {}
+        unknown: List[str] = []
+        for name in names:
+            normalized = self.resolve(stage, name)
+            if normalized is None:
+                unknown.append(name)
+            else:
+                known[name] = normalized
+        return known, unknown
+
+    def learn(self, stage: str, mapping: Dict[str, str]) -> None:
+        """
+        LLM이 정규화한 결과를 사전에 추가합니다.
+        정규화된 이름 자체는 사전에 없을 때만 그 이름 그대로 등록하고, 기본 사전의 항목은 바꾸지 않습니다.
+        """
+        with self._lock:
+            aliases = self._aliases.setdefault(stage, {})
+            defaults = self._defaults.get(stage, set())
+            entries: Dict[str, str] = {}
+            for name, normalized in mapping.items():
+                if not name.strip() or not normalized.strip():
+                    continue
+                if _key(name) not in defaults:
+                    entries[_key(name)] = normalized.strip()
+                if _key(normalized) not in aliases and _key(normalized) not in defaults:
+                    entries.setdefault(_key(normalized), normalized.strip())
+
+            changed = any(aliases.get(key) != value for key, value in entries.items())
+            aliases.update(entries)
+            self._canonical.setdefault(stage, set()).update(_key(value) for value in entries.values())
+            if changed and self.path:
+                self._save()
+
+    def _save(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        # 저장 중에 읽어도 깨진 파일을 보지 않도록 임시 파일에 쓴 뒤 교체합니다.
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._aliases, f, ensure_ascii=False, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = {stage: len(aliases) for stage, aliases in self._aliases.items()}
+        lookups = self.hits + self.fuzzy_hits + self.misses
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "fuzzy_hits": self.fuzzy_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.fuzzy_hits) / lookups, 4) if lookups else 0.0,
+        }
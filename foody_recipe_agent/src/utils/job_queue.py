@@ -0,0 +1,273 @@
+import asyncio
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from models.recipe import ExtractionJob, Recipe
+from .extraction_pool import ExtractionQueueFullError
+from .sqlite_utils import open_sqlite
+
+
+JOB_STATUSES = ("pending", "processing", "completed", "failed")
+
+_JOB_COLUMNS = (
+    "job_id, youtube_url, pipeline_mode, force_refresh, status, recipe, error, cached, attempts, created_at, updated_at"
+)
+
+
+def _isoformat(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp).isoformat(timespec="seconds")
+
+
+class JobQueue:
+    """
+    추출 작업을 저장하는 SQLite 기반 영속 작업 큐입니다.
+
+    작업 상태는 pending → processing → completed/failed 순서로 바뀌며, 서버가 재시작되어도
+    유지됩니다. 처리 중에 서버가 종료된 작업은 requeue_interrupted()로 다시 대기 상태가 됩니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = open_sqlite(path)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                youtube_url TEXT NOT NULL,
+                pipeline_mode TEXT,
+                force_refresh INTEGER NOT NULL DEFAULT 0,
+                status TEXT NOT NULL,
+                recipe TEXT,
+                error TEXT,
+                cached INTEGER NOT NULL DEFAULT 0,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at)")
+
+    @staticmethod
+    def _to_job(row: Tuple) -> ExtractionJob:
+        (job_id, youtube_url, pipeline_mode, force_refresh, status, recipe_json,
+         error, cached, attempts, created_at, updated_at) = row
+
+        if recipe_json:
+            recipe = Recipe.model_validate_json(recipe_json)
+        else:
+            # 아직 결과가 없으면 진행 상태만 담은 레시피를 반환합니다.
+            recipe = Recipe(
+                youtube_url=youtube_url,
+                processing_status=status,
+                created_at=_isoformat(created_at),
+                updated_at=_isoformat(updated_at)
+            )
+
+        return ExtractionJob(
+            job_id=job_id,
+            youtube_url=youtube_url,
+            pipeline_mode=pipeline_mode,
+            force_refresh=bool(force_refresh),
+            status=status,
+            recipe=recipe,
+            error=error,
+            cached=bool(cached),
+            attempts=attempts,
+            created_at=_isoformat(created_at),
+            updated_at=_isoformat(updated_at)
+        )
+
+    def submit(self, youtube_url: str, pipeline_mode: Optional[str] = None, force_refresh: bool = False) -> ExtractionJob:
+        """
+        새 작업을 대기 상태로 등록하고 반환합니다.
+        """
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                """
+                INSERT INTO jobs (job_id, youtube_url, pipeline_mode, force_refresh, status, created_at, updated_at)
+                VALUES (?, ?, ?, ?, 'pending', ?, ?)
+                """,
+                (job_id, youtube_url, pipeline_mode, int(force_refresh), now, now)
+            )
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[ExtractionJob]:
+        """
+        작업을 조회합니다. 없으면 None을 반환합니다.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT {_JOB_COLUMNS} FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return self._to_job(row) if row else None
+
+    def claim(self) -> Optional[ExtractionJob]:
+        """
+        가장 오래된 대기 작업을 처리 중 상태로 바꾸고 반환합니다. 대기 작업이 없으면 None을 반환합니다.
+        """
+        with self._lock:
+            # 하나의 UPDATE 문으로 선택과 상태 변경을 함께 처리해 다른 워커와 같은 작업을 가져가지 않도록 합니다.
+            row = self._connection.execute(
+                f"""
+                UPDATE jobs SET status = 'processing', attempts = attempts + 1, updated_at = ?
+                WHERE job_id = (
+                    SELECT job_id FROM jobs WHERE status = 'pending' ORDER BY created_at LIMIT 1
+                )
+                RETURNING {_JOB_COLUMNS}
+                """,
+                (time.time(),)
+            ).fetchone()
+        return self._to_job(row) if row else None
+
+    def complete(self, job_id: str, recipe: Recipe, cached: bool = False) -> None:
+        """
+        작업을 완료 상태로 바꾸고 결과 레시피를 저장합니다.
+        """
+        with self._lock:
+            self._connection.execute(
+                "UPDATE jobs SET status = 'completed', recipe = ?, error = NULL, cached = ?, updated_at = ? WHERE job_id = ?",
+                (recipe.model_dump_json(), int(cached), time.time(), job_id)
+            )
+
+    def fail(self, job_id: str, error: str) -> None:
+        """
+        작업을 실패 상태로 바꾸고 오류 메시지를 저장합니다.
+        """
+        with self._lock:
+            self._connection.execute(
+                "UPDATE jobs SET status = 'failed', error = ?, updated_at = ? WHERE job_id = ?",
+                (error, time.time(), job_id)
+            )
+
+    def release(self, job_id: str) -> None:
+        """
+        처리 중인 작업을 다시 대기 상태로 돌려놓습니다.
+        """
+        with self._lock:
+            self._connection.execute(
+                "UPDATE jobs SET status = 'pending', updated_at = ? WHERE job_id = ? AND status = 'processing'",
+                (time.time(), job_id)
+            )
+
+    def requeue_interrupted(self) -> int:
+        """
+        처리 중 상태로 남아 있는 작업(서버 종료로 중단된 작업)을 다시 대기 상태로 돌려놓습니다.
+
+        서버 시작 시 워커를 띄우기 전에 호출합니다. 같은 큐 파일을 여러 서버가 함께 쓰는 경우에는
+        다른 서버가 처리 중인 작업도 대기 상태가 되므로 사용하지 않습니다.
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                "UPDATE jobs SET status = 'pending', updated_at = ? WHERE status = 'processing'",
+                (time.time(),)
+            )
+            return cursor.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._connection.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = {status: 0 for status in JOB_STATUSES}
+        counts.update(dict(rows))
+        return counts
+
+
+# 작업 처리 함수: 작업을 받아 (레시피, 저장된 결과 사용 여부)를 반환
+JobHandler = Callable[[ExtractionJob], Awaitable[Tuple[Recipe, bool]]]
+
+
+class JobWorkers:
+    """
+    JobQueue의 대기 작업을 가져와 처리하는 asyncio 워커들입니다.
+
+    새 작업이 등록되면 notify()로 대기 중인 워커를 바로 깨우고, 그 외에는
+    poll_interval마다 큐를 확인합니다. 큐를 읽지 못하면 max_backoff까지 간격을 늘려 다시 시도합니다.
+    """
+
+    def __init__(self, queue: JobQueue, handler: JobHandler, workers: int = 2, poll_interval: float = 1.0,
+                 max_backoff: float = 30.0):
+        if workers < 1:
+            raise ValueError("workers는 1 이상이어야 합니다.")
+
+        self.queue = queue
+        self.handler = handler
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.max_backoff = max_backoff
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def start(self) -> None:
+        """
+        실행 중인 이벤트 루프에서 워커를 시작합니다.
+        """
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._run()) for _ in range(self.workers)]
+
+    def notify(self) -> None:
+        """
+        새 작업이 등록되었음을 워커에 알립니다.
+        """
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def stop(self) -> None:
+        """
+        워커를 중지합니다. 처리 중이던 작업은 다음 시작 시 다시 처리됩니다.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _wait_for_jobs(self) -> None:
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _run(self) -> None:
+        failures = 0
+        while True:
+            # SQLite 호출은 이벤트 루프를 막지 않도록 스레드에서 실행하고, 큐 오류("database is locked" 등)로
+            # 워커가 멈추지 않도록 기록한 뒤 점점 길게 기다렸다가 다시 시도합니다.
+            try:
+                job = await asyncio.to_thread(self.queue.claim)
+            except Exception as e:
+                failures += 1
+                delay = min(self.max_backoff, self.poll_interval * 2 ** (failures - 1))
+                print(f"⚠️ 작업 큐 조회 실패, {delay:.1f}초 후 다시 시도합니다: {e}")
+                await asyncio.sleep(delay)
+                continue
+            failures = 0
+            if job is None:
+                await self._wait_for_jobs()
+                continue
+
+            try:
+                recipe, cached = await self.handler(job)
+            except ExtractionQueueFullError:
+                # 추출 대기열이 가득 찬 경우 실패로 처리하지 않고 나중에 다시 시도합니다.
+                await self._record(self.queue.release, job.job_id)
+                await asyncio.sleep(self.poll_interval)
+            except Exception as e:
+                print(f"❌ 작업 처리 실패 ({job.job_id}): {e}")
+                await self._record(self.queue.fail, job.job_id, str(e) or "알 수 없는 오류가 발생했습니다.")
+            else:
+                await self._record(self.queue.complete, job.job_id, recipe, cached)
+
+    async def _record(self, update: Callable[..., Any], job_id: str, *args: Any) -> None:
+        """
+        작업 결과를 큐에 기록합니다. 기록하지 못한 작업은 processing 상태로 남아 다음 시작 시 다시 처리됩니다.
+        """
+        try:
+            await asyncio.to_thread(update, job_id, *args)
+        except Exception as e:
+            print(f"⚠️ 작업 상태 저장 실패 ({job_id}): {e}")
@@ -0,0 +1,222 @@
+import hashlib
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+
+def make_stage_cache_key(stage: str, model_name: str, prompt: str) -> str:
+    """
+    LLM 단계 결과의 캐시 키를 만듭니다.
+
+    prompt는 프롬프트 템플릿에 입력값을 채운 최종 문자열이므로, 템플릿이나 입력이
+    바뀌면 키도 바뀝니다.
+    """
+    digest = hashlib.sha256()
+    for part in (stage, model_name, prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class LLMCacheBackend(ABC):
+    """
+    LLM 응답 캐시 백엔드의 인터페이스입니다.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """
+        저장된 응답을 반환합니다. 없으면 None을 반환합니다.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        """
+        응답을 저장합니다.
+        """
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """
+        항목 수와 적중률 등 캐시 상태를 반환합니다.
+        """
+
+
+class _CountingLLMCache(LLMCacheBackend):
+    """
+    적중/실패 횟수를 세는 공통 구현입니다. 하위 클래스는 _get/_set/_size를 구현합니다.
+    """
+
+    def __init__(self):
+        self._counter_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[str]:
+        ...
+
+    @abstractmethod
+    def _set(self, key: str, value: str) -> None:
+        ...
+
+    @abstractmethod
+    def _size(self) -> int:
+        ...
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._get(key)
+        with self._counter_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        self._set(key, value)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self).__name__,
+            "entries": self._size(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class InMemoryLLMCache(_CountingLLMCache):
+    """
+    프로세스 메모리에 저장하는 LRU 캐시입니다.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while self.max_entries and len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class DiskLLMCache(_CountingLLMCache):
+    """
+    키(해시)를 파일 이름으로 사용하는 디렉토리 기반 캐시입니다. 재시작 후에도 유지됩니다.
+
+    max_entries를 넘으면 가장 오래 사용되지 않은 항목(파일 수정 시각 기준)부터 지워 max_entries의
+    90%까지 줄입니다. 항목 수는 시작할 때와 정리할 때만 디렉토리를 훑어 세고, 그 사이에는 직접 셉니다.
+    (여러 프로세스가 같은 디렉토리를 쓰면 정리할 때 다시 맞춰짐)
+    """
+
+    def __init__(self, directory: str, max_entries: int = 0):
+        super().__init__()
+        self.directory = directory
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._count = len(self._entry_paths())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.txt")
+
+    def _entry_paths(self) -> List[str]:
+        return [
+            os.path.join(root, name)
+            for root, _, files in os.walk(self.directory)
+            for name in files if name.endswith(".txt")
+        ]
+
+    def _get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = f.read()
+        except FileNotFoundError:
+            return None
+        # 최근에 사용한 항목이 정리 대상에서 뒤로 밀리도록 수정 시각을 갱신합니다.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def _set(self, key: str, value: str) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        existed = os.path.exists(path)
+
+        # 다른 프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체합니다.
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(value)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        with self._lock:
+            if not existed:
+                self._count += 1
+            if self.max_entries and self._count > self.max_entries:
+                self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self._entry_paths():
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except OSError:
+                continue
+        entries.sort()
+
+        target = int(self.max_entries * 0.9)
+        removed = 0
+        for _, path in entries[:max(0, len(entries) - target)]:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                continue
+        self._count = len(entries) - removed
+
+    def _size(self) -> int:
+        with self._lock:
+            return self._count
+
+
+def create_llm_cache(backend: str, max_entries: int = 1024, directory: Optional[str] = None) -> Optional[LLMCacheBackend]:
+    """
+    설정 값("memory", "disk", "none")에 맞는 캐시 백엔드를 생성합니다.
+    """
+    if backend == "memory":
+        return InMemoryLLMCache(max_entries=max_entries)
+    if backend == "disk":
+        if not directory:
+            raise ValueError("disk 캐시에는 저장 디렉토리가 필요합니다.")
+        return DiskLLMCache(directory, max_entries=max_entries)
+    if backend in ("none", ""):
+        return None
+    raise ValueError(f"지원하지 않는 LLM 캐시 백엔드입니다: {backend}")
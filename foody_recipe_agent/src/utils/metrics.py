@@ -0,0 +1,243 @@
+import bisect
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from models.recipe import ExtractionTimings, StageBreakdown
+from .pipeline import PipelineReport
+
+
+# 초 단위 소요 시간 구간
+DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+# 자막 글자 수 구간
+TRANSCRIPT_CHAR_BUCKETS = (1000, 2500, 5000, 10000, 25000, 50000, 100000)
+
+LabelValues = Tuple[str, ...]
+# 수집 시점에 계산하는 지표 값: [({라벨: 값}, 측정값), ...]
+CallbackSamples = Iterable[Tuple[Dict[str, str], float]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        super().__init__(name, help_text, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._label_values(labels), 0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}" for key, value in items]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = DURATION_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._values: Dict[LabelValues, Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            counts, total, count = self._values.get(key, ([0] * len(self.buckets), 0.0, 0))
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._values[key] = (counts, total + value, count + 1)
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            entry = self._values.get(self._label_values(labels))
+            return entry[2] if entry else 0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, (list(counts), total, count)) for key, (counts, total, count) in self._values.items())
+
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = _format_labels(self.label_names, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class _CallbackMetric(_Metric):
+    def __init__(self, name: str, help_text: str, labels: Sequence[str],
+                 collect: Callable[[], CallbackSamples], kind: str):
+        super().__init__(name, help_text, labels)
+        self.collect = collect
+        self.kind = kind
+
+    def samples(self) -> List[str]:
+        try:
+            samples = list(self.collect())
+        except Exception as e:
+            print(f"지표 수집 실패 ({self.name}): {e}")
+            return []
+        return [
+            f"{self.name}{_format_labels(self.label_names, self._label_values(labels))} {_format_value(value)}"
+            for labels, value in samples if value is not None
+        ]
+
+
+class MetricsRegistry:
+    """
+    Prometheus 텍스트 형식으로 내보낼 지표 모음입니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"이미 등록된 지표입니다: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labels))
+
+    def histogram(self, name: str, help_text: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = DURATION_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, labels, buckets))
+
+    def register_callback(self, name: str, help_text: str, labels: Sequence[str],
+                          collect: Callable[[], CallbackSamples], kind: str = "gauge") -> None:
+        """
+        /metrics 요청 시점에 collect()로 값을 계산하는 지표를 등록합니다. (이미 있으면 교체)
+        다른 객체가 이미 세고 있는 값(캐시 적중 수 등)을 내보낼 때 사용하며, kind는 gauge 또는 counter입니다.
+        """
+        with self._lock:
+            self._metrics[name] = _CallbackMetric(name, help_text, labels, collect, kind)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+# 프로세스 공용 지표
+METRICS = MetricsRegistry()
+PIPELINE_RUNS = METRICS.counter(
+    "foody_pipeline_runs_total", "추출 파이프라인 실행 횟수", ("mode", "status")
+)
+PIPELINE_DURATION = METRICS.histogram(
+    "foody_pipeline_duration_seconds", "추출 파이프라인 전체 소요 시간", ("mode",)
+)
+STAGE_DURATION = METRICS.histogram(
+    "foody_stage_duration_seconds", "파이프라인 단계별 소요 시간", ("stage",)
+)
+LLM_CALLS = METRICS.counter(
+    "foody_llm_calls_total", "단계별 LLM 호출 수", ("stage",)
+)
+LLM_CACHE_HITS = METRICS.counter(
+    "foody_llm_cache_hits_total", "단계별 LLM 캐시 적중 수", ("stage",)
+)
+LLM_TOKENS = METRICS.counter(
+    "foody_llm_tokens_total", "단계별 LLM 토큰 사용량", ("stage", "type")
+)
+TRANSCRIPT_CHARS = METRICS.histogram(
+    "foody_transcript_chars", "처리한 자막 글자 수", buckets=TRANSCRIPT_CHAR_BUCKETS
+)
+
+
+def observe_pipeline(mode: str, report: PipelineReport, transcript_chars: Optional[int] = None) -> None:
+    """
+    완료된 파이프라인 실행의 단계별 소요 시간과 LLM 사용량을 지표에 기록합니다.
+    """
+    PIPELINE_RUNS.inc(mode=mode, status="completed")
+    PIPELINE_DURATION.observe(report.total_duration, mode=mode)
+    for stage in report.stages:
+        STAGE_DURATION.observe(stage.duration, stage=stage.name)
+        if stage.llm_calls:
+            LLM_CALLS.inc(stage.llm_calls, stage=stage.name)
+            LLM_TOKENS.inc(stage.prompt_tokens, stage=stage.name, type="prompt")
+            LLM_TOKENS.inc(stage.completion_tokens, stage=stage.name, type="completion")
+        if stage.llm_cache_hits:
+            LLM_CACHE_HITS.inc(stage.llm_cache_hits, stage=stage.name)
+    if transcript_chars is not None:
+        TRANSCRIPT_CHARS.observe(transcript_chars)
+
+
+def build_extraction_timings(report: PipelineReport, transcript: Optional[str] = None) -> ExtractionTimings:
+    """
+    파이프라인 리포트를 API 응답용 단계별 소요 시간/토큰 요약으로 변환합니다.
+    """
+    stages = [
+        StageBreakdown(
+            name=stage.name,
+            duration=round(stage.duration, 4),
+            llm_calls=stage.llm_calls,
+            llm_cache_hits=stage.llm_cache_hits,
+            prompt_tokens=stage.prompt_tokens,
+            completion_tokens=stage.completion_tokens
+        )
+        for stage in report.stages
+    ]
+    return ExtractionTimings(
+        total_duration=round(report.total_duration, 4),
+        critical_path=report.critical_path,
+        stages=stages,
+        transcript_chars=len(transcript or ""),
+        llm_calls=sum(stage.llm_calls for stage in stages),
+        llm_cache_hits=sum(stage.llm_cache_hits for stage in stages),
+        prompt_tokens=sum(stage.prompt_tokens for stage in stages),
+        completion_tokens=sum(stage.completion_tokens for stage in stages)
+    )
@@ -0,0 +1,244 @@
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from pydantic import BaseModel
+
+
+class PipelineStageError(Exception):
+    """
+    파이프라인 단계 실행 중 발생한 오류입니다. 원본 예외 메시지를 그대로 유지합니다.
+    """
+
+    def __init__(self, stage: str, error: Exception):
+        super().__init__(str(error))
+        self.stage = stage
+        self.error = error
+
+
+class StageTiming(BaseModel):
+    name: str
+    depends_on: List[str] = []
+    started_at: float  # 파이프라인 시작 기준 (초)
+    finished_at: float
+    duration: float
+    llm_calls: int = 0
+    llm_cache_hits: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+
+class StageUsage:
+    """
+    단계 실행 중 LLM 호출 수, 캐시 적중 수, 토큰 사용량을 모읍니다.
+    한 단계 안에서 여러 스레드(청크 추출 등)가 함께 기록할 수 있습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.llm_calls = 0
+        self.llm_cache_hits = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def add_llm_call(self, prompt_tokens: int = 0, completion_tokens: int = 0) -> None:
+        with self._lock:
+            self.llm_calls += 1
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+
+    def add_cache_hit(self) -> None:
+        with self._lock:
+            self.llm_cache_hits += 1
+
+
+# 현재 실행 중인 파이프라인 단계의 사용량 기록 대상 (단계 밖에서는 None)
+current_stage_usage: contextvars.ContextVar[Optional[StageUsage]] = contextvars.ContextVar(
+    "current_stage_usage", default=None
+)
+
+
+class PipelineReport(BaseModel):
+    total_duration: float = 0.0
+    stages: List[StageTiming] = []
+    critical_path: List[str] = []
+
+    def summary(self) -> str:
+        """
+        단계별 소요 시간과 크리티컬 패스를 한 줄로 요약합니다.
+        """
+        stage_text = ", ".join(f"{stage.name}={stage.duration:.2f}s" for stage in self.stages)
+        path_text = " → ".join(self.critical_path)
+        return f"총 {self.total_duration:.2f}s [{stage_text}] 크리티컬 패스: {path_text}"
+
+
+class PipelineStage:
+    """
+    파이프라인의 한 단계입니다.
+
+    func는 의존 단계들의 결과를 {단계 이름: 결과} 딕셔너리로 받습니다.
+    동기 실행(run)에는 일반 함수를, 비동기 실행(arun)에는 코루틴 함수를 사용합니다.
+    """
+
+    def __init__(self, name: str, func: Callable[[Dict[str, Any]], Any], depends_on: Sequence[str] = ()):
+        self.name = name
+        self.func = func
+        self.depends_on = list(depends_on)
+
+
+# 단계 완료 콜백: (단계 이름, 결과, 소요 시간)
+StageCallback = Callable[[str, Any, StageTiming], None]
+
+
+class PipelineExecutor:
+    """
+    단계 간 의존 관계(DAG)에 따라 서로 독립적인 단계를 동시에 실행합니다.
+
+    on_stage_complete 콜백을 지정하면 각 단계가 끝날 때마다 결과와 함께 호출됩니다.
+    """
+
+    def __init__(self, stages: Sequence[PipelineStage]):
+        self.stages = {stage.name: stage for stage in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("파이프라인 단계 이름이 중복되었습니다.")
+        self._order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        order: List[str] = []
+        visiting = set()
+
+        def visit(name: str):
+            if name in order:
+                return
+            if name in visiting:
+                raise ValueError(f"파이프라인에 순환 의존이 있습니다: {name}")
+            visiting.add(name)
+            for dependency in self.stages[name].depends_on:
+                if dependency not in self.stages:
+                    raise ValueError(f"'{name}' 단계가 알 수 없는 단계 '{dependency}'에 의존합니다.")
+                visit(dependency)
+            visiting.discard(name)
+            order.append(name)
+
+        for name in self.stages:
+            visit(name)
+        return order
+
+    def _build_report(self, timings: Dict[str, StageTiming], total_duration: float) -> PipelineReport:
+        stages = sorted(timings.values(), key=lambda timing: timing.started_at)
+
+        # 가장 늦게 끝난 단계에서 시작해, 가장 늦게 끝난 의존 단계를 거슬러 올라갑니다.
+        critical_path: List[str] = []
+        current: Optional[StageTiming] = max(stages, key=lambda timing: timing.finished_at, default=None)
+        while current is not None:
+            critical_path.append(current.name)
+            dependencies = [timings[name] for name in current.depends_on if name in timings]
+            current = max(dependencies, key=lambda timing: timing.finished_at, default=None)
+        critical_path.reverse()
+
+        return PipelineReport(total_duration=total_duration, stages=stages, critical_path=critical_path)
+
+    @staticmethod
+    def _timing(stage: PipelineStage, started_at: float, finished_at: float, usage: StageUsage) -> StageTiming:
+        return StageTiming(
+            name=stage.name,
+            depends_on=stage.depends_on,
+            started_at=started_at,
+            finished_at=finished_at,
+            duration=finished_at - started_at,
+            llm_calls=usage.llm_calls,
+            llm_cache_hits=usage.llm_cache_hits,
+            prompt_tokens=usage.prompt_tokens,
+            completion_tokens=usage.completion_tokens
+        )
+
+    @staticmethod
+    def _notify(on_stage_complete: Optional[StageCallback], name: str, value: Any, timing: StageTiming) -> None:
+        if on_stage_complete is None:
+            return
+        try:
+            on_stage_complete(name, value, timing)
+        except Exception as e:
+            # 콜백 오류가 파이프라인을 멈추지 않도록 합니다.
+            print(f"단계 완료 콜백 실패 ({name}): {e}")
+
+    def run(self, max_workers: Optional[int] = None,
+            on_stage_complete: Optional[StageCallback] = None) -> Tuple[Dict[str, Any], PipelineReport]:
+        """
+        각 단계를 스레드 풀에서 실행합니다. 의존 단계가 모두 끝난 단계부터 바로 시작됩니다.
+        """
+        results: Dict[str, Any] = {}
+        timings: Dict[str, StageTiming] = {}
+        pending = list(self._order)
+        running = {}
+        pipeline_start = time.perf_counter()
+
+        def execute(stage: PipelineStage, inputs: Dict[str, Any]) -> Tuple[Any, StageTiming]:
+            usage = StageUsage()
+            current_stage_usage.set(usage)
+            started_at = time.perf_counter() - pipeline_start
+            value = stage.func(inputs)
+            return value, self._timing(stage, started_at, time.perf_counter() - pipeline_start, usage)
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(self.stages)) as executor:
+            while pending or running:
+                for name in [name for name in pending if all(dep in results for dep in self.stages[name].depends_on)]:
+                    pending.remove(name)
+                    stage = self.stages[name]
+                    inputs = {dep: results[dep] for dep in stage.depends_on}
+                    # 호출자의 컨텍스트 변수를 워커 스레드로 전달합니다.
+                    context = contextvars.copy_context()
+                    running[executor.submit(context.run, execute, stage, inputs)] = name
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        value, timing = future.result()
+                    except Exception as e:
+                        for other in running:
+                            other.cancel()
+                        raise PipelineStageError(name, e) from e
+                    results[name] = value
+                    timings[name] = timing
+                    self._notify(on_stage_complete, name, value, timing)
+
+        return results, self._build_report(timings, time.perf_counter() - pipeline_start)
+
+    async def arun(self, on_stage_complete: Optional[StageCallback] = None) -> Tuple[Dict[str, Any], PipelineReport]:
+        """
+        각 단계를 asyncio 태스크로 실행합니다. 단계 함수는 코루틴 함수여야 합니다.
+        """
+        tasks: Dict[str, asyncio.Task] = {}
+        timings: Dict[str, StageTiming] = {}
+        pipeline_start = time.perf_counter()
+
+        async def execute(stage: PipelineStage) -> Any:
+            inputs = {dep: await tasks[dep] for dep in stage.depends_on}
+            usage = StageUsage()
+            current_stage_usage.set(usage)  # 태스크마다 컨텍스트가 복사되므로 다른 단계와 섞이지 않음
+            started_at = time.perf_counter() - pipeline_start
+            try:
+                value = await stage.func(inputs)
+            except Exception as e:
+                raise PipelineStageError(stage.name, e) from e
+            timings[stage.name] = self._timing(stage, started_at, time.perf_counter() - pipeline_start, usage)
+            self._notify(on_stage_complete, stage.name, value, timings[stage.name])
+            return value
+
+        for name in self._order:
+            tasks[name] = asyncio.create_task(execute(self.stages[name]))
+
+        try:
+            values = await asyncio.gather(*tasks.values())
+        except Exception:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        results = dict(zip(tasks.keys(), values))
+        return results, self._build_report(timings, time.perf_counter() - pipeline_start)
+
@@ -0,0 +1,191 @@
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from .sqlite_utils import open_sqlite
+
+
+class CircuitOpenError(Exception):
+    """차단 신호 이후 요청이 일시 중단된 상태에서 요청하려고 할 때 발생합니다."""
+
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after
+        super().__init__(
+            f"YouTube 차단이 감지되어 요청을 일시 중단했습니다. {retry_after:.0f}초 후 다시 시도해주세요."
+        )
+
+
+def backoff_delay(attempt: int, base: float = 1.0, max_delay: float = 30.0) -> float:
+    """
+    재시도 대기 시간(초)입니다. 지수적으로 늘어나는 상한 안에서 무작위로 고릅니다. (full jitter)
+    """
+    return random.uniform(0, min(max_delay, base * (2 ** attempt)))
+
+
+class _MemoryState:
+    """프로세스 안에서만 공유하는 상태 저장소입니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state: Dict[str, Any] = {}
+
+    @contextmanager
+    def transaction(self) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            yield self._state
+
+
+class _SqliteState:
+    """여러 프로세스가 함께 사용하는 상태 저장소입니다. (트랜잭션마다 쓰기 잠금)"""
+
+    def __init__(self, path: str, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._connection = open_sqlite(path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limiters (name TEXT PRIMARY KEY, state TEXT NOT NULL)"
+        )
+
+    @contextmanager
+    def transaction(self) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._connection.execute(
+                    "SELECT state FROM rate_limiters WHERE name = ?", (self.name,)
+                ).fetchone()
+                state = json.loads(row[0]) if row else {}
+                yield state
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO rate_limiters (name, state) VALUES (?, ?)",
+                    (self.name, json.dumps(state))
+                )
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+
+
+class RateLimiter:
+    """
+    YouTube 요청용 적응형 토큰 버킷과 서킷 브레이커입니다.
+
+    초당 rate개씩 토큰이 차고(최대 burst개), 요청마다 토큰을 하나 사용하며 토큰이 없으면 기다립니다.
+    IP 차단 신호를 받거나 연속 실패가 failure_threshold번이면 cooldown_seconds 동안 요청을 막고
+    (CircuitOpenError), 다시 차단되면 중단 시간을 max_cooldown_seconds까지 두 배로 늘립니다.
+    차단 시 요청 속도를 절반으로 줄였다가(min_rate까지) 성공할 때마다 조금씩 rate까지 회복합니다.
+    path가 있으면 상태를 SQLite에 저장해 여러 프로세스(워커)가 같은 한도를 공유합니다.
+    """
+
+    def __init__(self, rate: float = 1.0, burst: int = 5, path: Optional[str] = None, name: str = "youtube",
+                 cooldown_seconds: float = 300.0, max_cooldown_seconds: float = 3600.0,
+                 failure_threshold: int = 5, min_rate: float = 0.1):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate는 0보다 크고 burst는 1 이상이어야 합니다.")
+
+        self.rate = rate
+        self.burst = burst
+        self.path = path
+        self.cooldown_seconds = cooldown_seconds
+        self.max_cooldown_seconds = max_cooldown_seconds
+        self.failure_threshold = failure_threshold
+        self.min_rate = min(min_rate, rate)
+        self._store = _SqliteState(path, name) if path else _MemoryState()
+
+        # 이 프로세스의 지표
+        self.acquired = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+
+    def _load(self, state: Dict[str, Any], now: float) -> None:
+        state.setdefault("tokens", float(self.burst))
+        state.setdefault("updated_at", now)
+        state.setdefault("rate", self.rate)
+        state.setdefault("open_until", 0.0)
+        state.setdefault("cooldown", self.cooldown_seconds)
+        state.setdefault("consecutive_failures", 0)
+        state.setdefault("blocks", 0)
+        state["rate"] = min(state["rate"], self.rate)
+
+        # 경과 시간만큼 토큰을 채웁니다.
+        elapsed = max(0.0, now - state["updated_at"])
+        state["tokens"] = min(float(self.burst), state["tokens"] + elapsed * state["rate"])
+        state["updated_at"] = now
+
+    def acquire(self) -> float:
+        """
+        토큰을 하나 얻을 때까지 기다리고, 기다린 시간(초)을 반환합니다.
+        요청이 중단된 상태면 기다리지 않고 CircuitOpenError를 발생시킵니다.
+        """
+        waited = 0.0
+        while True:
+            now = time.time()
+            with self._store.transaction() as state:
+                self._load(state, now)
+                if now < state["open_until"]:
+                    self.rejected += 1
+                    raise CircuitOpenError(state["open_until"] - now)
+                if state["tokens"] >= 1:
+                    state["tokens"] -= 1
+                    self.acquired += 1
+                    self.total_wait_seconds += waited
+                    return waited
+                wait = (1 - state["tokens"]) / state["rate"]
+
+            time.sleep(wait)
+            waited += wait
+
+    def record_success(self) -> None:
+        """
+        요청 성공을 기록합니다. 연속 실패 횟수를 초기화하고 요청 속도를 조금씩 회복합니다.
+        """
+        with self._store.transaction() as state:
+            self._load(state, time.time())
+            state["consecutive_failures"] = 0
+            state["rate"] = min(self.rate, state["rate"] + self.rate * 0.1)
+            if state["rate"] >= self.rate:
+                state["cooldown"] = self.cooldown_seconds
+
+    def record_failure(self, blocked: bool = False) -> None:
+        """
+        요청 실패를 기록합니다. 차단 신호(blocked)면 바로, 아니면 연속 실패가 쌓였을 때 요청을 중단합니다.
+        """
+        now = time.time()
+        with self._store.transaction() as state:
+            self._load(state, now)
+            state["consecutive_failures"] += 1
+            if blocked:
+                state["blocks"] += 1
+                state["rate"] = max(self.min_rate, state["rate"] / 2)
+            if blocked or state["consecutive_failures"] >= self.failure_threshold:
+                state["open_until"] = now + state["cooldown"]
+                state["cooldown"] = min(self.max_cooldown_seconds, state["cooldown"] * 2)
+                state["consecutive_failures"] = 0
+                state["tokens"] = 0.0
+                print(f"⛔ YouTube 요청 중단: {state['open_until'] - now:.0f}초")
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.time()
+        with self._store.transaction() as state:
+            self._load(state, now)
+            snapshot = dict(state)
+
+        retry_after = max(0.0, snapshot["open_until"] - now)
+        return {
+            "circuit": "open" if retry_after else "closed",
+            "retry_after": round(retry_after, 1),
+            "rate": round(snapshot["rate"], 4),
+            "max_rate": self.rate,
+            "tokens": round(snapshot["tokens"], 2),
+            "burst": self.burst,
+            "next_cooldown": snapshot["cooldown"],
+            "consecutive_failures": snapshot["consecutive_failures"],
+            "blocks": snapshot["blocks"],
+            "shared": self.path is not None,
+            "acquired": self.acquired,
+            "rejected": self.rejected,
+            "total_wait_seconds": round(self.total_wait_seconds, 3),
+        }
@@ -0,0 +1,83 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from models.recipe import Recipe
+from .sqlite_utils import open_sqlite
+
+
+class RecipeStore:
+    """
+    처리가 끝난 Recipe를 video_id 단위로 저장하는 SQLite 저장소입니다.
+    이미 처리된 영상은 파이프라인을 다시 실행하지 않고 바로 반환할 수 있습니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = open_sqlite(path)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS recipes (
+                video_id TEXT PRIMARY KEY,
+                youtube_url TEXT NOT NULL,
+                recipe TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, video_id: str) -> Optional[Recipe]:
+        """
+        저장된 레시피를 반환합니다. 없으면 None을 반환합니다.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT recipe FROM recipes WHERE video_id = ?", (video_id,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return Recipe.model_validate_json(row[0])
+
+    def save(self, video_id: str, recipe: Recipe) -> None:
+        """
+        레시피를 저장합니다. 같은 video_id가 있으면 덮어씁니다.
+        """
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                """
+                INSERT INTO recipes (video_id, youtube_url, recipe, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(video_id) DO UPDATE SET
+                    youtube_url = excluded.youtube_url,
+                    recipe = excluded.recipe,
+                    updated_at = excluded.updated_at
+                """,
+                (video_id, str(recipe.youtube_url), recipe.model_dump_json(), now, now)
+            )
+
+    def invalidate(self, video_id: str) -> bool:
+        """
+        저장된 레시피를 삭제합니다. 삭제된 항목이 있으면 True를 반환합니다.
+        """
+        with self._lock:
+            cursor = self._connection.execute("DELETE FROM recipes WHERE video_id = ?", (video_id,))
+            return cursor.rowcount > 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            (entries,) = self._connection.execute("SELECT COUNT(*) FROM recipes").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
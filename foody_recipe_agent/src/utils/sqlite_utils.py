@@ -0,0 +1,16 @@
+import os
+import sqlite3
+
+
+def open_sqlite(path: str) -> sqlite3.Connection:
+    """
+    여러 스레드/프로세스에서 함께 사용할 SQLite 연결을 엽니다.
+    상위 디렉토리가 없으면 생성하고 WAL 모드를 사용합니다.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA busy_timeout=30000")
+    return connection
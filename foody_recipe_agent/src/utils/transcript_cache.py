@@ -0,0 +1,133 @@
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from .sqlite_utils import open_sqlite
+
+
+class TranscriptCache:
+    """
+    (video_id, language) 단위로 자막 세그먼트를 저장하는 SQLite 캐시입니다.
+
+    ttl_seconds가 지난 항목은 만료되며(0이면 만료 없음), 항목 수가 max_entries를 넘으면
+    가장 오래 사용되지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 7 * 24 * 3600, max_entries: int = 5000):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection = open_sqlite(path)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS transcripts (
+                video_id TEXT NOT NULL,
+                language TEXT NOT NULL,
+                segments TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL,
+                PRIMARY KEY (video_id, language)
+            )
+            """
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_transcripts_last_accessed ON transcripts (last_accessed)"
+        )
+
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+
+    def get(self, video_id: str, language: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        캐시된 자막 세그먼트를 반환합니다. 없거나 만료되었으면 None을 반환합니다.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT segments, created_at FROM transcripts WHERE video_id = ? AND language = ?",
+                (video_id, language)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            segments, created_at = row
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                self._connection.execute(
+                    "DELETE FROM transcripts WHERE video_id = ? AND language = ?",
+                    (video_id, language)
+                )
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._connection.execute(
+                "UPDATE transcripts SET last_accessed = ? WHERE video_id = ? AND language = ?",
+                (now, video_id, language)
+            )
+            self.hits += 1
+            return json.loads(segments)
+
+    def set(self, video_id: str, language: str, segments: List[Dict[str, Any]]) -> None:
+        """
+        자막 세그먼트를 저장하고, 크기 제한을 넘으면 오래된 항목을 제거합니다.
+        """
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                """
+                INSERT OR REPLACE INTO transcripts (video_id, language, segments, created_at, last_accessed)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (video_id, language, json.dumps(segments, ensure_ascii=False), now, now)
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM transcripts").fetchone()
+        overflow = count - self.max_entries
+        if self.max_entries and overflow > 0:
+            self._connection.execute(
+                """
+                DELETE FROM transcripts WHERE rowid IN (
+                    SELECT rowid FROM transcripts ORDER BY last_accessed ASC LIMIT ?
+                )
+                """,
+                (overflow,)
+            )
+            self.evictions += overflow
+
+    def invalidate(self, video_id: str) -> int:
+        """
+        특정 영상의 모든 언어 자막을 캐시에서 제거하고, 제거된 항목 수를 반환합니다.
+        """
+        with self._lock:
+            cursor = self._connection.execute("DELETE FROM transcripts WHERE video_id = ?", (video_id,))
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM transcripts")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 적중/실패 횟수와 현재 항목 수를 반환합니다.
+        """
+        with self._lock:
+            (entries,) = self._connection.execute("SELECT COUNT(*) FROM transcripts").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,131 @@
+import math
+import re
+from functools import lru_cache
+from typing import Callable, List, Optional
+
+try:
+    import tiktoken
+except ImportError:  # 선택적 의존성 (langchain-openai와 함께 설치됨)
+    tiktoken = None
+
+
+_HANGUL = re.compile(r"[가-힣]")
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model_name: str):
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except Exception:
+        # 알 수 없는 모델이거나 인코딩 파일을 내려받을 수 없는 환경
+        return None
+
+
+def estimate_tokens(text: str, model_name: str = "gpt-4o-mini") -> int:
+    """
+    텍스트의 토큰 수를 계산합니다.
+    tiktoken을 사용할 수 없으면 한글 1자 ≈ 1토큰, 그 외 4자 ≈ 1토큰으로 추정합니다.
+    """
+    encoding = _get_encoding(model_name)
+    if encoding is not None:
+        return len(encoding.encode(text))
+
+    hangul = len(_HANGUL.findall(text))
+    return hangul + math.ceil((len(text) - hangul) / 4)
+
+
+def split_transcript(transcript: str, max_tokens: int, overlap_tokens: int = 0,
+                     count_tokens: Callable[[str], int] = estimate_tokens) -> List[str]:
+    """
+    자막을 단어 경계에서 max_tokens 이하의 구간으로 나눕니다.
+
+    구간 경계에서 재료 언급이 잘리지 않도록 이전 구간의 끝부분을 overlap_tokens만큼
+    다음 구간 앞에 겹쳐 넣습니다.
+    """
+    words = transcript.split()
+    if not words:
+        return []
+
+    word_tokens = [count_tokens(word) + 1 for word in words]  # +1: 단어 사이 공백
+    if sum(word_tokens) <= max_tokens:
+        return [" ".join(words)]
+
+    chunks: List[str] = []
+    start = 0
+    while start < len(words):
+        end = start
+        tokens = 0
+        while end < len(words) and (end == start or tokens + word_tokens[end] <= max_tokens):
+            tokens += word_tokens[end]
+            end += 1
+        chunks.append(" ".join(words[start:end]))
+        if end >= len(words):
+            break
+
+        # 다음 구간 시작 위치를 overlap_tokens만큼 앞으로 당깁니다. (항상 한 단어 이상 전진)
+        next_start = end
+        overlap = 0
+        while next_start - 1 > start and overlap + word_tokens[next_start - 1] <= overlap_tokens:
+            next_start -= 1
+            overlap += word_tokens[next_start]
+        start = next_start
+
+    return chunks
+
+
+def select_chunks(chunks: List[str], token_budget: Optional[int],
+                  count_tokens: Callable[[str], int] = estimate_tokens) -> List[str]:
+    """
+    구간들의 토큰 합이 token_budget을 넘으면 영상 전체에 고르게 퍼지도록 일부 구간만 선택합니다.
+    token_budget이 없거나 0이면 모든 구간을 반환합니다.
+    """
+    if not token_budget or not chunks:
+        return chunks
+
+    sizes = [count_tokens(chunk) for chunk in chunks]
+    if sum(sizes) <= token_budget:
+        return chunks
+
+    average = sum(sizes) / len(sizes)
+    count = max(1, min(len(chunks), int(token_budget // average)))
+    while True:
+        # 처음과 끝 구간을 포함해 같은 간격으로 count개를 고릅니다.
+        if count == 1:
+            indexes = [0]
+        else:
+            indexes = sorted({round(i * (len(chunks) - 1) / (count - 1)) for i in range(count)})
+        if count == 1 or sum(sizes[i] for i in indexes) <= token_budget:
+            return [chunks[i] for i in indexes]
+        count -= 1
+
+
+def sample_transcript(transcript: str, max_chars: int, excerpts: int = 3) -> str:
+    """
+    자막이 max_chars보다 길면 앞부분만 자르지 않고 처음/중간/끝에서 고르게 발췌합니다.
+    """
+    if len(transcript) <= max_chars:
+        return transcript
+
+    separator = " ... "
+    size = max(1, (max_chars - len(separator) * (excerpts - 1)) // excerpts)
+    step = (len(transcript) - size) / max(1, excerpts - 1)
+    parts = [transcript[round(i * step):round(i * step) + size].strip() for i in range(excerpts)]
+    return separator.join(parts)
+
+
+def merge_ingredients(ingredient_lists: List[List[str]]) -> List[str]:
+    """
+    여러 구간에서 추출한 재료 목록을 처음 등장한 순서대로 합치고 중복을 제거합니다.
+    """
+    merged: List[str] = []
+    seen = set()
+    for ingredients in ingredient_lists:
+        for ingredient in ingredients:
+            name = ingredient.strip()
+            key = name.replace(" ", "").lower()
+            if name and key not in seen:
+                seen.add(key)
+                merged.append(name)
+    return merged
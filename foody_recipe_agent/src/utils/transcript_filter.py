@@ -0,0 +1,137 @@
+import re
+from typing import Any, Dict, List
+
+from pydantic import BaseModel
+
+
+# 계량 단위 (숫자/수사 뒤에 올 때만 재료 언급으로 판단)
+KOREAN_QUANTITY_UNITS = [
+    "킬로그램", "그램", "킬로", "밀리리터", "리터", "테이블스푼", "티스푼",
+    "큰술", "작은술", "스푼", "숟가락", "숟갈", "국자", "컵", "꼬집", "줌",
+    "개", "쪽", "대", "장", "모", "마리", "알", "포기", "톨", "뿌리", "봉지", "봉", "팩", "캔", "통", "단",
+    "조각", "토막", "방울", "근",
+]
+QUANTITY_UNITS = KOREAN_QUANTITY_UNITS + [
+    "kg", "mg", "g", "ml", "l", "cc", "tbsp", "tsp", "cups", "cup", "oz", "lb", "T", "t",
+]
+
+
+def _alternation(words) -> str:
+    return "|".join(sorted(map(re.escape, words), key=len, reverse=True))
+
+
+# 숫자 뒤에는 모든 단위를 허용하고, 수사(한, 두, 세...)는 다른 단어의 일부가 아닐 때만 봅니다.
+# 수사 바로 뒤에 붙은 한 글자 단위는 반대, 세대, 네모 같은 일반 단어와 구별되지 않으므로
+# 띄어 쓴 경우(세 쪽)나 두 글자 이상인 단위(한포기)만 보고, 단위 뒤에는 조사만 올 수 있습니다.
+# (네 모두, 한 장면은 제외)
+_NUMBER = r"\d+(?:[.,/]\d+)?"
+_NUMERAL_WORD = r"(?<![가-힣])(?:한|두|세|네|다섯|여섯|반|몇)"
+_UNIT_END = r"(?=$|[^가-힣]|이|을|를|은|는|에|과|와|랑|씩|만|도|정도|쯤|가|의|짜리)"
+_QUANTITY_PATTERN = re.compile(
+    _NUMBER + r"\s*(?:" + _alternation(QUANTITY_UNITS) + r")(?![A-Za-z])"
+    + r"|" + _NUMERAL_WORD + r"(?:\s+(?:" + _alternation(KOREAN_QUANTITY_UNITS) + r")"
+    + r"|(?:" + _alternation(unit for unit in KOREAN_QUANTITY_UNITS if len(unit) > 1) + r"))" + _UNIT_END
+)
+
+# 자주 쓰이는 식재료 (한 글자 재료는 다른 단어와 혼동되기 쉬워 제외)
+FOOD_TERMS = {
+    # 채소/버섯
+    "양파", "대파", "쪽파", "실파", "마늘", "생강", "고추", "청양고추", "홍고추", "피망", "파프리카",
+    "당근", "감자", "고구마", "양배추", "배추", "무우", "애호박", "호박", "오이", "가지", "토마토",
+    "시금치", "상추", "깻잎", "부추", "미나리", "콩나물", "숙주", "브로콜리", "양상추", "셀러리",
+    "버섯", "표고", "느타리", "새송이", "팽이버섯", "양송이", "연근", "우엉", "죽순", "청경채", "옥수수",
+    # 육류/해산물/달걀
+    "소고기", "쇠고기", "돼지고기", "닭고기", "삼겹살", "목살", "앞다리", "등심", "안심", "차돌",
+    "닭가슴살", "닭다리", "베이컨", "소시지", "스팸", "다짐육", "계란", "달걀", "메추리알",
+    "새우", "오징어", "낙지", "문어", "조개", "바지락", "홍합", "굴소스", "멸치", "참치", "연어", "고등어",
+    "어묵", "맛살", "게살", "북어", "황태",
+    # 양념/소스
+    "소금", "설탕", "후추", "간장", "진간장", "국간장", "된장", "고추장", "고춧가루", "쌈장", "춘장",
+    "참기름", "들기름", "식용유", "올리브유", "올리브오일", "식초", "물엿", "올리고당", "매실청",
+    "맛술", "미림", "청주", "소주", "와인", "액젓", "멸치액젓", "까나리", "새우젓", "다시다",
+    "치킨스톡", "케첩", "마요네즈", "머스타드", "버터", "마가린", "참깨", "통깨", "전분", "녹말",
+    "밀가루", "부침가루", "튀김가루", "빵가루", "베이킹파우더", "이스트", "바닐라", "카레", "칠리",
+    # 곡물/면/기타
+    "찹쌀", "떡국떡", "가래떡", "라면", "국수", "소면", "당면", "파스타", "스파게티", "우동",
+    "두부", "순두부", "김치", "묵은지", "우유", "생크림", "치즈", "모짜렐라", "파르메산", "요거트",
+    "다시마", "가쓰오부시", "김가루", "육수", "사골", "견과류", "호두", "아몬드", "땅콩", "레몬", "사과",
+    # 영어 표기 (단어 단위로 비교)
+    "salt", "sugar", "pepper", "garlic", "onion", "butter", "oil", "flour", "egg", "milk", "cream",
+    "cheese", "soy sauce", "vinegar", "chicken", "pork", "beef", "tomato",
+}
+
+# 한글 재료명은 합성어(다진마늘, 돼지고기김치찌개)로도 쓰여 부분 문자열로 찾고,
+# 영어 재료명은 foil, boil, eggplant처럼 다른 단어 안에서 찾지 않도록 단어 경계로 찾습니다. (복수형 포함)
+_KOREAN_FOOD_TERMS = [term for term in FOOD_TERMS if not term.isascii()]
+_ENGLISH_FOOD_PATTERN = re.compile(
+    r"\b(?:" + _alternation(term for term in FOOD_TERMS if term.isascii()) + r")(?:s|es)?\b", re.IGNORECASE
+)
+
+# 재료를 소개할 때 자주 쓰는 표현
+INGREDIENT_CUES = ["재료", "넣", "양념", "준비", "다진", "썰어", "계량", "소스"]
+
+
+class TranscriptFilterResult(BaseModel):
+    text: str
+    total_segments: int
+    kept_segments: int
+    original_chars: int
+    filtered_chars: int
+    compression_ratio: float  # 남은 글자 수 / 원본 글자 수 (1.0이면 필터링하지 않음)
+    applied: bool
+
+
+def _mentions_ingredient(text: str) -> bool:
+    if _QUANTITY_PATTERN.search(text):
+        return True
+    if any(term in text for term in _KOREAN_FOOD_TERMS) or _ENGLISH_FOOD_PATTERN.search(text):
+        return True
+    return any(cue in text for cue in INGREDIENT_CUES)
+
+
+def filter_segments(segments: List[Dict[str, Any]], context: int = 1, min_chars: int = 1000,
+                    min_kept_ratio: float = 0.05, enabled: bool = True) -> TranscriptFilterResult:
+    """
+    재료를 언급할 가능성이 높은 자막 세그먼트만 남깁니다.
+
+    계량 단위, 식재료 사전, 재료 소개 표현 중 하나라도 포함된 세그먼트와 그 앞뒤 context개
+    세그먼트를 유지합니다. 자막이 min_chars보다 짧거나, 남은 분량이 min_kept_ratio보다 적으면
+    (판단이 어려운 자막) 필터링하지 않고 전체 자막을 사용합니다. enabled가 False이면 항상 전체
+    자막을 사용합니다.
+    """
+    texts = [segment["text"] for segment in segments]
+    full_text = " ".join(texts)
+
+    def unfiltered() -> TranscriptFilterResult:
+        return TranscriptFilterResult(
+            text=full_text,
+            total_segments=len(texts),
+            kept_segments=len(texts),
+            original_chars=len(full_text),
+            filtered_chars=len(full_text),
+            compression_ratio=1.0,
+            applied=False
+        )
+
+    if not enabled or len(full_text) < min_chars:
+        return unfiltered()
+
+    keep = [False] * len(texts)
+    for index, text in enumerate(texts):
+        if _mentions_ingredient(text):
+            for neighbor in range(max(0, index - context), min(len(texts), index + context + 1)):
+                keep[neighbor] = True
+
+    filtered_text = " ".join(text for text, kept in zip(texts, keep) if kept)
+    if len(filtered_text) < len(full_text) * min_kept_ratio:
+        return unfiltered()
+
+    return TranscriptFilterResult(
+        text=filtered_text,
+        total_segments=len(texts),
+        kept_segments=sum(keep),
+        original_chars=len(full_text),
+        filtered_chars=len(filtered_text),
+        compression_ratio=round(len(filtered_text) / len(full_text), 4) if full_text else 1.0,
+        applied=True
+    )
@@ -1,10 +1,44 @@
 import requests
+import httpx
 from typing import Optional
 from models.recipe import VideoMetadata
 from .youtube_transcript import YouTubeTranscriptExtractor
+from .http_client import HttpClients, shared_http_clients
 
 
 class YouTubeMetadataExtractor:
+    # oEmbed 요청에 사용할 HTTP 클라이언트 (None이면 프로세스 공용 클라이언트 사용)
+    http_clients: Optional[HttpClients] = None
+    
+    @staticmethod
+    def configure_http_clients(http_clients: Optional[HttpClients]) -> None:
+        """
+        메타데이터 조회에 사용할 HTTP 클라이언트(연결 풀)를 설정합니다.
+        """
+        YouTubeMetadataExtractor.http_clients = http_clients
+    
+    @staticmethod
+    def _http() -> HttpClients:
+        return YouTubeMetadataExtractor.http_clients or shared_http_clients()
+    
+    @staticmethod
+    def _build_oembed_url(youtube_url: str) -> str:
+        return f"https://www.youtube.com/oembed?url={youtube_url}&format=json"
+    
+    @staticmethod
+    def _parse_oembed(data: dict, video_id: str) -> VideoMetadata:
+        return VideoMetadata(
+            title=data.get("title"),
+            author_name=data.get("author_name"),
+            author_url=data.get("author_url"),
+            thumbnail_url=data.get("thumbnail_url"),
+            thumbnail_width=data.get("thumbnail_width"),
+            thumbnail_height=data.get("thumbnail_height"),
+            provider_name=data.get("provider_name", "YouTube"),
+            provider_url=data.get("provider_url", "https://www.youtube.com/"),
+            video_id=video_id
+        )
+    
     @staticmethod
     def get_video_metadata(youtube_url: str) -> Optional[VideoMetadata]:
         """
@@ -17,33 +51,42 @@ class YouTubeMetadataExtractor:
                 raise ValueError("유효하지 않은 YouTube URL입니다.")
             
             # oEmbed API 호출
-            oembed_url = f"https://www.youtube.com/oembed?url={youtube_url}&format=json"
+            oembed_url = YouTubeMetadataExtractor._build_oembed_url(youtube_url)
             
-            response = requests.get(oembed_url, timeout=10)
+            http = YouTubeMetadataExtractor._http()
+            response = http.session.get(oembed_url, timeout=http.timeout)
             response.raise_for_status()
             
-            data = response.json()
-            
             # VideoMetadata 객체 생성
-            metadata = VideoMetadata(
-                title=data.get("title"),
-                author_name=data.get("author_name"),
-                author_url=data.get("author_url"),
-                thumbnail_url=data.get("thumbnail_url"),
-                thumbnail_width=data.get("thumbnail_width"),
-                thumbnail_height=data.get("thumbnail_height"),
-                provider_name=data.get("provider_name", "YouTube"),
-                provider_url=data.get("provider_url", "https://www.youtube.com/"),
-                video_id=video_id
-            )
-            
-            return metadata
+            return YouTubeMetadataExtractor._parse_oembed(response.json(), video_id)
             
         except requests.exceptions.RequestException as e:
             raise Exception(f"YouTube 메타데이터를 가져올 수 없습니다: {str(e)}")
         except Exception as e:
             raise Exception(f"메타데이터 처리 중 오류 발생: {str(e)}")
     
+    @staticmethod
+    async def aget_video_metadata(youtube_url: str) -> Optional[VideoMetadata]:
+        """
+        get_video_metadata의 비동기 버전입니다. (httpx 사용)
+        """
+        try:
+            video_id = YouTubeTranscriptExtractor.extract_video_id(youtube_url)
+            if not video_id:
+                raise ValueError("유효하지 않은 YouTube URL입니다.")
+            
+            oembed_url = YouTubeMetadataExtractor._build_oembed_url(youtube_url)
+            
+            response = await YouTubeMetadataExtractor._http().async_client().get(oembed_url)
+            response.raise_for_status()
+            
+            return YouTubeMetadataExtractor._parse_oembed(response.json(), video_id)
+            
+        except httpx.HTTPError as e:
+            raise Exception(f"YouTube 메타데이터를 가져올 수 없습니다: {str(e)}")
+        except Exception as e:
+            raise Exception(f"메타데이터 처리 중 오류 발생: {str(e)}")
+    
     @staticmethod
     def get_video_info_with_metadata(youtube_url: str) -> dict:
         """
@@ -1,11 +1,152 @@
-from typing import Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 from youtube_transcript_api import YouTubeTranscriptApi
+from youtube_transcript_api._transcripts import TranscriptListFetcher
+import asyncio
 import re
+import threading
 import time
 import random
 
+from .transcript_cache import TranscriptCache
+from .http_client import HttpClients, shared_http_clients
+from .rate_limiter import CircuitOpenError, RateLimiter, backoff_delay
+
 
 class YouTubeTranscriptExtractor:
+    # 자막 캐시 (configure_cache로 설정, None이면 캐시 사용 안 함)
+    cache: Optional[TranscriptCache] = None
+    
+    # YouTube 요청에 사용할 HTTP 클라이언트 (None이면 프로세스 공용 클라이언트 사용)
+    http_clients: Optional[HttpClients] = None
+    
+    # YouTube 요청 속도 제한/차단 감지 (configure_rate_limiter로 설정, None이면 제한 없음)
+    rate_limiter: Optional[RateLimiter] = None
+    
+    # max_retries를 지정하지 않았을 때의 시도 횟수와 재시도 대기 시간(지수 백오프) 설정
+    default_max_retries: int = 1
+    backoff_base: float = 1.0
+    backoff_max: float = 30.0
+    
+    # 영상별 자막 목록(TranscriptList) 메모리 캐시 {video_id: (만료 시각, TranscriptList)}
+    # 자막 목록에 포함된 자막 URL은 시간이 지나면 만료되므로 짧게 유지합니다. (0이면 캐시 사용 안 함)
+    listing_ttl_seconds: float = 600.0
+    listing_max_entries: int = 256
+    _listings: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+    _listings_lock = threading.Lock()
+    
+    @staticmethod
+    def configure_cache(cache: Optional[TranscriptCache]) -> None:
+        """
+        자막 캐시를 설정합니다. None을 전달하면 캐시를 끕니다.
+        """
+        YouTubeTranscriptExtractor.cache = cache
+    
+    @staticmethod
+    def configure_http_clients(http_clients: Optional[HttpClients]) -> None:
+        """
+        자막 조회에 사용할 HTTP 클라이언트(연결 풀)를 설정합니다.
+        """
+        YouTubeTranscriptExtractor.http_clients = http_clients
+    
+    @staticmethod
+    def configure_rate_limiter(rate_limiter: Optional[RateLimiter], max_retries: int = 1,
+                               backoff_base: float = 1.0, backoff_max: float = 30.0) -> None:
+        """
+        YouTube 요청 속도 제한과 재시도 정책을 설정합니다.
+        """
+        YouTubeTranscriptExtractor.rate_limiter = rate_limiter
+        YouTubeTranscriptExtractor.default_max_retries = max_retries
+        YouTubeTranscriptExtractor.backoff_base = backoff_base
+        YouTubeTranscriptExtractor.backoff_max = backoff_max
+    
+    @staticmethod
+    def _throttle() -> None:
+        """
+        YouTube에 요청하기 전에 속도 제한 토큰을 얻습니다.
+        """
+        if YouTubeTranscriptExtractor.rate_limiter is not None:
+            YouTubeTranscriptExtractor.rate_limiter.acquire()
+    
+    @staticmethod
+    def configure_listing_cache(ttl_seconds: float = 600.0, max_entries: int = 256) -> None:
+        """
+        자막 목록 캐시의 유효 기간(초)과 최대 항목 수를 설정합니다.
+        """
+        with YouTubeTranscriptExtractor._listings_lock:
+            YouTubeTranscriptExtractor.listing_ttl_seconds = ttl_seconds
+            YouTubeTranscriptExtractor.listing_max_entries = max_entries
+            YouTubeTranscriptExtractor._listings.clear()
+    
+    @staticmethod
+    def invalidate_listing(video_id: str) -> None:
+        """
+        캐시된 자막 목록을 삭제합니다.
+        """
+        with YouTubeTranscriptExtractor._listings_lock:
+            YouTubeTranscriptExtractor._listings.pop(video_id, None)
+    
+    @staticmethod
+    def _session():
+        return (YouTubeTranscriptExtractor.http_clients or shared_http_clients()).session
+    
+    @staticmethod
+    def _list_transcripts(video_id: str):
+        """
+        공유 HTTP 세션으로 영상의 자막 목록(TranscriptList)을 가져옵니다.
+        """
+        YouTubeTranscriptExtractor._throttle()
+        session = YouTubeTranscriptExtractor._session()
+        if hasattr(YouTubeTranscriptApi, "list_transcripts"):
+            # youtube-transcript-api 0.6.x: 정적 API는 호출마다 새 세션을 만들기 때문에 직접 조회
+            return TranscriptListFetcher(session).fetch(video_id)
+        return YouTubeTranscriptApi(http_client=session).list(video_id)
+    
+    @staticmethod
+    def _get_listing(video_id: str):
+        """
+        자막 목록을 캐시에서 찾고, 없으면 한 번 조회해 캐시에 저장합니다.
+        """
+        cls = YouTubeTranscriptExtractor
+        if cls.listing_ttl_seconds:
+            with cls._listings_lock:
+                entry = cls._listings.get(video_id)
+                if entry is not None:
+                    expires_at, listing = entry
+                    if time.monotonic() < expires_at:
+                        cls._listings.move_to_end(video_id)
+                        return listing
+                    del cls._listings[video_id]
+        
+        listing = cls._list_transcripts(video_id)
+        
+        if cls.listing_ttl_seconds:
+            with cls._listings_lock:
+                cls._listings[video_id] = (time.monotonic() + cls.listing_ttl_seconds, listing)
+                cls._listings.move_to_end(video_id)
+                while len(cls._listings) > cls.listing_max_entries:
+                    cls._listings.popitem(last=False)
+        return listing
+    
+    @staticmethod
+    def _pick_language(available_languages: List[str], language: str) -> str:
+        """
+        언어 우선순위: 요청된 언어 -> 한국어 -> 영어 -> 첫 번째 언어
+        """
+        for candidate in (language, "ko", "en"):
+            if candidate in available_languages:
+                return candidate
+        if available_languages:
+            return available_languages[0]
+        raise Exception("사용 가능한 자막이 없습니다.")
+    
+    @staticmethod
+    def _to_segments(fetched) -> List[Dict[str, Any]]:
+        # 1.x는 FetchedTranscript 객체를, 0.6.x는 딕셔너리 목록을 반환
+        if hasattr(fetched, "to_raw_data"):
+            return fetched.to_raw_data()
+        return list(fetched)
+    
     @staticmethod
     def extract_video_id(youtube_url: str) -> Optional[str]:
         """
@@ -25,59 +166,103 @@ class YouTubeTranscriptExtractor:
         return None
     
     @staticmethod
-    def get_transcript(youtube_url: str, language: str = "ko", max_retries: int = 1) -> Optional[str]:
+    def get_transcript(youtube_url: str, language: str = "ko", max_retries: Optional[int] = None) -> Optional[str]:
         """
         YouTube 비디오의 자막을 추출합니다. (재시도 로직 포함)
         """
+        segments = YouTubeTranscriptExtractor.get_transcript_segments(youtube_url, language, max_retries)
+        
+        # 자막 텍스트 결합
+        return " ".join([entry['text'] for entry in segments])
+    
+    @staticmethod
+    def get_transcript_segments(youtube_url: str, language: str = "ko", max_retries: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        YouTube 비디오의 자막 세그먼트(text, start, duration) 목록을 가져옵니다.
+        캐시가 설정되어 있으면 캐시를 먼저 확인합니다.
+        """
         video_id = YouTubeTranscriptExtractor.extract_video_id(youtube_url)
         if not video_id:
             raise ValueError("유효하지 않은 YouTube URL입니다.")
         
+        cache = YouTubeTranscriptExtractor.cache
+        if cache is not None:
+            cached_segments = cache.get(video_id, language)
+            if cached_segments is not None:
+                return cached_segments
+        
+        segments = YouTubeTranscriptExtractor._fetch_segments(video_id, language, max_retries)
+        
+        if cache is not None:
+            cache.set(video_id, language, segments)
+        return segments
+    
+    @staticmethod
+    def _is_blocked(error_str: str) -> bool:
+        """
+        YouTube가 요청을 차단했거나 과도한 요청으로 거절했는지 확인합니다.
+        """
+        return "blocking requests from your IP" in error_str or "Too Many Requests" in error_str
+    
+    @staticmethod
+    def _fetch_segments(video_id: str, language: str, max_retries: Optional[int]) -> List[Dict[str, Any]]:
+        cls = YouTubeTranscriptExtractor
+        limiter = cls.rate_limiter
+        if max_retries is None:
+            max_retries = cls.default_max_retries
+        # 0이면 재시도 없이 한 번만 시도
+        max_retries = max(1, max_retries)
         for attempt in range(max_retries):
             try:
-                # 재시도 시 간단한 지연만
+                # 재시도 시 지터를 넣은 지수 백오프로 대기 (여러 워커가 동시에 재시도하지 않도록)
                 if attempt > 0:
-                    print(f"🔄 재시도 중... ({attempt + 1}/{max_retries})")
-                    time.sleep(2)  # 간단한 2초 지연
-                
-                # 사용 가능한 자막 언어 먼저 확인
-                transcript_list_obj = YouTubeTranscriptApi.list_transcripts(video_id)
-                available_languages = [t.language_code for t in transcript_list_obj]
-                
-                # 언어 우선순위: 요청된 언어 -> 한국어 -> 영어 -> 첫 번째 언어
-                target_language = None
-                
-                if language in available_languages:
-                    target_language = language
-                elif "ko" in available_languages:
-                    target_language = "ko"
-                elif "en" in available_languages:
-                    target_language = "en"
-                elif available_languages:
-                    target_language = available_languages[0]
-                else:
-                    raise Exception("사용 가능한 자막이 없습니다.")
+                    delay = backoff_delay(attempt - 1, cls.backoff_base, cls.backoff_max)
+                    print(f"🔄 재시도 중... ({attempt + 1}/{max_retries}, {delay:.1f}초 대기)")
+                    time.sleep(delay)
                 
-                # 자막 가져오기
-                transcript_list = YouTubeTranscriptApi.get_transcript(video_id, languages=[target_language])
+                # 같은 자막 목록에서 언어를 고르고 바로 가져옵니다. (목록 조회 1회 + 자막 조회 1회)
+                transcript_list_obj = YouTubeTranscriptExtractor._get_listing(video_id)
+                transcripts = list(transcript_list_obj)
+                target_language = YouTubeTranscriptExtractor._pick_language(
+                    [t.language_code for t in transcripts], language
+                )
+                transcript = next(t for t in transcripts if t.language_code == target_language)
+                try:
+                    cls._throttle()
+                    segments = cls._to_segments(transcript.fetch())
+                except Exception:
+                    # 캐시된 목록의 자막 URL이 만료되었을 수 있으므로 다음 시도에서는 목록을 다시 조회
+                    cls.invalidate_listing(video_id)
+                    raise
                 
-                # 자막 텍스트 결합
-                transcript_text = " ".join([entry['text'] for entry in transcript_list])
-                return transcript_text
+                if limiter is not None:
+                    limiter.record_success()
+                return segments
                 
+            except CircuitOpenError:
+                # 차단 이후 대기 중 - 재시도해도 막히므로 바로 실패
+                raise
+            
             except Exception as e:
                 error_str = str(e)
                 
-                # YouTube IP 차단 감지 - 즉시 중단
-                if "blocking requests from your IP" in error_str:
-                    raise Exception("YouTube에서 현재 IP를 차단했습니다. 다른 네트워크(핫스팟 등)를 사용해주세요. 시간 대기로는 해결되지 않습니다.")
+                # YouTube IP 차단 감지 - 요청을 일시 중단하고 즉시 실패
+                if cls._is_blocked(error_str):
+                    if limiter is not None:
+                        limiter.record_failure(blocked=True)
+                    raise Exception("YouTube에서 현재 IP를 차단했습니다. 잠시 후 다시 시도하거나 다른 네트워크(핫스팟 등)를 사용해주세요.")
                 
-                # 자막 없음
+                # 자막 없음 (YouTube는 정상 응답)
                 elif "No transcripts were found" in error_str:
+                    if limiter is not None:
+                        limiter.record_success()
                     raise Exception("이 영상에는 자막이 없습니다. 자막이 있는 다른 영상을 시도해주세요.")
                 
+                if limiter is not None:
+                    limiter.record_failure()
+                
                 # 기타 오류 - 마지막 시도가 아니면 재시도
-                elif attempt < max_retries - 1:
+                if attempt < max_retries - 1:
                     print(f"❌ 시도 {attempt + 1} 실패: {error_str[:100]}...")
                     continue
                 else:
@@ -85,17 +270,37 @@ class YouTubeTranscriptExtractor:
         
         raise Exception(f"{max_retries}번 시도 후에도 자막을 가져올 수 없습니다.")
     
+    @staticmethod
+    async def aget_transcript(youtube_url: str, language: str = "ko", max_retries: Optional[int] = None) -> Optional[str]:
+        """
+        get_transcript의 비동기 버전입니다.
+        youtube_transcript_api는 동기 라이브러리이므로 기본 스레드 풀에서 실행합니다.
+        """
+        return await asyncio.to_thread(
+            YouTubeTranscriptExtractor.get_transcript, youtube_url, language, max_retries
+        )
+    
+    @staticmethod
+    async def aget_transcript_segments(youtube_url: str, language: str = "ko", max_retries: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        get_transcript_segments의 비동기 버전입니다.
+        """
+        return await asyncio.to_thread(
+            YouTubeTranscriptExtractor.get_transcript_segments, youtube_url, language, max_retries
+        )
+    
     @staticmethod
     def get_available_languages(youtube_url: str) -> list:
         """
         사용 가능한 자막 언어 목록을 가져옵니다.
+        자막 추출 때 조회한 자막 목록이 캐시에 있으면 다시 요청하지 않습니다.
         """
         video_id = YouTubeTranscriptExtractor.extract_video_id(youtube_url)
         if not video_id:
             raise ValueError("유효하지 않은 YouTube URL입니다.")
         
         try:
-            transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+            transcript_list = YouTubeTranscriptExtractor._get_listing(video_id)
             languages = []
             for transcript in transcript_list:
                 languages.append(transcript.language_code)
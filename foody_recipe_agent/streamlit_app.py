@@ -1,8 +1,7 @@
 import streamlit as st
 import requests
 import json
-from typing import Dict, Any
-import time
+from typing import Dict, Any, Callable, Optional
 
 # 페이지 설정
 st.set_page_config(
@@ -88,78 +87,81 @@ def extract_ingredients(youtube_url: str) -> Dict[str, Any]:
     except Exception as e:
         return {"error": str(e)}
 
-def check_recipe_exists(youtube_url: str) -> Dict[str, Any]:
-    """레시피가 이미 존재하는지 확인"""
+def extract_ingredients_stream(youtube_url: str, on_stage: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """재료 추출 요청 (단계별 진행 상황을 Server-Sent Events로 수신)"""
     try:
-        api_server_url = "http://localhost:4000"
         response = requests.post(
-            f"{api_server_url}/v1/recipes/check-exists",
-            json={"youtubeUrl": youtube_url},
-            timeout=5
+            f"{API_BASE_URL}/extract-ingredients/stream",
+            json={"youtube_url": youtube_url},
+            stream=True,
+            timeout=(5, 300)
         )
+        if response.status_code != 200:
+            return {"error": f"HTTP {response.status_code}: {response.text}"}
         
-        if response.status_code == 200:
-            return response.json()
-        else:
-            return {"exists": False, "error": f"HTTP {response.status_code}"}
-            
+        event = None
+        for line in response.iter_lines(decode_unicode=True):
+            if line.startswith("event:"):
+                event = line[len("event:"):].strip()
+            elif line.startswith("data:"):
+                data = json.loads(line[len("data:"):].strip())
+                if event == "stage" and on_stage:
+                    on_stage(data["stage"], data)
+                elif event == "completed":
+                    return data
+                elif event == "error":
+                    return {"error": data.get("error", "알 수 없는 오류가 발생했습니다.")}
+        
+        return {"error": "스트림이 결과 없이 종료되었습니다."}
     except Exception as e:
-        return {"exists": False, "error": str(e)}
+        return {"error": str(e)}
+
+# 스트리밍 단계별 진행 표시 (단계 이름: 표시 문구)
+STAGE_LABELS = {
+    "metadata": "영상 정보 조회 완료",
+    "segments": "자막 다운로드 완료",
+    "transcript": "자막 추출 완료",
+    "filtered_transcript": "자막 사전 필터링 완료",
+    "raw_ingredients": "재료 분석 완료",
+    "normalized": "재료 정규화 완료",
+    "final_ingredients": "재료 목록 정리 완료",
+    "cuisine": "요리 장르 분류 완료",
+    "verified_cuisine": "요리 장르 검증 완료",
+    "analysis": "재료/장르 분석 완료",
+}
 
 def save_to_api_server(recipe: Dict[str, Any]) -> None:
-    """레시피를 API 서버에 저장"""
+    """레시피를 API 서버에 저장 (에이전트 서버가 보관함에 먼저 기록한 뒤 전송)"""
     try:
-        # API 서버 URL 설정
-        api_server_url = "http://localhost:4000"
-        youtube_url = recipe.get("youtube_url", "")
-        
-        # 1. 먼저 중복 체크
-        with st.spinner("중복 레시피 확인 중..."):
-            check_result = check_recipe_exists(youtube_url)
-            
-        if check_result.get("exists", False):
-            video_id = check_result.get("videoId", "Unknown")
-            st.warning(f"⚠️ 이미 존재하는 레시피입니다!")
-            st.info(f"🎥 Video ID: {video_id}")
-            st.info("💡 같은 YouTube 영상으로 만든 레시피가 이미 데이터베이스에 저장되어 있습니다.")
-            return
-        
-        # 2. 중복이 아니면 저장 진행
-        recipe_data = {
-            "youtube_url": youtube_url,
-            "title": recipe.get("title", ""),
-            "metadata": recipe.get("metadata", {}),
-            "ingredients": recipe.get("ingredients", []),
-            "cuisine_info": recipe.get("cuisine_info", {}),
-            "transcript": recipe.get("transcript", ""),
-            "processing_status": recipe.get("processing_status", "completed")
-        }
-        
         with st.spinner("API 서버에 저장하는 중..."):
             response = requests.post(
-                f"{api_server_url}/v1/recipes/from-agent",
-                json=recipe_data,
-                timeout=10
+                f"{API_BASE_URL}/recipes/upload",
+                json=recipe,
+                timeout=120
             )
+        
+        if response.status_code == 200:
+            result = response.json()
+            if result.get("status") == "duplicate":
+                st.warning("⚠️ 이미 존재하는 레시피입니다!")
+                st.info("💡 같은 YouTube 영상으로 만든 레시피가 이미 데이터베이스에 저장되어 있습니다.")
+                return
             
-            if response.status_code in [200, 201]:
-                st.success("✅ 레시피가 성공적으로 저장되었습니다!")
-                
-                # 저장된 레시피 정보 표시
-                saved_recipe = response.json()
+            st.success("✅ 레시피가 성공적으로 저장되었습니다!")
+            # 저장된 레시피 정보 표시
+            if result.get("data"):
                 with st.expander("📋 저장된 레시피 정보", expanded=False):
-                    st.json(saved_recipe)
-                    
-            elif response.status_code == 400 and "이미 존재하는" in response.text:
-                st.warning("⚠️ 이미 존재하는 레시피입니다!")
-                st.info("💡 같은 YouTube 영상으로 만든 레시피가 이미 저장되어 있습니다.")
-            else:
-                st.error(f"❌ 저장 실패: HTTP {response.status_code}")
-                st.error(f"응답: {response.text}")
+                    st.json(result["data"])
+        elif response.status_code == 202:
+            st.warning("⏳ API 서버에 연결할 수 없어 레시피를 보관함에 저장했습니다.")
+            st.info("💡 API 서버(localhost:4000)가 다시 실행되면 자동으로 전송됩니다.")
+        else:
+            st.error(f"❌ 저장 실패: HTTP {response.status_code}")
+            st.error(f"응답: {response.text}")
                 
     except requests.exceptions.RequestException as e:
         st.error(f"❌ 네트워크 오류: {str(e)}")
-        st.info("💡 API 서버가 실행 중인지 확인해주세요 (localhost:4000)")
+        st.info("💡 에이전트 서버가 실행 중인지 확인해주세요 (localhost:8000)")
     except Exception as e:
         st.error(f"❌ 예상치 못한 오류: {str(e)}")
 
@@ -303,23 +305,17 @@ def main():
                         progress_bar = st.progress(0)
                         status_text = st.empty()
                         
-                        status_text.text("자막 추출 중...")
-                        progress_bar.progress(25)
-                        time.sleep(0.5)
-                        
-                        status_text.text("재료 분석 중...")
-                        progress_bar.progress(50)
-                        
-                        # 실제 API 호출
-                        result = extract_ingredients(youtube_url)
+                        status_text.text("처리 대기 중...")
+                        completed_stages = []
                         
-                        status_text.text("재료 정규화 중...")
-                        progress_bar.progress(75)
-                        time.sleep(0.5)
+                        def on_stage(stage: str, data: Dict[str, Any]):
+                            completed_stages.append(stage)
+                            progress_bar.progress(min(len(completed_stages) / len(STAGE_LABELS), 1.0))
+                            status_text.text(f"{STAGE_LABELS.get(stage, stage)} ({data.get('duration', 0):.1f}초)")
                         
-                        status_text.text("결과 정리 중...")
-                        progress_bar.progress(100)
-                        time.sleep(0.5)
+                        # 실제 API 호출 (단계가 끝날 때마다 진행 상태 갱신)
+                        result = extract_ingredients_stream(youtube_url, on_stage)
+                        progress_bar.progress(1.0)
                         
                         # 진행 상태 제거
                         progress_bar.empty()
@@ -0,0 +1,154 @@
+import logging
+
+import pytest
+import requests
+from unittest.mock import Mock
+from src.clients.api_client import ApiClient, OutboxFlusher
+from src.models.recipe import Recipe, VideoMetadata
+
+
+def make_recipe(video_id):
+    return Recipe(
+        youtube_url=f"https://www.youtube.com/watch?v={video_id}",
+        title=f"레시피 {video_id}",
+        metadata=VideoMetadata(title=f"레시피 {video_id}", video_id=video_id),
+        transcript="비밀 자막 내용",
+        processing_status="completed"
+    )
+
+
+def response(status_code, body=None, headers=None):
+    return Mock(status_code=status_code, content=b"{}", text="", headers=headers or {},
+                json=Mock(return_value=body or {}))
+
+
+def not_stored(url, **kwargs):
+    """check-exists 요청에는 저장되지 않았다고 응답"""
+    return response(200, {"exists": False})
+
+
+def route(from_agent, check_exists=not_stored):
+    """API 서버 경로별로 다른 응답을 돌려주는 session.post 대역"""
+    def post(url, **kwargs):
+        if url.endswith("/v1/recipes/check-exists"):
+            return check_exists(url, **kwargs)
+        return from_agent(url, **kwargs)
+    return Mock(side_effect=post)
+
+
+def make_client(tmp_path, **kwargs):
+    return ApiClient(base_url="http://api.test", timeout=3, backoff_base=0, backoff_max=0,
+                     outbox_path=str(tmp_path / "outbox.sqlite3"), **kwargs)
+
+
+class TestApiClient:
+    def test_transient_failure_is_retried_with_timeout(self, tmp_path, caplog):
+        """503 응답은 재시도하고, 요청마다 타임아웃을 지정하며 자막을 로그에 남기지 않는지 테스트"""
+        client = make_client(tmp_path, max_retries=2)
+        uploads = iter([response(503), response(201, {"id": 1})])
+        client.session.post = route(lambda url, **kwargs: next(uploads))
+
+        with caplog.at_level(logging.DEBUG):
+            result = client.send_recipe_to_api(make_recipe("aaaaaaaaaaa"))
+
+        assert result["success"] is True
+        assert result["data"] == {"id": 1}
+        # 업로드 2번, 재시도 전 저장 여부 확인 1번
+        assert client.session.post.call_count == 3
+        assert client.session.post.call_args.kwargs["timeout"] == 3
+        assert client.session.post.call_args.kwargs["headers"]["Idempotency-Key"] == "recipe:aaaaaaaaaaa"
+        assert client.outbox.count() == 0
+        assert "비밀 자막 내용" not in caplog.text
+
+    def test_batch_spills_transient_failures_to_outbox_for_replay(self, tmp_path):
+        """일괄 전송에서 일시적인 오류로 실패한 레시피만 보관함에 저장하고 다시 보낼 수 있는지 테스트"""
+        client = make_client(tmp_path, max_retries=1, max_concurrency=2)
+
+        def post(url, json, **kwargs):
+            video_id = json["metadata"]["video_id"]
+            if video_id == "unreachable":
+                raise requests.exceptions.ConnectionError("connection refused")
+            if video_id == "invalid0000":
+                return response(400)
+            return response(201)
+
+        client.session.post = route(post)
+        result = client.send_recipes([make_recipe("aaaaaaaaaaa"), make_recipe("unreachable"), make_recipe("invalid0000")])
+
+        assert (result["sent"], result["failed"], result["spilled"]) == (1, 2, 1)
+        assert client.outbox.count() == 1
+        assert client.outbox.stats()["dead"] == 1
+
+        client.session.post = route(lambda url, **kwargs: response(201))
+        assert client.replay_outbox() == {"sent": 1, "failed": 0, "remaining": 0}
+        assert client.session.post.call_args.kwargs["json"]["metadata"]["video_id"] == "unreachable"
+
+    def test_queue_recipe_sends_when_batch_is_full(self, tmp_path):
+        """batch_size개가 모일 때까지 버퍼에 두었다가 한꺼번에 보내는지 테스트"""
+        client = make_client(tmp_path, batch_size=2)
+        client.session.post = Mock(return_value=response(201))
+
+        assert client.queue_recipe(make_recipe("aaaaaaaaaaa")) is None
+        assert client.session.post.call_count == 0
+        assert client.queue_recipe(make_recipe("bbbbbbbbbbb"))["sent"] == 2
+        assert client.flush()["total"] == 0
+
+    def test_recipe_is_persisted_before_sending(self, tmp_path):
+        """API 서버가 내려가 있어도 레시피가 보관함에 남고, 백그라운드 전송이 서버 복구 후 보내는지 테스트"""
+        client = make_client(tmp_path, max_retries=0)
+        stored = []
+
+        def down(url, json, **kwargs):
+            # 보내는 시점에는 이미 보관함에 기록되어 있어야 함
+            stored.append(client.outbox.count())
+            raise requests.exceptions.ConnectionError("connection refused")
+
+        client.session.post = route(down)
+        result = client.send_recipe_to_api(make_recipe("aaaaaaaaaaa"))
+
+        assert result["success"] is False
+        assert stored == [1]
+        # 다른 프로세스가 재시작 후 같은 보관함을 열어도 남아 있음
+        restarted = make_client(tmp_path)
+        assert restarted.outbox.pending()[0][1]["metadata"]["video_id"] == "aaaaaaaaaaa"
+
+        flusher = OutboxFlusher(restarted)
+        restarted.session.post = route(lambda url, **kwargs: response(201))
+        # 재전송 시각 전에는 보내지 않음
+        assert flusher.flush_once()["sent"] == 0
+
+        restarted.outbox._connection.execute("UPDATE api_outbox SET next_attempt_at = 0")
+        assert flusher.flush_once() == {"sent": 1, "failed": 0, "remaining": 0}
+        assert restarted.session.post.call_args.kwargs["headers"]["Idempotency-Key"] == "recipe:aaaaaaaaaaa"
+
+    def test_recipe_sent_while_api_server_is_unreachable_is_flushed_later(self, tmp_path):
+        """API 서버에 연결할 수 없을 때 보낸 레시피가 보관함에 남았다가 서버가 복구되면 전송되는지 테스트"""
+        # 아무도 듣지 않는 포트로 실제 연결 시도
+        client = ApiClient(base_url="http://127.0.0.1:9", timeout=1, max_retries=0,
+                           outbox_path=str(tmp_path / "outbox.sqlite3"))
+        result = client.send_recipe_to_api(make_recipe("aaaaaaaaaaa"))
+
+        assert result["success"] is False
+        assert "outbox_id" in result
+        assert client.outbox.count() == 1
+
+        client.outbox._connection.execute("UPDATE api_outbox SET next_attempt_at = 0")
+        client.session.post = route(lambda url, **kwargs: response(201))
+        assert OutboxFlusher(client).flush_once() == {"sent": 1, "failed": 0, "remaining": 0}
+        assert client.session.post.call_args.args[0] == "http://127.0.0.1:9/v1/recipes/from-agent"
+
+    def test_redelivery_skips_recipes_already_stored(self, tmp_path):
+        """응답을 받지 못했지만 서버에는 저장된 레시피는 다시 보내지 않고 보관함에서 지우는지 테스트"""
+        client = make_client(tmp_path, max_retries=0)
+        client.session.post = route(lambda url, **kwargs: response(504))
+        assert client.send_recipe_to_api(make_recipe("aaaaaaaaaaa"))["outbox_id"] == 1
+
+        upload = Mock(return_value=response(500))
+        client.session.post = route(upload, check_exists=lambda url, **kwargs: response(200, {"exists": True}))
+
+        assert client.replay_outbox() == {"sent": 1, "failed": 0, "remaining": 0}
+        assert upload.call_count == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+from benchmarks.fake_llm import FakeChatModel, prompt_key
+from benchmarks.harness import compare_reports, load_fixtures, run_benchmark
+from langchain.schema import HumanMessage
+
+
+class TestBenchmark:
+    def test_benchmark_runs_offline_and_reports_levels(self):
+        """픽스처와 가짜 LLM만으로 동시성 단계별 리포트가 만들어지는지 테스트"""
+        report = run_benchmark(concurrency_levels=(1, 2), llm_latency=0, youtube_latency=0)
+
+        assert [level["concurrency"] for level in report["levels"]] == [1, 2]
+        videos = len(load_fixtures())
+        for level in report["levels"]:
+            assert level["videos"] == videos
+            assert level["failures"] == 0
+            assert level["llm_calls"] > 0
+            assert level["tokens"]["total"] > 0
+            assert level["peak_memory_bytes"] > 0
+            assert "raw_ingredients" in level["stages"]
+        json.dumps(report)  # 리포트는 그대로 JSON으로 저장할 수 있어야 함
+
+    def test_recorded_response_is_replayed(self):
+        """녹화된 응답이 있으면 합성 응답 대신 재생하는지 테스트"""
+        messages = [HumanMessage(content="프롬프트")]
+        llm = FakeChatModel(recorded={prompt_key("프롬프트"): '{"ingredients": ["양파"]}'})
+
+        response = llm.invoke(messages)
+
+        assert response.content == '{"ingredients": ["양파"]}'
+        assert response.usage_metadata["input_tokens"] > 0
+        assert llm.replayed == 1 and llm.synthesized == 0
+
+    def test_compare_reports_flags_regressions(self):
+        """이전 리포트보다 나빠진 지표를 회귀로 표시하는지 테스트"""
+        def level(throughput, p95):
+            return {
+                "concurrency": 4,
+                "throughput_videos_per_second": throughput,
+                "latency": {"p50": 0.1, "p95": p95},
+                "stages": {},
+            }
+
+        old = {"version": 1, "levels": [level(10.0, 0.2)]}
+        new = {"version": 1, "levels": [level(8.0, 0.2)]}
+
+        rows = {row["metric"]: row for row in compare_reports(old, new)}
+
+        assert rows["throughput"]["change"] == -20.0
+        assert rows["throughput"]["regression"] is True
+        assert rows["latency_p95"]["regression"] is False
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
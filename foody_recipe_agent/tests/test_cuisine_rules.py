@@ -0,0 +1,32 @@
+import pytest
+from src.models.recipe import CuisineType
+from src.utils.cuisine_rules import classify_by_rules
+
+
+class TestCuisineRules:
+    def test_strong_signals_give_high_confidence(self):
+        """특징 재료와 제목이 충분하면 높은 신뢰도로 분류하는지 테스트"""
+        result = classify_by_rules(["신김치", "돼지고기", "고춧가루", "대파"], "김치찌개 황금레시피")
+
+        assert result.cuisine_type == CuisineType.KOREAN
+        assert result.confidence >= 0.9
+        assert result.source == "rules"
+        assert "고춧가루" in result.reasoning
+
+    def test_mixed_signals_lower_confidence(self):
+        """여러 장르의 특징이 섞이면 신뢰도가 낮아지는지 테스트"""
+        korean = classify_by_rules(["김치", "고추장", "된장"])
+        mixed = classify_by_rules(["김치", "고추장", "파스타", "파르메산"])
+
+        assert mixed.confidence < korean.confidence
+
+    def test_no_signal_returns_other(self):
+        """특징 재료가 없으면 기타(신뢰도 0)를 반환하는지 테스트"""
+        result = classify_by_rules(["닭가슴살", "양파"])
+
+        assert result.cuisine_type == CuisineType.OTHER
+        assert result.confidence == 0.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,75 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from src.utils.extraction_pool import ExtractionPool, ExtractionQueueFullError
+
+
+class TestExtractionPool:
+    def test_run_returns_result_off_event_loop(self):
+        """워커 스레드에서 실행되고 결과를 반환하는지 테스트"""
+        pool = ExtractionPool(max_workers=2)
+        main_thread = threading.get_ident()
+
+        async def scenario():
+            return await pool.run(lambda x: (x * 2, threading.get_ident()), 21)
+
+        result, worker_thread = asyncio.run(scenario())
+        pool.shutdown()
+
+        assert result == 42
+        assert worker_thread != main_thread
+        assert pool.stats()["completed"] == 1
+
+    def test_concurrency_is_capped_and_queue_reported(self):
+        """동시 실행 수 제한과 대기열 길이 보고 테스트"""
+        pool = ExtractionPool(max_workers=2)
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow_job():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.pop()
+
+        async def scenario():
+            tasks = [asyncio.create_task(pool.run(slow_job)) for _ in range(5)]
+            await asyncio.sleep(0.01)
+            snapshot = pool.stats()
+            await asyncio.gather(*tasks)
+            return snapshot
+
+        snapshot = asyncio.run(scenario())
+        pool.shutdown()
+
+        assert max(peak) <= 2
+        assert snapshot["active"] == 2
+        assert snapshot["queued"] == 3
+        assert pool.stats()["queued"] == 0
+
+    def test_queue_full_rejects(self):
+        """대기열이 가득 차면 거절하는지 테스트"""
+        pool = ExtractionPool(max_workers=1, max_queue_size=1)
+
+        async def scenario():
+            first = asyncio.create_task(pool.run(time.sleep, 0.05))
+            await asyncio.sleep(0.01)
+            second = asyncio.create_task(pool.run(time.sleep, 0.01))
+            await asyncio.sleep(0.01)
+            with pytest.raises(ExtractionQueueFullError):
+                await pool.run(time.sleep, 0.01)
+            await asyncio.gather(first, second)
+
+        asyncio.run(scenario())
+        pool.shutdown()
+
+        assert pool.stats()["rejected"] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,57 @@
+import pytest
+from benchmarks.fake_llm import FakeChatModel
+from benchmarks.fake_openai_server import LatencyModel, create_app
+from fastapi.testclient import TestClient
+from src.agents.ingredient_extractor import (
+    CuisineClassifier, IngredientExtractorAgent, IngredientList, IngredientNormalizer
+)
+
+
+def complete(client, prompt):
+    return client.post("/v1/chat/completions", json={
+        "model": "gpt-4o-mini",
+        "messages": [{"role": "user", "content": prompt}]
+    })
+
+
+class TestFakeOpenAIServer:
+    def test_responses_match_agent_schemas(self):
+        """에이전트 프롬프트마다 해당 Pydantic 스키마에 맞는 JSON을 돌려주는지 테스트"""
+        agent = IngredientExtractorAgent(llm=FakeChatModel(), llm_cache=None, recipe_store=None)
+        client = TestClient(create_app())
+
+        extraction = complete(client, agent._build_extraction_prompt("김치 한 포기와 돼지고기 300g을 넣어주세요"))
+        ingredients = IngredientList.model_validate_json(extraction.json()["choices"][0]["message"]["content"])
+        assert ingredients.ingredients == ["김치", "돼지고기"]
+        assert extraction.json()["usage"]["prompt_tokens"] > 0
+
+        normalization = complete(client, agent._build_normalization_prompt(["적양파", "대파"]))
+        normalized = IngredientNormalizer.model_validate_json(normalization.json()["choices"][0]["message"]["content"])
+        assert normalized.normalized_ingredients == ["양파", "파"]
+
+        cuisine = complete(client, agent._build_cuisine_prompt("김치찌개", ["김치", "고춧가루"], "김치찌개"))
+        classified = CuisineClassifier.model_validate_json(cuisine.json()["choices"][0]["message"]["content"])
+        assert classified.cuisine_type == "한식"
+
+    def test_error_rates_return_openai_errors(self):
+        """설정한 비율만큼 429(Retry-After 포함)와 500으로 응답하는지 테스트"""
+        rate_limited = TestClient(create_app(rate_limit_rate=1.0, retry_after=2))
+        response = complete(rate_limited, "아무 프롬프트")
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "2"
+
+        failing = TestClient(create_app(error_rate=1.0))
+        assert complete(failing, "아무 프롬프트").status_code == 500
+        assert failing.get("/stats").json()["errors"] == 1
+
+    def test_latency_model_specs(self):
+        """지연 분포 설정을 해석하는지 테스트"""
+        assert LatencyModel("0.5").sample() == 0.5
+        assert all(0.2 <= LatencyModel("uniform:0.2,0.4", seed=1).sample() <= 0.4 for _ in range(10))
+        assert LatencyModel("lognormal:0.8,0.5", seed=1).sample() > 0
+        with pytest.raises(ValueError):
+            LatencyModel("normal:1")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,49 @@
+from xml.etree import ElementTree
+
+import pytest
+from benchmarks.fake_youtube_server import FAKE_API_KEY, create_app
+from fastapi.testclient import TestClient
+
+
+VIDEO_ID = "bmKimchi001"
+
+
+class TestFakeYouTubeServer:
+    def test_serves_listing_transcript_and_oembed_from_fixtures(self):
+        """픽스처 영상의 자막 목록, 자막, oEmbed를 제공하는지 테스트"""
+        client = TestClient(create_app())
+
+        assert FAKE_API_KEY in client.get("/watch", params={"v": VIDEO_ID}).text
+
+        player = client.post(f"/youtubei/v1/player?key={FAKE_API_KEY}", json={"videoId": VIDEO_ID}).json()
+        track = player["captions"]["playerCaptionsTracklistRenderer"]["captionTracks"][0]
+        assert track["languageCode"] == "ko"
+        assert track["baseUrl"].startswith("https://www.youtube.com/api/timedtext")
+
+        transcript = client.get("/api/timedtext", params={"v": VIDEO_ID, "lang": "ko"})
+        texts = [element.text for element in ElementTree.fromstring(transcript.text)]
+        assert "김치찌개" in texts[0]
+
+        oembed = client.get("/oembed", params={"url": f"https://www.youtube.com/watch?v={VIDEO_ID}"}).json()
+        assert oembed["title"] == "초간단 김치찌개 황금레시피"
+
+        unknown = client.post("/youtubei/v1/player", json={"videoId": "unknown0000"}).json()
+        assert unknown["playabilityStatus"]["status"] == "ERROR"
+
+    def test_simulated_ip_block(self):
+        """요청 수가 기준을 넘거나 차단을 요청하면 429로 응답하는지 테스트"""
+        client = TestClient(create_app(block_after=2, block_duration=60))
+
+        assert client.get("/watch", params={"v": VIDEO_ID}).status_code == 200
+        assert client.get("/watch", params={"v": VIDEO_ID}).status_code == 200
+        blocked = client.get("/watch", params={"v": VIDEO_ID})
+        assert blocked.status_code == 429
+        assert int(blocked.headers["retry-after"]) > 0
+
+        client.post("/_fake/block", params={"seconds": 0})
+        assert client.get("/oembed", params={"url": VIDEO_ID}).status_code == 200
+        assert client.get("/_fake/stats").json()["blocked"] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,77 @@
+import asyncio
+import socket
+import time
+
+import pytest
+import requests
+from unittest.mock import Mock
+from src.utils.http_client import HttpClients
+from src.utils.youtube_metadata import YouTubeMetadataExtractor
+
+
+class TestHttpClients:
+    def test_session_is_shared_and_pooled(self):
+        """동기 세션을 재사용하고 연결 풀 크기가 적용되는지 테스트"""
+        clients = HttpClients(pool_size=7, connect_timeout=1, read_timeout=2)
+
+        assert clients.session is clients.session
+        assert clients.session.get_adapter("https://www.youtube.com")._pool_maxsize == 7
+        assert clients.timeout == (1, 2)
+        clients.close()
+
+    def test_async_client_is_reused_within_event_loop(self):
+        """같은 이벤트 루프에서는 비동기 클라이언트를 재사용하는지 테스트"""
+        clients = HttpClients()
+
+        async def get_clients():
+            first, second = clients.async_client(), clients.async_client()
+            await clients.aclose()
+            return first, second
+
+        first, second = asyncio.run(get_clients())
+        assert first is second
+        assert asyncio.run(get_clients())[0] is not first
+
+    def test_metadata_extractor_uses_injected_session(self):
+        """메타데이터 조회가 주입된 HTTP 클라이언트의 세션을 사용하는지 테스트"""
+        clients = HttpClients()
+        response = Mock()
+        response.json.return_value = {"title": "김치찌개 만들기", "author_name": "쿠킹클래스"}
+        clients._session = Mock(get=Mock(return_value=response))
+
+        YouTubeMetadataExtractor.configure_http_clients(clients)
+        try:
+            metadata = YouTubeMetadataExtractor.get_video_metadata("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+        finally:
+            YouTubeMetadataExtractor.configure_http_clients(None)
+
+        assert metadata.title == "김치찌개 만들기"
+        assert clients._session.get.call_args.kwargs["timeout"] == clients.timeout
+
+    def test_youtube_base_url_redirects_youtube_requests(self):
+        """youtube_base_url을 지정하면 YouTube 요청만 대체 주소로 보내는지 테스트"""
+        clients = HttpClients(youtube_base_url="http://localhost:8200/")
+
+        assert clients.rewrite_url("https://www.youtube.com/oembed?url=x") == "http://localhost:8200/oembed?url=x"
+        assert clients.rewrite_url("https://api.openai.com/v1") == "https://api.openai.com/v1"
+        assert HttpClients().rewrite_url("https://www.youtube.com/watch?v=x") == "https://www.youtube.com/watch?v=x"
+
+    def test_session_applies_default_timeout(self):
+        """타임아웃 없이 보낸 요청(youtube_transcript_api)에도 읽기 타임아웃이 적용되는지 테스트"""
+        # 연결은 받지만 응답하지 않는 서버
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        clients = HttpClients(connect_timeout=1, read_timeout=0.2)
+        started = time.monotonic()
+        try:
+            with pytest.raises(requests.exceptions.ReadTimeout):
+                clients.session.get(f"http://127.0.0.1:{server.getsockname()[1]}/watch")
+        finally:
+            clients.close()
+            server.close()
+        assert time.monotonic() - started < 5
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,58 @@
+import pytest
+from src.utils.ingredient_dictionary import IngredientDictionary, jamo_distance
+
+
+class TestIngredientDictionary:
+    def test_jamo_distance(self):
+        """자모 단위 편집 거리 테스트"""
+        assert jamo_distance("영파", "양파") == 1
+        assert jamo_distance("양파", "양파") == 0
+        assert jamo_distance("대파", "대게") > 1
+
+    def test_resolves_aliases_and_typos(self):
+        """별칭과 오타를 사전으로 정규화하고 모르는 이름은 남기는지 테스트"""
+        dictionary = IngredientDictionary()
+        known, unknown = dictionary.partition("strict_normalization", ["쪽파", "실 파", "청양고추", "트러플"])
+
+        assert known == {"쪽파": "파", "실 파": "파", "청양고추": "고추"}
+        assert unknown == ["트러플"]
+        assert dictionary.resolve("normalization", "다진마눌") == "마늘"
+        assert dictionary.resolve("strict_normalization", "청량고추") == "고추"
+        assert dictionary.resolve("normalization", "양파") == "양파"
+        assert dictionary.stats()["fuzzy_hits"] == 2
+
+    def test_fuzzy_match_does_not_merge_different_ingredients(self):
+        """자모 하나 차이인 다른 재료(오리/오이, 새우전/새우젓 등)를 오타로 합치지 않는지 테스트"""
+        dictionary = IngredientDictionary()
+        dictionary.learn("normalization", {
+            name: name for name in ["오이", "고추", "배추", "고기", "은어", "가지", "대추", "새우젓"]
+        })
+
+        for name in ["오리", "고수", "조기", "연어", "가재", "대구", "새우전"]:
+            assert dictionary.resolve("normalization", name) is None, name
+        assert dictionary.resolve("normalization", "대추") == "대추"
+        assert dictionary.stats()["fuzzy_hits"] == 0
+
+    def test_learn_does_not_overwrite_existing_aliases(self, tmp_path):
+        """학습 결과가 기본 사전과 이미 있는 별칭을 덮어쓰지 않는지 테스트"""
+        path = str(tmp_path / "aliases.json")
+        dictionary = IngredientDictionary(path)
+        dictionary.learn("strict_normalization", {"파채": "대파", "쪽파": "쪽파"})
+
+        assert dictionary.resolve("strict_normalization", "파채") == "대파"
+        assert dictionary.resolve("strict_normalization", "대파") == "파"
+        assert dictionary.resolve("strict_normalization", "쪽파") == "파"
+        assert IngredientDictionary(path).resolve("strict_normalization", "대파") == "파"
+
+    def test_learned_entries_persist(self, tmp_path):
+        """학습한 정규화 결과가 파일에 저장되어 다시 사용되는지 테스트"""
+        path = str(tmp_path / "aliases.json")
+        IngredientDictionary(path).learn("normalization", {"트러플 오일": "트러플오일"})
+
+        dictionary = IngredientDictionary(path)
+        assert dictionary.resolve("normalization", "트러플 오일") == "트러플오일"
+        assert dictionary.resolve("normalization", "트러플오일") == "트러플오일"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -1,9 +1,24 @@
+import asyncio
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from src.agents.ingredient_extractor import IngredientExtractorAgent
 from src.models.recipe import Recipe, Ingredient
 
 
+def route_llm_response(messages):
+    """프롬프트 내용에 따라 단계별 LLM 응답을 돌려줍니다. (단계가 동시에 실행되어 호출 순서가 고정되지 않음)"""
+    prompt = messages[0].content
+    if "1차 분류 결과" in prompt:
+        content = '{"cuisine_type": "한식", "confidence": 0.8, "reasoning": "김치찌개"}'
+    elif "장르를 분류" in prompt:
+        content = '{"cuisine_type": "한식", "confidence": 0.9, "reasoning": "김치 사용"}'
+    elif "정규화" in prompt:
+        content = '{"normalized_ingredients": ["김치", "돼지고기", "양파"]}'
+    else:
+        content = '{"ingredients": ["김치", "돼지고기", "양파"]}'
+    return Mock(content=content)
+
+
 class TestIngredientExtractorAgent:
     def setup_method(self):
         """각 테스트 메서드 실행 전에 호출"""
@@ -63,19 +78,9 @@ class TestIngredientExtractorAgent:
         """YouTube 영상 처리 성공 테스트"""
         # Mock transcript extraction
         mock_transcript = "김치찌개 재료: 김치, 돼지고기, 양파"
-        mock_extractor.get_transcript.return_value = mock_transcript
-        
-        # Mock LLM responses
-        mock_response1 = Mock()
-        mock_response1.content = '{"ingredients": ["김치", "돼지고기", "양파"]}'
-        
-        mock_response2 = Mock()
-        mock_response2.content = '{"normalized_ingredients": ["김치", "돼지고기", "양파"]}'
+        mock_extractor.get_transcript_segments.return_value = [{"text": mock_transcript, "start": 0.0, "duration": 3.0}]
         
-        mock_response3 = Mock()
-        mock_response3.content = '{"normalized_ingredients": ["김치", "돼지고기", "양파"]}'
-        
-        with patch.object(self.agent.llm, 'invoke', side_effect=[mock_response1, mock_response2, mock_response3]):
+        with patch.object(self.agent.llm, 'invoke', side_effect=route_llm_response):
             result = self.agent.process_youtube_video("https://www.youtube.com/watch?v=test123")
             
             assert isinstance(result, Recipe)
@@ -88,13 +93,222 @@ class TestIngredientExtractorAgent:
     def test_process_youtube_video_failure(self, mock_extractor):
         """YouTube 영상 처리 실패 테스트"""
         # Mock transcript extraction failure
-        mock_extractor.get_transcript.side_effect = Exception("자막을 가져올 수 없습니다")
+        mock_extractor.get_transcript_segments.side_effect = Exception("자막을 가져올 수 없습니다")
         
         with pytest.raises(Exception) as exc_info:
             self.agent.process_youtube_video("https://www.youtube.com/watch?v=test123")
         
         assert "자막을 가져올 수 없습니다" in str(exc_info.value)
 
+    
+    @patch('src.agents.ingredient_extractor.YouTubeMetadataExtractor')
+    @patch('src.agents.ingredient_extractor.YouTubeTranscriptExtractor')
+    def test_aprocess_youtube_video_success(self, mock_extractor, mock_metadata_extractor):
+        """YouTube 영상 비동기 처리 성공 테스트"""
+        mock_transcript = "김치찌개 재료: 김치, 돼지고기, 양파"
+        mock_extractor.aget_transcript_segments = AsyncMock(return_value=[{"text": mock_transcript, "start": 0.0, "duration": 3.0}])
+        mock_metadata_extractor.aget_video_metadata = AsyncMock(side_effect=Exception("oEmbed 실패"))
+        
+        mock_llm = Mock()
+        mock_llm.ainvoke = AsyncMock(side_effect=route_llm_response)
+        
+        with patch.object(self.agent, 'llm', mock_llm):
+            result = asyncio.run(self.agent.aprocess_youtube_video("https://www.youtube.com/watch?v=test123"))
+        
+        assert result.processing_status == "completed"
+        assert [ingredient.name for ingredient in result.ingredients] == ["김치", "돼지고기", "양파"]
+        assert result.cuisine_info.cuisine_type.value == "한식"
+        # 1차 분류 신뢰도(0.9)가 검증 기준 이상이므로 2차 검증은 생략됨
+        assert result.cuisine_info.confidence == 0.9
+        assert mock_llm.ainvoke.await_count == 4
+    
+    @patch('src.agents.ingredient_extractor.YouTubeMetadataExtractor')
+    @patch('src.agents.ingredient_extractor.YouTubeTranscriptExtractor')
+    def test_run_pipeline_reports_stage_timings(self, mock_extractor, mock_metadata_extractor):
+        """단계별 소요 시간과 크리티컬 패스 리포트 테스트"""
+        mock_extractor.get_transcript_segments.return_value = [{"text": "김치찌개 재료: 김치, 돼지고기, 양파", "start": 0.0, "duration": 3.0}]
+        mock_metadata_extractor.get_video_metadata.return_value = None
+        
+        with patch.object(self.agent, 'llm', Mock(invoke=Mock(side_effect=route_llm_response))):
+            recipe, report = self.agent.run_pipeline("https://www.youtube.com/watch?v=test123")
+        
+        assert recipe.processing_status == "completed"
+        assert {stage.name for stage in report.stages} == {
+            "metadata", "segments", "transcript", "filtered_transcript", "raw_ingredients",
+            "normalized", "final_ingredients", "cuisine", "verified_cuisine"
+        }
+        assert report.critical_path[0] == "segments"
+        llm_calls = {stage.name: stage.llm_calls for stage in report.stages}
+        assert llm_calls["raw_ingredients"] == 1
+        assert llm_calls["segments"] == 0
+
+    
+    @patch('src.agents.ingredient_extractor.YouTubeMetadataExtractor')
+    @patch('src.agents.ingredient_extractor.YouTubeTranscriptExtractor')
+    def test_single_shot_mode_uses_one_llm_call(self, mock_extractor, mock_metadata_extractor):
+        """single_shot 모드에서 LLM을 한 번만 호출하는지 테스트"""
+        mock_extractor.get_transcript_segments.return_value = [{"text": "김치찌개 재료: 신김치, 대파, 돼지고기", "start": 0.0, "duration": 3.0}]
+        mock_metadata_extractor.get_video_metadata.return_value = None
+        
+        mock_response = Mock()
+        mock_response.content = (
+            '{"raw_ingredients": ["신김치", "대파", "돼지고기"], '
+            '"normalized_ingredients": ["김치", "대파", "돼지고기"], '
+            '"final_ingredients": ["김치", "파", "돼지고기"], '
+            '"cuisine_type": "한식", "confidence": 0.9, "reasoning": "김치찌개"}'
+        )
+        mock_llm = Mock(invoke=Mock(return_value=mock_response))
+        
+        with patch.object(self.agent, 'llm', mock_llm):
+            recipe, report = self.agent.run_pipeline(
+                "https://www.youtube.com/watch?v=test123", pipeline_mode="single_shot"
+            )
+        
+        assert mock_llm.invoke.call_count == 1
+        assert [ingredient.name for ingredient in recipe.ingredients] == ["김치", "파", "돼지고기"]
+        assert recipe.cuisine_info.cuisine_type.value == "한식"
+        assert report.critical_path == ["segments", "transcript", "analysis"]
+    
+    def test_llm_cache_skips_repeated_calls(self):
+        """같은 자막을 다시 처리할 때 캐시된 결과를 사용하는지 테스트"""
+        from src.utils.llm_cache import InMemoryLLMCache
+        
+        agent = IngredientExtractorAgent(llm_cache=InMemoryLLMCache())
+        mock_response = Mock()
+        mock_response.content = '{"ingredients": ["김치", "돼지고기"]}'
+        mock_llm = Mock(invoke=Mock(return_value=mock_response))
+        
+        with patch.object(agent, 'llm', mock_llm):
+            first = agent.extract_ingredients_from_transcript("김치 200g, 돼지고기 100g")
+            second = agent.extract_ingredients_from_transcript("김치 200g, 돼지고기 100g")
+        
+        assert first == second == ["김치", "돼지고기"]
+        assert mock_llm.invoke.call_count == 1
+        assert agent.llm_cache.stats()["hits"] == 1
+    
+    def test_long_transcript_is_extracted_in_chunks(self):
+        """긴 자막을 구간별로 나누어 추출하고 결과를 합치는지 테스트"""
+        agent = IngredientExtractorAgent(chunk_tokens=100, token_budget=0)
+        transcript = " ".join(["김치 넣고"] * 40 + ["두부 넣고"] * 40)
+        
+        def respond(messages):
+            prompt = messages[0].content
+            ingredients = [name for name in ("김치", "두부") if name in prompt.split("지침:")[0]]
+            return Mock(content='{"ingredients": %s}' % str(ingredients).replace("'", '"'))
+        
+        mock_llm = Mock(invoke=Mock(side_effect=respond))
+        with patch.object(agent, 'llm', mock_llm):
+            result = agent.extract_ingredients_from_transcript(transcript)
+        
+        assert mock_llm.invoke.call_count > 1
+        assert result == ["김치", "두부"]
+    
+    @patch('src.agents.ingredient_extractor.YouTubeMetadataExtractor')
+    @patch('src.agents.ingredient_extractor.YouTubeTranscriptExtractor')
+    def test_confident_rule_classification_skips_llm(self, mock_extractor, mock_metadata_extractor):
+        """규칙 기반 장르 분류 신뢰도가 충분하면 LLM 분류/검증을 건너뛰는지 테스트"""
+        mock_extractor.get_transcript_segments.return_value = [{"text": "김치찌개 재료: 김치, 고춧가루, 된장", "start": 0.0, "duration": 3.0}]
+        mock_metadata_extractor.get_video_metadata.return_value = None
+        
+        def respond(messages):
+            if "정규화" in messages[0].content:
+                return Mock(content='{"normalized_ingredients": ["김치", "고춧가루", "된장"]}')
+            return Mock(content='{"ingredients": ["김치", "고춧가루", "된장"]}')
+        
+        mock_llm = Mock(invoke=Mock(side_effect=respond))
+        with patch.object(self.agent, 'llm', mock_llm):
+            recipe = self.agent.process_youtube_video("https://www.youtube.com/watch?v=test123")
+        
+        assert recipe.cuisine_info.cuisine_type.value == "한식"
+        assert recipe.cuisine_info.source == "rules"
+        assert mock_llm.invoke.call_count == 3
+    
+    def test_verification_runs_only_below_threshold(self):
+        """1차 신뢰도가 기준 미만이거나 기타로 분류된 경우에만 2차 검증하고 통계를 기록하는지 테스트"""
+        from src.models.recipe import CuisineInfo, CuisineType
+        
+        agent = IngredientExtractorAgent(verify_threshold=0.8)
+        mock_llm = Mock(invoke=Mock(return_value=Mock(
+            content='{"cuisine_type": "일식", "confidence": 0.7, "reasoning": "미소 사용"}'
+        )))
+        
+        with patch.object(agent, 'llm', mock_llm):
+            confident = agent.verify_if_needed(CuisineInfo(cuisine_type=CuisineType.KOREAN, confidence=0.9), "자막", ["김치"])
+            uncertain = agent.verify_if_needed(CuisineInfo(cuisine_type=CuisineType.KOREAN, confidence=0.6), "자막", ["미소"])
+            other = agent.verify_if_needed(CuisineInfo(cuisine_type=CuisineType.OTHER, confidence=0.95), "자막", ["미소"])
+        
+        assert confident.confidence == 0.9
+        assert uncertain.cuisine_type == CuisineType.JAPANESE
+        assert other.cuisine_type == CuisineType.JAPANESE
+        assert mock_llm.invoke.call_count == 2
+        stats = agent.verification_stats()
+        assert (stats["skipped"], stats["verified"], stats["changed"]) == (1, 2, 2)
+        assert stats["change_rate"] == 1.0
+    
+    def test_only_rule_results_skip_verification(self):
+        """규칙 기반 분류 결과만 기준 신뢰도 이상일 때 검증을 생략하고, 근거 문구는 판단에 쓰지 않는지 테스트"""
+        from src.models.recipe import CuisineInfo, CuisineType
+        
+        agent = IngredientExtractorAgent(cuisine_rule_threshold=0.7, verify_threshold=0.8)
+        mock_llm = Mock(invoke=Mock(return_value=Mock(
+            content='{"cuisine_type": "한식", "confidence": 0.75, "reasoning": "김치 사용"}'
+        )))
+        
+        with patch.object(agent, 'llm', mock_llm):
+            agent.verify_if_needed(CuisineInfo(cuisine_type=CuisineType.KOREAN, confidence=0.75, source="rules"), "자막", ["김치"])
+            agent.verify_if_needed(CuisineInfo(cuisine_type=CuisineType.KOREAN, confidence=0.75, reasoning="규칙 기반 분류: 김치"), "자막", ["김치"])
+            agent.verify_if_needed(CuisineInfo(cuisine_type=CuisineType.KOREAN, confidence=0.5, source="rules"), "자막", ["김치"])
+        
+        assert mock_llm.invoke.call_count == 2
+        assert agent.verification_stats()["skipped"] == 1
+    
+    def test_dictionary_sends_only_unknown_names_to_llm(self):
+        """사전에 있는 재료명은 LLM 없이 정규화하고 모르는 이름만 LLM으로 보내 학습하는지 테스트"""
+        from src.utils.ingredient_dictionary import IngredientDictionary
+        
+        agent = IngredientExtractorAgent(ingredient_dictionary=IngredientDictionary())
+        mock_response = Mock()
+        mock_response.content = '{"normalized_ingredients": ["트러플오일"], "mapping": {"트러플 오일": "트러플오일"}}'
+        mock_llm = Mock(invoke=Mock(return_value=mock_response))
+        
+        with patch.object(agent, 'llm', mock_llm):
+            first = agent.normalize_ingredients(["적양파", "트러플 오일", "영파"])
+            second = agent.normalize_ingredients(["트러플 오일", "양파"])
+        
+        assert first == ["양파", "트러플오일"]
+        assert second == ["트러플오일", "양파"]
+        assert mock_llm.invoke.call_count == 1
+        prompt = mock_llm.invoke.call_args[0][0][0].content
+        assert "- 트러플 오일" in prompt and "- 적양파" not in prompt
+    
+    @patch('src.agents.ingredient_extractor.YouTubeMetadataExtractor')
+    @patch('src.agents.ingredient_extractor.YouTubeTranscriptExtractor')
+    def test_processed_recipe_is_stored_and_invalidated(self, mock_extractor, mock_metadata_extractor, tmp_path):
+        """처리된 레시피가 저장되고, 무효화되면 삭제되는지 테스트"""
+        from src.utils.recipe_store import RecipeStore
+        
+        mock_extractor.get_transcript_segments.return_value = [{"text": "김치찌개 재료: 김치, 돼지고기, 양파", "start": 0.0, "duration": 3.0}]
+        mock_extractor.extract_video_id.return_value = "dQw4w9WgXcQ"
+        mock_metadata_extractor.get_video_metadata.return_value = None
+        agent = IngredientExtractorAgent(recipe_store=RecipeStore(str(tmp_path / "recipes.sqlite3")))
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        
+        assert agent.get_cached_recipe(url) is None
+        with patch.object(agent, 'llm', Mock(invoke=Mock(side_effect=route_llm_response))):
+            recipe = agent.process_youtube_video(url)
+        
+        cached = agent.get_cached_recipe(url)
+        assert cached is not None
+        assert [i.name for i in cached.ingredients] == [i.name for i in recipe.ingredients]
+        
+        assert agent.invalidate_cached_recipe("dQw4w9WgXcQ") is True
+        assert agent.get_cached_recipe(url) is None
+    
+    def test_invalid_pipeline_mode(self):
+        """지원하지 않는 파이프라인 모드 테스트"""
+        with pytest.raises(ValueError):
+            IngredientExtractorAgent(pipeline_mode="three_pass")
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -0,0 +1,103 @@
+import asyncio
+import sqlite3
+
+import pytest
+from src.models.recipe import Recipe
+from src.utils.job_queue import JobQueue, JobWorkers
+
+
+YOUTUBE_URL = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+
+class TestJobQueue:
+    def test_job_lifecycle(self, tmp_path):
+        """작업이 pending → processing → completed 순서로 바뀌는지 테스트"""
+        queue = JobQueue(str(tmp_path / "jobs.sqlite3"))
+        job = queue.submit(YOUTUBE_URL, "single_shot")
+
+        assert job.status == "pending"
+        assert job.recipe.processing_status == "pending"
+
+        claimed = queue.claim()
+        assert claimed.job_id == job.job_id
+        assert claimed.status == "processing"
+        assert claimed.attempts == 1
+        assert queue.claim() is None
+
+        queue.complete(job.job_id, Recipe(youtube_url=YOUTUBE_URL, title="김치찌개", processing_status="completed"))
+        completed = queue.get(job.job_id)
+        assert completed.status == "completed"
+        assert completed.recipe.title == "김치찌개"
+        assert queue.stats()["completed"] == 1
+
+    def test_interrupted_jobs_survive_restart(self, tmp_path):
+        """처리 중에 종료된 작업이 재시작 후 다시 대기 상태가 되는지 테스트"""
+        path = str(tmp_path / "jobs.sqlite3")
+        queue = JobQueue(path)
+        job = queue.submit(YOUTUBE_URL)
+        queue.claim()
+
+        restarted = JobQueue(path)
+        assert restarted.requeue_interrupted() == 1
+        assert restarted.get(job.job_id).status == "pending"
+        assert restarted.claim().attempts == 2
+
+
+class TestJobWorkers:
+    def test_workers_process_and_record_failures(self, tmp_path):
+        """워커가 작업을 처리하고 실패한 작업의 오류를 저장하는지 테스트"""
+        queue = JobQueue(str(tmp_path / "jobs.sqlite3"))
+
+        async def handler(job):
+            if job.pipeline_mode == "single_shot":
+                raise ValueError("자막을 찾을 수 없습니다")
+            return Recipe(youtube_url=job.youtube_url, processing_status="completed"), False
+
+        async def run():
+            workers = JobWorkers(queue, handler, workers=2, poll_interval=0.05)
+            workers.start()
+            ok = queue.submit(YOUTUBE_URL)
+            failed = queue.submit(YOUTUBE_URL, "single_shot")
+            workers.notify()
+            await asyncio.sleep(0.3)
+            await workers.stop()
+            return queue.get(ok.job_id), queue.get(failed.job_id)
+
+        ok, failed = asyncio.run(run())
+
+        assert ok.status == "completed"
+        assert ok.recipe.processing_status == "completed"
+        assert failed.status == "failed"
+        assert failed.error == "자막을 찾을 수 없습니다"
+        assert failed.recipe.processing_status == "failed"
+
+    def test_workers_survive_queue_errors(self, tmp_path):
+        """작업 큐 조회가 실패해도 워커가 멈추지 않고 다시 시도하는지 테스트"""
+        queue = JobQueue(str(tmp_path / "jobs.sqlite3"))
+        claim = queue.claim
+        errors = [sqlite3.OperationalError("database is locked")] * 2
+
+        def flaky_claim():
+            if errors:
+                raise errors.pop()
+            return claim()
+
+        queue.claim = flaky_claim
+
+        async def handler(job):
+            return Recipe(youtube_url=job.youtube_url, processing_status="completed"), False
+
+        async def run():
+            workers = JobWorkers(queue, handler, workers=1, poll_interval=0.01)
+            job = queue.submit(YOUTUBE_URL)
+            workers.start()
+            await asyncio.sleep(0.3)
+            await workers.stop()
+            return queue.get(job.job_id)
+
+        assert asyncio.run(run()).status == "completed"
+        assert errors == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
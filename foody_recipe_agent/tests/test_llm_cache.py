@@ -0,0 +1,76 @@
+import os
+
+import pytest
+from src.utils.llm_cache import (
+    DiskLLMCache, InMemoryLLMCache, LLMCacheBackend, create_llm_cache, make_stage_cache_key
+)
+
+
+class TestLLMCache:
+    def test_cache_key_depends_on_stage_model_and_prompt(self):
+        """단계/모델/프롬프트가 다르면 키도 달라지는지 테스트"""
+        key = make_stage_cache_key("extraction", "gpt-4o-mini", "자막: 김치 200g")
+
+        assert key == make_stage_cache_key("extraction", "gpt-4o-mini", "자막: 김치 200g")
+        assert key != make_stage_cache_key("normalization", "gpt-4o-mini", "자막: 김치 200g")
+        assert key != make_stage_cache_key("extraction", "gpt-4o", "자막: 김치 200g")
+        assert key != make_stage_cache_key("extraction", "gpt-4o-mini", "자막: 김치 300g")
+
+    def test_in_memory_lru_eviction(self):
+        """메모리 캐시가 가장 오래 사용되지 않은 항목을 제거하는지 테스트"""
+        cache = InMemoryLLMCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.stats()["entries"] == 2
+        assert cache.stats()["hits"] == 2
+        assert cache.stats()["misses"] == 1
+
+    def test_disk_cache_persists(self, tmp_path):
+        """디스크 캐시가 인스턴스 간에 유지되는지 테스트"""
+        key = make_stage_cache_key("extraction", "gpt-4o-mini", "자막")
+        DiskLLMCache(str(tmp_path)).set(key, '{"ingredients": ["김치"]}')
+
+        cache = DiskLLMCache(str(tmp_path))
+        assert cache.get(key) == '{"ingredients": ["김치"]}'
+        assert cache.stats()["entries"] == 1
+
+    def test_disk_cache_evicts_least_recently_used(self, tmp_path):
+        """디스크 캐시가 max_entries를 넘으면 가장 오래 사용되지 않은 파일부터 지우는지 테스트"""
+        cache = DiskLLMCache(str(tmp_path), max_entries=10)
+        for index in range(10):
+            cache.set(f"{index:02d}key", str(index))
+            os.utime(cache._path(f"{index:02d}key"), (index, index))
+        cache.get("00key")
+        cache.set("10key", "10")
+
+        assert cache.stats()["entries"] == 9
+        assert cache.get("00key") == "0"
+        assert cache.get("01key") is None and cache.get("02key") is None
+        assert DiskLLMCache(str(tmp_path)).stats()["entries"] == 9
+
+    def test_incomplete_backend_cannot_be_created(self):
+        """get/set/stats를 모두 구현하지 않은 백엔드는 생성할 때 바로 실패하는지 테스트"""
+        class GetOnlyCache(LLMCacheBackend):
+            def get(self, key):
+                return None
+
+        with pytest.raises(TypeError):
+            GetOnlyCache()
+
+    def test_create_llm_cache(self, tmp_path):
+        """설정 값에 따른 백엔드 생성 테스트"""
+        assert isinstance(create_llm_cache("memory"), InMemoryLLMCache)
+        assert isinstance(create_llm_cache("disk", directory=str(tmp_path)), DiskLLMCache)
+        assert create_llm_cache("disk", max_entries=5, directory=str(tmp_path)).max_entries == 5
+        assert create_llm_cache("none") is None
+        with pytest.raises(ValueError):
+            create_llm_cache("redis")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,96 @@
+import asyncio
+
+import httpx
+import openai
+import pytest
+from unittest.mock import AsyncMock, Mock
+from langchain.schema import AIMessage, HumanMessage
+from src.clients.llm_gateway import LLMGateway, _Ticket
+
+
+def rate_limit_error(retry_after="0"):
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(429, request=request, headers={"retry-after": retry_after})
+    return openai.RateLimitError("Rate limit reached", response=response, body=None)
+
+
+class TestLLMGateway:
+    def test_retries_rate_limit_errors(self):
+        """429 오류를 재시도한 뒤 응답을 반환하는지 테스트"""
+        gateway = LLMGateway(max_retries=2, backoff_base=0)
+        llm = Mock()
+        llm.invoke.side_effect = [rate_limit_error(), AIMessage(content="ok")]
+
+        response = gateway.invoke(llm, [HumanMessage(content="재료를 추출해주세요")])
+
+        assert response.content == "ok"
+        assert llm.invoke.call_count == 2
+        stats = gateway.stats()
+        assert stats["retries"] == 1
+        assert stats["rate_limited"] == 1
+        assert stats["active"] == 0
+
+    def test_non_retryable_error_is_raised(self):
+        """재시도 대상이 아닌 오류는 바로 전달되는지 테스트"""
+        gateway = LLMGateway(max_retries=3, backoff_base=0)
+        llm = Mock()
+        llm.invoke.side_effect = ValueError("잘못된 응답")
+
+        with pytest.raises(ValueError):
+            gateway.invoke(llm, [HumanMessage(content="재료")])
+        assert llm.invoke.call_count == 1
+        assert gateway.stats()["failures"] == 1
+
+    def test_backoff_frees_slot_for_other_calls(self):
+        """재시도 대기 중에는 자리를 비워 다른 호출이 먼저 실행되는지 테스트"""
+        gateway = LLMGateway(max_concurrency=1, max_retries=1, backoff_base=0)
+        throttled = Mock(ainvoke=AsyncMock(side_effect=[rate_limit_error(retry_after="0.2"), AIMessage(content="늦은 응답")]))
+        other = Mock(ainvoke=AsyncMock(return_value=AIMessage(content="빠른 응답")))
+
+        async def run():
+            slow = asyncio.create_task(gateway.ainvoke(throttled, [HumanMessage(content="재료")]))
+            await asyncio.sleep(0.05)
+            assert gateway.stats()["active"] == 0
+            fast = await asyncio.wait_for(gateway.ainvoke(other, [HumanMessage(content="재료")]), timeout=0.1)
+            return fast, await slow
+
+        fast, slow = asyncio.run(run())
+
+        assert (fast.content, slow.content) == ("빠른 응답", "늦은 응답")
+        assert gateway.stats()["retries"] == 1
+
+    def test_failed_attempts_return_token_reservation(self, caplog):
+        """실패한 시도의 토큰 예약을 돌려받고, 재시도는 로그로 남기는지 테스트"""
+        gateway = LLMGateway(tokens_per_minute=10000, max_retries=1, backoff_base=0, expected_output_tokens=100)
+        llm = Mock()
+        llm.invoke.side_effect = [rate_limit_error(), ValueError("잘못된 응답")]
+
+        with pytest.raises(ValueError):
+            gateway.invoke(llm, [HumanMessage(content="재료")])
+
+        assert gateway.stats()["available_tokens"] == 10000
+        assert "Retrying LLM call (1/1)" in caplog.text
+
+    def test_waiting_calls_alternate_between_requests(self):
+        """대기 중인 호출이 영상별로 번갈아 실행되는지 테스트"""
+        gateway = LLMGateway(max_concurrency=1)
+        order = []
+        gateway._enqueue(_Ticket("running", lambda: order.append("running")))
+        for key in ["long", "long", "long", "short"]:
+            gateway._enqueue(_Ticket(key, lambda key=key: order.append(key)))
+
+        for _ in range(4):
+            gateway._release()
+
+        assert order == ["running", "long", "short", "long", "long"]
+
+    def test_token_budget_delays_calls_over_limit(self):
+        """분당 토큰 한도를 넘으면 대기 시간이 생기는지 테스트"""
+        gateway = LLMGateway(tokens_per_minute=1000, expected_output_tokens=0)
+
+        assert gateway._reserve(600) == 0
+        assert gateway._reserve(600) > 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
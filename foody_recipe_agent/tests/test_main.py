@@ -0,0 +1,168 @@
+import asyncio
+import importlib
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from benchmarks.fake_llm import FakeChatModel
+from benchmarks.harness import build_agent, fixture_url, load_fixtures
+
+
+@pytest.fixture(scope="module")
+def main(tmp_path_factory):
+    """로컬 캐시를 임시 디렉토리에 두고 API 서버 모듈을 불러옵니다."""
+    with pytest.MonkeyPatch.context() as patch_env:
+        patch_env.setenv("CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+        patch_env.setenv("OPENAI_API_KEY", "test-key")
+        yield importlib.import_module("src.main")
+
+
+@pytest.fixture
+def client(main):
+    # 시작 이벤트(작업 워커, 보관함 전송)는 실행하지 않음
+    return TestClient(main.app)
+
+
+@pytest.fixture
+def offline_agent(main, monkeypatch):
+    """YouTube와 LLM 대신 벤치마크 픽스처로 동작하는 에이전트를 사용합니다."""
+    monkeypatch.setattr(main, "agent", build_agent(load_fixtures(), FakeChatModel(), pipeline_mode="multi_pass"))
+
+
+# multi_pass 파이프라인의 단계별 선행 단계
+STAGE_DEPENDENCIES = {
+    "metadata": [],
+    "segments": [],
+    "transcript": ["segments"],
+    "filtered_transcript": ["segments"],
+    "raw_ingredients": ["filtered_transcript"],
+    "normalized": ["raw_ingredients"],
+    "final_ingredients": ["normalized"],
+    "cuisine": ["transcript", "metadata", "normalized"],
+    "verified_cuisine": ["cuisine", "transcript", "normalized"],
+}
+
+
+def video_url(video_id):
+    return f"https://www.youtube.com/watch?v={video_id}"
+
+
+def read_events(client, youtube_url):
+    """스트리밍 응답을 끝까지 읽어 (이벤트 이름, 데이터) 목록으로 돌려줍니다."""
+    with client.stream("POST", "/extract-ingredients/stream", json={"youtube_url": youtube_url}) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        body = "".join(response.iter_text())
+
+    events = []
+    for message in body.strip().split("\n\n"):
+        event, data = message.split("\n", 1)
+        events.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
+
+
+class TestBatchExtraction:
+    def test_duplicate_videos_are_extracted_once_in_request_order(self, main, client, monkeypatch):
+        """같은 영상은 한 번만 추출하고, 동시 실행 수를 제한하며, 결과를 요청 순서대로 돌려주는지 테스트"""
+        calls = []
+        running = {"now": 0, "max": 0}
+
+        async def fake_extract(youtube_url, pipeline_mode=None, force_refresh=False, on_stage_complete=None):
+            calls.append(youtube_url)
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+            await asyncio.sleep(0.01)
+            running["now"] -= 1
+            return main.Recipe(youtube_url=youtube_url, title=youtube_url[-11:], processing_status="completed"), False, None
+
+        monkeypatch.setattr(main, "extract_recipe", fake_extract)
+        monkeypatch.setattr(main, "BATCH_MAX_CONCURRENCY", 2)
+        urls = [
+            video_url("aaaaaaaaaaa"),
+            video_url("bbbbbbbbbbb"),
+            "https://youtu.be/aaaaaaaaaaa",
+            video_url("ccccccccccc"),
+            video_url("ddddddddddd"),
+            video_url("bbbbbbbbbbb"),
+        ]
+
+        response = client.post("/extract-ingredients/batch", json={"youtube_urls": urls})
+        body = response.json()
+
+        assert response.status_code == 200
+        assert (body["total"], body["unique"], body["succeeded"], body["failed"]) == (6, 4, 6, 0)
+        assert sorted(url[-11:] for url in calls) == ["aaaaaaaaaaa", "bbbbbbbbbbb", "ccccccccccc", "ddddddddddd"]
+        assert running["max"] == 2
+        assert [item["youtube_url"] for item in body["results"]] == urls
+        assert [item["recipe"]["title"] for item in body["results"]] == [
+            "aaaaaaaaaaa", "bbbbbbbbbbb", "aaaaaaaaaaa", "ccccccccccc", "ddddddddddd", "bbbbbbbbbbb"
+        ]
+
+    def test_failed_item_does_not_fail_the_batch(self, main, client, monkeypatch):
+        """한 영상의 추출이 실패해도 해당 항목만 error로 보고하고 나머지는 성공하는지 테스트"""
+        async def fake_extract(youtube_url, pipeline_mode=None, force_refresh=False, on_stage_complete=None):
+            if "bbbbbbbbbbb" in youtube_url:
+                raise Exception("이 영상에는 자막이 없습니다.")
+            return main.Recipe(youtube_url=youtube_url, processing_status="completed"), False, None
+
+        monkeypatch.setattr(main, "extract_recipe", fake_extract)
+        urls = [video_url("aaaaaaaaaaa"), video_url("bbbbbbbbbbb"), "https://example.com/video", video_url("ccccccccccc")]
+
+        response = client.post("/extract-ingredients/batch", json={"youtube_urls": urls})
+        body = response.json()
+
+        assert response.status_code == 200
+        assert (body["succeeded"], body["failed"]) == (2, 2)
+        assert [item["success"] for item in body["results"]] == [True, False, False, True]
+        assert body["results"][1]["error"] == "이 영상에는 자막이 없습니다."
+        assert body["results"][1]["video_id"] == "bbbbbbbbbbb"
+        assert body["results"][2]["error"] == "유효한 YouTube URL을 입력해주세요."
+
+
+class TestExtractionStream:
+    def test_stage_events_arrive_in_pipeline_order(self, client, offline_agent):
+        """queued 이후 각 단계 이벤트가 선행 단계 뒤에 오고 마지막에 completed 이벤트가 오는지 테스트"""
+        video = load_fixtures()[0]
+        events = read_events(client, fixture_url(video))
+        names = [event for event, _ in events]
+        stages = [data["stage"] for event, data in events if event == "stage"]
+
+        assert names[0] == "queued"
+        assert names[-1] == "completed"
+        assert names[1:-1] == ["stage"] * len(stages)
+        assert sorted(stages) == sorted(STAGE_DEPENDENCIES)
+        # 서로 의존하지 않는 단계는 먼저 끝나는 순서대로 전송됨
+        for stage, dependencies in STAGE_DEPENDENCIES.items():
+            assert all(stages.index(dependency) < stages.index(stage) for dependency in dependencies), stage
+
+        completed = events[-1][1]
+        assert completed["success"] is True
+        assert completed["recipe"]["metadata"]["video_id"] == video["video_id"]
+        assert completed["recipe"]["ingredients"]
+
+    def test_extraction_error_closes_stream_with_error_event(self, client, offline_agent):
+        """추출 중 오류가 나면 error 이벤트를 보내고 스트림을 닫는지 테스트"""
+        events = read_events(client, video_url("zzzzzzzzzzz"))
+
+        assert [event for event, _ in events] == ["queued", "error"]
+        assert "픽스처에 없는 영상입니다" in events[-1][1]["error"]
+
+
+class TestMetrics:
+    def test_cuisine_verification_counts_are_exported(self, main, client, offline_agent):
+        """장르 2차 검증 통계(생략, 유지, 변경 횟수)가 /metrics에 노출되는지 테스트"""
+        for video in load_fixtures()[:2]:
+            response = client.post("/extract-ingredients", json={"youtube_url": fixture_url(video), "force_refresh": True})
+            assert response.json()["success"] is True
+
+        metrics = client.get("/metrics").text
+        stats = main.agent.verification_stats()
+
+        assert "# TYPE foody_cuisine_verifications_total counter" in metrics
+        for outcome in ("skipped", "unchanged", "changed"):
+            assert f'foody_cuisine_verifications_total{{outcome="{outcome}"}} {stats[outcome]}' in metrics
+        assert stats["skipped"] + stats["verified"] == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
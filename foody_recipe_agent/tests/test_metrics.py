@@ -0,0 +1,65 @@
+import pytest
+from src.utils.metrics import MetricsRegistry, build_extraction_timings
+from src.utils.pipeline import PipelineReport, StageTiming
+
+
+class TestMetrics:
+    def test_counter_and_histogram_render_prometheus_text(self):
+        """카운터와 히스토그램이 Prometheus 텍스트 형식으로 출력되는지 테스트"""
+        registry = MetricsRegistry()
+        calls = registry.counter("foody_test_calls_total", "호출 수", ("stage",))
+        duration = registry.histogram("foody_test_duration_seconds", "소요 시간", ("stage",), buckets=(0.5, 1.0))
+
+        calls.inc(stage="extract")
+        calls.inc(2, stage="extract")
+        duration.observe(0.5, stage="extract")
+        duration.observe(3.0, stage="extract")
+
+        text = registry.render()
+        assert "# TYPE foody_test_calls_total counter" in text
+        assert 'foody_test_calls_total{stage="extract"} 3' in text
+        assert 'foody_test_duration_seconds_bucket{stage="extract",le="0.5"} 1' in text
+        assert 'foody_test_duration_seconds_bucket{stage="extract",le="1"} 1' in text
+        assert 'foody_test_duration_seconds_bucket{stage="extract",le="+Inf"} 2' in text
+        assert 'foody_test_duration_seconds_sum{stage="extract"} 3.5' in text
+
+    def test_callback_metric_reads_values_at_render_time(self):
+        """콜백 지표가 출력 시점의 값을 읽는지 테스트"""
+        registry = MetricsRegistry()
+        stats = {"hits": 1}
+        registry.register_callback(
+            "foody_test_cache_lookups_total", "캐시 조회", ("result",),
+            lambda: [({"result": "hit"}, stats["hits"])], kind="counter"
+        )
+
+        stats["hits"] = 5
+        text = registry.render()
+
+        assert "# TYPE foody_test_cache_lookups_total counter" in text
+        assert 'foody_test_cache_lookups_total{result="hit"} 5' in text
+
+    def test_build_extraction_timings_sums_stage_usage(self):
+        """응답용 시간 정보가 단계별 토큰 사용량을 합산하는지 테스트"""
+        report = PipelineReport(
+            total_duration=2.0,
+            critical_path=["transcript", "raw_ingredients"],
+            stages=[
+                StageTiming(name="transcript", started_at=0.0, finished_at=0.5, duration=0.5),
+                StageTiming(name="raw_ingredients", depends_on=["transcript"], started_at=0.5, finished_at=2.0,
+                            duration=1.5, llm_calls=2, prompt_tokens=900, completion_tokens=80),
+                StageTiming(name="normalized", started_at=0.5, finished_at=0.6, duration=0.1, llm_cache_hits=1),
+            ]
+        )
+
+        timings = build_extraction_timings(report, "자막" * 10)
+
+        assert timings.transcript_chars == 20
+        assert timings.llm_calls == 2
+        assert timings.prompt_tokens == 900
+        assert timings.completion_tokens == 80
+        assert timings.llm_cache_hits == 1
+        assert [stage.name for stage in timings.stages] == ["transcript", "raw_ingredients", "normalized"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,132 @@
+import asyncio
+import time
+
+import pytest
+from src.utils.pipeline import PipelineExecutor, PipelineStage, PipelineStageError, current_stage_usage
+
+
+def sleep_stage(seconds, value):
+    def stage(inputs):
+        time.sleep(seconds)
+        return value
+    return stage
+
+
+def async_sleep_stage(seconds, value):
+    async def stage(inputs):
+        await asyncio.sleep(seconds)
+        return value
+    return stage
+
+
+class TestPipelineExecutor:
+    def test_independent_stages_run_concurrently(self):
+        """독립적인 단계가 동시에 실행되는지 테스트"""
+        executor = PipelineExecutor([
+            PipelineStage("metadata", sleep_stage(0.1, "meta")),
+            PipelineStage("transcript", sleep_stage(0.1, "text")),
+            PipelineStage("combined", lambda inputs: inputs["metadata"] + inputs["transcript"], ["metadata", "transcript"]),
+        ])
+
+        results, report = executor.run()
+
+        assert results["combined"] == "metatext"
+        assert report.total_duration < 0.19
+        assert len(report.stages) == 3
+
+    def test_critical_path_follows_slowest_dependency(self):
+        """크리티컬 패스가 가장 늦게 끝난 의존 단계를 따라가는지 테스트"""
+        executor = PipelineExecutor([
+            PipelineStage("fast", sleep_stage(0.01, 1)),
+            PipelineStage("slow", sleep_stage(0.05, 2)),
+            PipelineStage("final", lambda inputs: inputs["fast"] + inputs["slow"], ["fast", "slow"]),
+        ])
+
+        _, report = executor.run()
+
+        assert report.critical_path == ["slow", "final"]
+
+    def test_stage_error_keeps_original_message(self):
+        """단계 실패 시 원본 메시지와 단계 이름을 유지하는지 테스트"""
+        def fail(inputs):
+            raise Exception("자막을 가져올 수 없습니다")
+
+        executor = PipelineExecutor([
+            PipelineStage("transcript", fail),
+            PipelineStage("extract", lambda inputs: inputs["transcript"], ["transcript"]),
+        ])
+
+        with pytest.raises(PipelineStageError) as exc_info:
+            executor.run()
+
+        assert exc_info.value.stage == "transcript"
+        assert "자막을 가져올 수 없습니다" in str(exc_info.value)
+
+    def test_stage_callback_receives_each_result(self):
+        """각 단계가 끝날 때마다 콜백이 결과와 함께 호출되는지 테스트 (콜백 오류는 무시)"""
+        events = []
+
+        def on_stage_complete(name, value, timing):
+            events.append((name, value, timing.name))
+            raise RuntimeError("callback failure")
+
+        executor = PipelineExecutor([
+            PipelineStage("first", sleep_stage(0.01, 1)),
+            PipelineStage("second", lambda inputs: inputs["first"] + 1, ["first"]),
+        ])
+
+        results, _ = executor.run(on_stage_complete=on_stage_complete)
+
+        assert results["second"] == 2
+        assert events == [("first", 1, "first"), ("second", 2, "second")]
+
+    def test_stage_usage_is_recorded_per_stage(self):
+        """단계 안에서 기록한 LLM 사용량이 해당 단계의 시간 정보에만 반영되는지 테스트"""
+        def llm_stage(prompt_tokens):
+            async def stage(inputs):
+                current_stage_usage.get().add_llm_call(prompt_tokens, 10)
+                await asyncio.sleep(0.01)
+                return prompt_tokens
+            return stage
+
+        executor = PipelineExecutor([
+            PipelineStage("extract", llm_stage(100)),
+            PipelineStage("classify", llm_stage(30)),
+        ])
+
+        _, report = asyncio.run(executor.arun())
+        timings = {stage.name: stage for stage in report.stages}
+
+        assert timings["extract"].prompt_tokens == 100
+        assert timings["classify"].prompt_tokens == 30
+        assert timings["classify"].llm_calls == 1
+        assert current_stage_usage.get() is None
+
+    def test_cycle_is_rejected(self):
+        """순환 의존 검출 테스트"""
+        with pytest.raises(ValueError):
+            PipelineExecutor([
+                PipelineStage("a", lambda inputs: None, ["b"]),
+                PipelineStage("b", lambda inputs: None, ["a"]),
+            ])
+
+    def test_arun_runs_independent_stages_concurrently(self):
+        """비동기 실행에서 독립 단계 동시 실행 테스트"""
+        async def combine(inputs):
+            return inputs["metadata"] + inputs["transcript"]
+
+        executor = PipelineExecutor([
+            PipelineStage("metadata", async_sleep_stage(0.1, "meta")),
+            PipelineStage("transcript", async_sleep_stage(0.1, "text")),
+            PipelineStage("combined", combine, ["metadata", "transcript"]),
+        ])
+
+        results, report = asyncio.run(executor.arun())
+
+        assert results["combined"] == "metatext"
+        assert report.total_duration < 0.19
+        assert report.critical_path[-1] == "combined"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
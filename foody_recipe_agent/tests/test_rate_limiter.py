@@ -0,0 +1,69 @@
+import pytest
+from unittest.mock import patch
+from src.utils.rate_limiter import CircuitOpenError, RateLimiter, backoff_delay
+from src.utils.youtube_transcript import YouTubeTranscriptExtractor
+
+
+class TestRateLimiter:
+    def test_token_bucket_waits_when_empty(self):
+        """토큰을 모두 쓰면 채워질 때까지 기다리는지 테스트"""
+        limiter = RateLimiter(rate=50, burst=2)
+
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == 0
+        assert limiter.acquire() > 0
+        assert limiter.stats()["acquired"] == 3
+
+    def test_block_opens_circuit_shared_across_instances(self, tmp_path):
+        """차단 신호가 SQLite를 공유하는 다른 인스턴스의 요청도 막는지 테스트"""
+        path = str(tmp_path / "limit.sqlite3")
+        worker_a = RateLimiter(rate=1, burst=1, path=path, cooldown_seconds=60)
+        worker_b = RateLimiter(rate=1, burst=1, path=path, cooldown_seconds=60)
+
+        worker_a.record_failure(blocked=True)
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            worker_b.acquire()
+        assert exc_info.value.retry_after > 0
+        stats = worker_b.stats()
+        assert stats["circuit"] == "open"
+        assert stats["rate"] == 0.5
+        assert stats["next_cooldown"] == 120
+
+    def test_backoff_delay_is_bounded(self):
+        """지수 백오프 대기 시간이 상한을 넘지 않는지 테스트"""
+        delays = [backoff_delay(attempt, base=1.0, max_delay=5.0) for attempt in range(10)]
+        assert all(0 <= delay <= 5.0 for delay in delays)
+        assert all(backoff_delay(0, base=1.0) <= 1.0 for _ in range(20))
+
+    def test_ip_block_trips_circuit_for_transcript_fetch(self):
+        """IP 차단 오류 후에는 YouTube에 요청하지 않고 바로 실패하는지 테스트"""
+        limiter = RateLimiter(rate=10, burst=5, cooldown_seconds=60)
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+        YouTubeTranscriptExtractor.configure_listing_cache(ttl_seconds=0)
+        YouTubeTranscriptExtractor.configure_rate_limiter(limiter, max_retries=3)
+        try:
+            with patch.object(YouTubeTranscriptExtractor, 'cache', None), \
+                 patch('src.utils.youtube_transcript.TranscriptListFetcher') as mock_fetcher, \
+                 patch('src.utils.youtube_transcript.YouTubeTranscriptApi') as mock_api:
+                error = Exception("YouTube is blocking requests from your IP")
+                mock_fetcher.return_value.fetch.side_effect = error
+                mock_api.return_value.list.side_effect = error
+
+                with pytest.raises(Exception) as exc_info:
+                    YouTubeTranscriptExtractor.get_transcript_segments(url)
+                assert "IP를 차단" in str(exc_info.value)
+
+                with pytest.raises(CircuitOpenError):
+                    YouTubeTranscriptExtractor.get_transcript_segments(url)
+
+                calls = mock_fetcher.return_value.fetch.call_count + mock_api.return_value.list.call_count
+                assert calls == 1
+        finally:
+            YouTubeTranscriptExtractor.configure_rate_limiter(None)
+            YouTubeTranscriptExtractor.configure_listing_cache()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,71 @@
+import pytest
+from unittest.mock import patch
+from src.utils.transcript_cache import TranscriptCache
+from src.utils.youtube_transcript import YouTubeTranscriptExtractor
+
+
+SEGMENTS = [
+    {'text': '안녕하세요', 'start': 0.0, 'duration': 2.0},
+    {'text': '김치 200g 넣어주세요', 'start': 2.0, 'duration': 2.0},
+]
+
+
+class TestTranscriptCache:
+    def test_set_and_get(self, tmp_path):
+        """저장한 세그먼트를 그대로 돌려주는지 테스트"""
+        cache = TranscriptCache(str(tmp_path / "transcripts.sqlite3"))
+        cache.set("dQw4w9WgXcQ", "ko", SEGMENTS)
+
+        assert cache.get("dQw4w9WgXcQ", "ko") == SEGMENTS
+        assert cache.get("dQw4w9WgXcQ", "en") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        """다른 인스턴스(재시작)에서도 캐시가 유지되는지 테스트"""
+        path = str(tmp_path / "transcripts.sqlite3")
+        TranscriptCache(path).set("dQw4w9WgXcQ", "ko", SEGMENTS)
+
+        assert TranscriptCache(path).get("dQw4w9WgXcQ", "ko") == SEGMENTS
+
+    def test_expired_entry_is_miss(self, tmp_path):
+        """TTL이 지난 항목은 만료 처리되는지 테스트"""
+        cache = TranscriptCache(str(tmp_path / "transcripts.sqlite3"), ttl_seconds=60)
+        with patch("src.utils.transcript_cache.time.time", return_value=1000.0):
+            cache.set("dQw4w9WgXcQ", "ko", SEGMENTS)
+        with patch("src.utils.transcript_cache.time.time", return_value=1061.0):
+            assert cache.get("dQw4w9WgXcQ", "ko") is None
+
+        assert cache.stats()["expirations"] == 1
+        assert cache.stats()["entries"] == 0
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목을 제거하는지 테스트"""
+        cache = TranscriptCache(str(tmp_path / "transcripts.sqlite3"), ttl_seconds=0, max_entries=2)
+        with patch("src.utils.transcript_cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.set("aaaaaaaaaaa", "ko", SEGMENTS)
+            cache.set("bbbbbbbbbbb", "ko", SEGMENTS)
+            cache.get("aaaaaaaaaaa", "ko")
+            cache.set("ccccccccccc", "ko", SEGMENTS)
+
+        assert cache.get("bbbbbbbbbbb", "ko") is None
+        assert cache.get("aaaaaaaaaaa", "ko") == SEGMENTS
+        assert cache.stats()["evictions"] == 1
+
+    def test_extractor_uses_cache_without_network(self, tmp_path):
+        """캐시 적중 시 YouTube를 호출하지 않는지 테스트"""
+        cache = TranscriptCache(str(tmp_path / "transcripts.sqlite3"))
+        cache.set("dQw4w9WgXcQ", "ko", SEGMENTS)
+        YouTubeTranscriptExtractor.configure_cache(cache)
+        try:
+            with patch.object(YouTubeTranscriptExtractor, "_fetch_segments") as mock_fetch:
+                result = YouTubeTranscriptExtractor.get_transcript("https://youtu.be/dQw4w9WgXcQ")
+        finally:
+            YouTubeTranscriptExtractor.configure_cache(None)
+
+        mock_fetch.assert_not_called()
+        assert result == "안녕하세요 김치 200g 넣어주세요"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,52 @@
+import pytest
+from src.utils.transcript_chunker import (
+    estimate_tokens, merge_ingredients, sample_transcript, select_chunks, split_transcript
+)
+
+
+LONG_TRANSCRIPT = " ".join(f"단어{i}" for i in range(1000))
+
+
+class TestTranscriptChunker:
+    def test_split_respects_token_limit_and_overlap(self):
+        """구간이 토큰 제한을 넘지 않고 앞 구간과 겹치는지 테스트"""
+        chunks = split_transcript(LONG_TRANSCRIPT, max_tokens=100, overlap_tokens=10)
+
+        assert len(chunks) > 1
+        assert all(estimate_tokens(chunk) <= 100 for chunk in chunks)
+        assert chunks[0].split()[-1] in chunks[1].split()
+        assert chunks[-1].split()[-1] == "단어999"
+
+    def test_short_transcript_is_single_chunk(self):
+        """짧은 자막은 나누지 않는지 테스트"""
+        assert split_transcript("김치 넣고 끓여요", max_tokens=100) == ["김치 넣고 끓여요"]
+        assert split_transcript("", max_tokens=100) == []
+
+    def test_select_chunks_spreads_within_budget(self):
+        """토큰 예산을 넘으면 처음부터 끝까지 고르게 구간을 선택하는지 테스트"""
+        chunks = split_transcript(LONG_TRANSCRIPT, max_tokens=100)
+        selected = select_chunks(chunks, token_budget=300)
+
+        assert sum(estimate_tokens(chunk) for chunk in selected) <= 300
+        assert selected[0] == chunks[0]
+        assert selected[-1] == chunks[-1]
+        assert select_chunks(chunks, token_budget=0) == chunks
+
+    def test_sample_transcript_covers_whole_text(self):
+        """긴 자막을 앞부분만 자르지 않고 처음/중간/끝에서 발췌하는지 테스트"""
+        transcript = "가" * 100 + "나" * 100 + "다" * 100
+        sampled = sample_transcript(transcript, 30)
+
+        assert len(sampled) <= 30
+        assert "가" in sampled and "나" in sampled and "다" in sampled
+        assert sample_transcript("짧은 자막", 30) == "짧은 자막"
+
+    def test_merge_ingredients_dedupes_in_order(self):
+        """구간별 재료 목록을 순서대로 합치고 중복을 제거하는지 테스트"""
+        merged = merge_ingredients([["김치", "돼지고기"], ["돼지 고기", "두부", "김치"], []])
+
+        assert merged == ["김치", "돼지고기", "두부"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,62 @@
+import pytest
+from src.utils.transcript_filter import _mentions_ingredient, filter_segments
+
+
+def make_segments(texts):
+    return [{"text": text, "start": float(index), "duration": 1.0} for index, text in enumerate(texts)]
+
+
+CHATTER = "오늘도 와주셔서 감사합니다 구독과 좋아요 부탁드려요"
+
+
+class TestTranscriptFilter:
+    def test_keeps_ingredient_segments_with_context(self):
+        """재료 언급 세그먼트와 그 앞뒤 세그먼트만 남기는지 테스트"""
+        texts = [CHATTER] * 20 + ["돼지고기 200g 준비해 주세요"] + [CHATTER] * 20 + ["마늘 세 쪽이랑 고춧가루"] + [CHATTER] * 20
+        result = filter_segments(make_segments(texts), context=1, min_chars=0)
+
+        assert result.applied
+        assert result.kept_segments == 6
+        assert "돼지고기 200g" in result.text
+        assert "마늘 세 쪽" in result.text
+        assert result.compression_ratio < 0.2
+
+    def test_short_transcript_is_not_filtered(self):
+        """짧은 자막은 필터링하지 않는지 테스트"""
+        segments = make_segments([CHATTER, "김치 한 포기"])
+        result = filter_segments(segments)
+
+        assert not result.applied
+        assert result.compression_ratio == 1.0
+        assert result.text == f"{CHATTER} 김치 한 포기"
+
+    def test_falls_back_when_nothing_matches(self):
+        """재료 언급을 찾지 못하면 전체 자막을 사용하는지 테스트"""
+        result = filter_segments(make_segments([CHATTER] * 50), min_chars=0)
+
+        assert not result.applied
+        assert result.kept_segments == 50
+
+    def test_disabled_filter_keeps_full_transcript(self):
+        """필터를 끄면 재료 언급이 있어도 전체 자막을 그대로 사용하는지 테스트"""
+        texts = [CHATTER] * 20 + ["돼지고기 200g 준비해 주세요"] + [CHATTER] * 20
+        result = filter_segments(make_segments(texts), min_chars=0, enabled=False)
+
+        assert not result.applied
+        assert result.kept_segments == result.total_segments == 41
+        assert result.text == " ".join(texts)
+
+    def test_ingredient_mentions(self):
+        """계량 표현과 재료명이 있는 문장은 재료 언급으로 판단하는지 테스트"""
+        for text in ["마늘 세 쪽이랑", "김치 한포기씩", "두 개를 넣고", "소금 2 tbsp", "add two eggs", "chop the Onions"]:
+            assert _mentions_ingredient(text), text
+
+    def test_similar_words_are_not_ingredient_mentions(self):
+        """영어 재료명이 들어간 다른 단어나 수사로 시작하는 일반 단어를 재료 언급으로 보지 않는지 테스트"""
+        for text in ["wrap it in foil", "bring to a boil", "clean the toilet", "grilled eggplant slices",
+                     "반대로 생각하면", "세대를 아우르는", "네모난 접시", "네 모두 감사합니다", "한 장면을 보여드릴게요"]:
+            assert not _mentions_ingredient(text), text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
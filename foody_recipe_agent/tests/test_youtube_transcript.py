@@ -104,6 +104,41 @@ class TestYouTubeTranscriptExtractor:
         result = YouTubeTranscriptExtractor.get_available_languages(url)
         
         assert result == ["ko", "en"]
+    
+    def test_transcript_and_languages_share_one_listing(self):
+        """자막 추출과 언어 목록 조회가 자막 목록을 한 번만 조회하는지 테스트"""
+        mock_transcript_en = Mock(language_code="en")
+        mock_transcript_en.fetch.return_value = [{'text': 'Hello', 'start': 0.0, 'duration': 2.0}]
+        mock_transcript_ja = Mock(language_code="ja")
+        
+        YouTubeTranscriptExtractor.configure_listing_cache(ttl_seconds=60)
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        with patch.object(YouTubeTranscriptExtractor, 'cache', None), \
+             patch.object(YouTubeTranscriptExtractor, '_list_transcripts',
+                          return_value=[mock_transcript_ja, mock_transcript_en]) as mock_list:
+            segments = YouTubeTranscriptExtractor.get_transcript_segments(url)
+            languages = YouTubeTranscriptExtractor.get_available_languages(url)
+        
+        assert segments == [{'text': 'Hello', 'start': 0.0, 'duration': 2.0}]
+        assert languages == ["ja", "en"]
+        assert mock_list.call_count == 1
+        mock_transcript_ja.fetch.assert_not_called()
+
+    def test_zero_max_retries_tries_once(self):
+        """max_retries=0을 지정하면 기본 시도 횟수 대신 재시도 없이 한 번만 시도하는지 테스트"""
+        YouTubeTranscriptExtractor.configure_listing_cache(ttl_seconds=0)
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        with patch.object(YouTubeTranscriptExtractor, 'cache', None), \
+             patch.object(YouTubeTranscriptExtractor, 'rate_limiter', None), \
+             patch.object(YouTubeTranscriptExtractor, 'default_max_retries', 3), \
+             patch.object(YouTubeTranscriptExtractor, '_list_transcripts',
+                          side_effect=Exception("connection reset")) as mock_list, \
+             patch('src.utils.youtube_transcript.time.sleep') as mock_sleep:
+            with pytest.raises(Exception, match="자막을 가져올 수 없습니다"):
+                YouTubeTranscriptExtractor.get_transcript_segments(url, max_retries=0)
+        
+        assert mock_list.call_count == 1
+        mock_sleep.assert_not_called()
 
 
 if __name__ == "__main__":